@@ -0,0 +1,57 @@
+"""Checkout pricing time for long baskets and for batches of short ones.
+
+    PYTHONPATH=lib python benchmarks/chk_checkout.py [--lengths 10000 100000 1000000] [--baskets 10000]
+
+Baskets are random strings over every SKU in the default price list, so
+each one exercises multi-buys, freebies and the group bundle. Pricing cost
+should grow with basket length only through the counting pass.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import string
+import time
+
+from solutions.CHK.checkout_solution import CheckoutSolution
+
+
+def median_seconds(function, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lengths", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--baskets", type=int, default=10_000)
+    parser.add_argument("--basket-length", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    solution = CheckoutSolution()
+
+    print(f"{'basket SKUs':>12}{'checkout (ms)':>16}{'SKUs/s':>16}")
+    for length in args.lengths:
+        skus = "".join(rng.choices(string.ascii_uppercase, k=length))
+        seconds = median_seconds(lambda: solution.checkout(skus), args.repeats)
+        print(f"{length:>12}{seconds * 1e3:>16.2f}{length / seconds:>16,.0f}")
+
+    baskets = ["".join(rng.choices(string.ascii_uppercase, k=args.basket_length)) for _ in range(args.baskets)]
+    seconds = median_seconds(lambda: solution.checkout_many(baskets), args.repeats)
+    print(
+        f"\ncheckout_many: {args.baskets} baskets of {args.basket_length} SKUs in {seconds * 1e3:.1f} ms "
+        f"({seconds / args.baskets * 1e6:.1f} us per basket)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Memory and lookup latency of the demo inventory at millions of SKUs.
+
+    PYTHONPATH=lib python benchmarks/dmo_inventory.py [--sizes 1000000 3000000] [--names 5000]
+
+Each measurement runs in a fresh interpreter so RSS growth is attributable
+to the inventory alone. ``dict`` is the per-object layout the store
+replaced (a SKU dict of plain ``__dict__`` dataclass records and
+quantities); ``store`` is ``InventoryStore``. Names are rebuilt per record,
+as they would be when decoded from requests, and drawn from ``--names``
+distinct values. Lookup time is the mean over ``--lookups`` random SKUs,
+both for ``get`` alone and for the dict the entry point returns.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+LIB_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lib")
+
+_PROBE = """
+import json, os, random, time
+from dataclasses import asdict, dataclass
+from solutions.DMO.inventory_item import InventoryItem
+from solutions.DMO.inventory_store import InventoryStore
+
+@dataclass
+class PlainItem:
+    sku: str
+    name: str
+    price: int
+
+def rss_bytes():
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+size, names, lookups, layout = {size}, {names}, {lookups}, {layout!r}
+skus = [f"SKU-{{n:08d}}" for n in range(size)]
+rng = random.Random(1)
+probe_skus = [rng.choice(skus) for _ in range(lookups)]
+
+before = rss_bytes()
+if layout == "store":
+    inventory = InventoryStore()
+    for n, sku in enumerate(skus):
+        inventory.add(InventoryItem(sku, f"product {{n % names}}", n % 997), 1)
+    get = inventory.get
+    as_response = lambda item: item.as_dict()
+else:
+    inventory = {{}}
+    for n, sku in enumerate(skus):
+        inventory[sku] = (PlainItem(sku, f"product {{n % names}}", n % 997), 1)
+    get = lambda sku: inventory[sku][0]
+    as_response = asdict
+grown = rss_bytes() - before
+
+started = time.perf_counter()
+for sku in probe_skus:
+    get(sku)
+get_seconds = (time.perf_counter() - started) / lookups
+
+started = time.perf_counter()
+for sku in probe_skus:
+    as_response(get(sku))
+response_seconds = (time.perf_counter() - started) / lookups
+print(json.dumps({{"rss": grown, "get": get_seconds, "response": response_seconds}}))
+"""
+
+
+def measure(size: int, names: int, lookups: int, layout: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(size=size, names=names, lookups=lookups, layout=layout)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": LIB_DIR},
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000, 3_000_000])
+    parser.add_argument("--names", type=int, default=5_000)
+    parser.add_argument("--lookups", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{'SKUs':>10}{'layout':>8}{'RSS growth (MiB)':>18}{'bytes/SKU':>11}{'get (ns)':>10}{'get + response (ns)':>21}")
+    for size in args.sizes:
+        for layout in ("dict", "store"):
+            result = measure(size, args.names, args.lookups, layout)
+            print(
+                f"{size:>10}{layout:>8}{result['rss'] / 2**20:>18.1f}{result['rss'] / size:>11.0f}"
+                f"{result['get'] * 1e9:>10.0f}{result['response'] * 1e9:>21.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Wait times and simulator speed across worker counts for a mixed provider workload.
+
+    PYTHONPATH=lib python benchmarks/iwc_capacity_simulation.py [--hours 1000] [--workers 2 3 4 6]
+
+Simulates ``--hours`` of Poisson submissions per provider against the
+legacy queue for each worker count, printing utilisation, the deepest
+queue seen, p99 waits per provider and the wall time the run took. The
+last column is simulated hours per wall-clock second.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from solutions.IWC.capacity_simulator import CapacitySimulator, PoissonArrivals, exponential, fixed, lognormal
+
+PROVIDERS = ["bank_statements", "companies_house", "credit_check", "id_verification"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=1_000.0)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 3, 4, 6])
+    parser.add_argument("--rate", type=float, default=300.0, help="submissions per hour per provider")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    arrivals = [
+        PoissonArrivals("id_verification", rate_per_hour=args.rate, users=50_000),
+        PoissonArrivals("bank_statements", rate_per_hour=args.rate, users=50_000),
+        PoissonArrivals("credit_check", rate_per_hour=args.rate, users=50_000),
+    ]
+    service_times = {
+        "bank_statements": lognormal(mean=6.0, sigma=0.8),
+        "companies_house": fixed(2.0),
+        "credit_check": exponential(mean=3.0),
+        "id_verification": exponential(mean=2.0),
+    }
+
+    print(
+        f"{'workers':>8}{'utilisation':>13}{'max depth':>11}"
+        + "".join(f"{'p99 ' + provider[:10]:>17}" for provider in PROVIDERS)
+        + f"{'wall (s)':>10}{'sim h/s':>10}"
+    )
+    for workers in args.workers:
+        simulator = CapacitySimulator(arrivals, service_times, workers=workers, seed=args.seed)
+        started = time.perf_counter()
+        report = simulator.run(hours=args.hours)
+        wall = time.perf_counter() - started
+        max_depth = max((depth for _, depth in report.depth), default=0)
+        p99s = "".join(
+            f"{report.waits_by_provider[provider].p99 if provider in report.waits_by_provider else 0.0:>17.1f}"
+            for provider in PROVIDERS
+        )
+        print(f"{workers:>8}{report.utilisation:>13.1%}{max_depth:>11}{p99s}{wall:>10.1f}{args.hours / wall:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Healthy-provider dispatch rate during a provider outage, with and without circuit breakers.
+
+    PYTHONPATH=lib python benchmarks/iwc_circuit_breaker.py [--tasks 10000] [--workers 8]
+
+Runs in virtual time: ``--workers`` workers drain a mixed backlog in which
+``--down`` is unavailable, so every call to it fails after ``--timeout``
+seconds. Calls to the other providers take ``--service-time`` seconds.
+Failed tasks are dropped, and failed calls are counted while healthy work
+remains. Without breakers the workers keep burning timeouts on the down
+provider; with them its tasks are parked after a few failures and only
+half-open probes reach it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import random
+from datetime import datetime, timedelta
+
+from solutions.IWC.circuit_breaker import BreakerPolicy, ProviderCircuitBreakers
+from solutions.IWC.queue_solution_legacy import Queue, SchedulingMode
+from solutions.IWC.task_types import TaskSubmission
+
+PROVIDERS = ["bank_statements", "id_verification", "companies_house", "credit_check"]
+
+
+class VirtualClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def run(args: argparse.Namespace, with_breakers: bool) -> dict[str, float]:
+    clock = VirtualClock()
+    breakers = ProviderCircuitBreakers(
+        default_policy=BreakerPolicy(failure_threshold=5, reset_timeout=args.reset_timeout),
+        clock=clock,
+    ) if with_breakers else None
+    queue = Queue(scheduling=SchedulingMode.FAIR_SHARE, circuit_breakers=breakers)
+
+    rng = random.Random(args.seed)
+    start = datetime(2026, 1, 17, 19, 30)
+    for user_id in range(args.tasks):
+        queue.enqueue(TaskSubmission(
+            provider=rng.choice(PROVIDERS),
+            user_id=user_id,
+            timestamp=start + timedelta(milliseconds=user_id),
+        ))
+
+    events: list[tuple[float, int, object]] = [(0.0, worker, None) for worker in range(args.workers)]
+    healthy_done = 0
+    last_healthy = 0.0
+    down_dispatch_times: list[float] = []
+    while events:
+        clock.now, worker, task = heapq.heappop(events)
+        if task is not None:
+            success = task.provider != args.down
+            queue.record_completion(task, args.timeout if not success else args.service_time, success)
+            if success:
+                healthy_done += 1
+                last_healthy = clock.now
+
+        task = queue.dequeue()
+        if task is None:
+            if queue.parked_size:
+                # Only parked tasks are left; look again once a probe may be due.
+                heapq.heappush(events, (clock.now + 1.0, worker, None))
+            continue
+        if task.provider == args.down:
+            down_dispatch_times.append(clock.now)
+            heapq.heappush(events, (clock.now + args.timeout, worker, task))
+        else:
+            heapq.heappush(events, (clock.now + args.service_time, worker, task))
+        if clock.now > args.horizon:
+            break
+
+    # Probes that keep going after the healthy backlog is gone cost nothing
+    # anyone is waiting for; only count calls made while it was draining.
+    failed_calls = sum(1 for started in down_dispatch_times if started < last_healthy)
+    return {
+        "healthy_done": healthy_done,
+        "healthy_rate": healthy_done / last_healthy if last_healthy else 0.0,
+        "drain_time": last_healthy,
+        "failed_calls": failed_calls,
+        "worker_seconds_on_down": failed_calls * args.timeout,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--down", default="id_verification")
+    parser.add_argument("--timeout", type=float, default=5.0)
+    parser.add_argument("--service-time", type=float, default=0.2)
+    parser.add_argument("--reset-timeout", type=float, default=30.0)
+    parser.add_argument("--horizon", type=float, default=86_400.0)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    print(f"{'mode':<12}{'healthy done':>14}{'healthy/s':>12}{'drain (s)':>12}{'failed calls':>14}{'worker-s on down':>18}")
+    for label, with_breakers in (("no breaker", False), ("breakers", True)):
+        result = run(args, with_breakers)
+        print(
+            f"{label:<12}{result['healthy_done']:>14}{result['healthy_rate']:>12.1f}"
+            f"{result['drain_time']:>12.0f}{result['failed_calls']:>14}{result['worker_seconds_on_down']:>18.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
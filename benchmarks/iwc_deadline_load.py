@@ -0,0 +1,80 @@
+"""Deadline-miss rate under overload: legacy ordering vs EDF (deadline mode).
+
+    PYTHONPATH=lib python benchmarks/iwc_deadline_load.py [--tasks 800] [--overloads 2 5]
+
+One worker dispatches a task every simulated second while tasks arrive
+``overload`` times faster, each with a deadline 30s-5min after submission
+and a 20% chance of an explicit HIGH priority. Once arrivals stop, the
+backlog is drained and the queue's ``deadlines_missed`` counter is read.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from datetime import datetime, timedelta
+
+from solutions.IWC.queue_solution_legacy import (
+    Queue,
+    SchedulingMode,
+    Priority,
+    REGISTERED_PROVIDERS,
+)
+from solutions.IWC.task_types import TaskSubmission
+
+BASE = datetime(2026, 1, 17, 19, 30)
+
+
+class VirtualClock:
+    def __init__(self) -> None:
+        self.now = BASE
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def run(mode: SchedulingMode, tasks: int, overload: float, seed: int) -> tuple[int, int]:
+    rng = random.Random(seed)
+    clock = VirtualClock()
+    queue = Queue(scheduling=mode, clock=clock, deadline_at_risk_window=timedelta(seconds=30))
+
+    arrivals = []
+    at = 0.0
+    for user_id in range(tasks):
+        at += rng.expovariate(overload)
+        metadata: dict[str, object] = {"deadline": BASE + timedelta(seconds=at + rng.uniform(30, 300))}
+        if rng.random() < 0.2:
+            metadata["priority"] = Priority.HIGH
+        provider = REGISTERED_PROVIDERS[rng.randrange(len(REGISTERED_PROVIDERS))].name
+        arrivals.append((at, TaskSubmission(provider=provider, user_id=user_id, timestamp=BASE + timedelta(seconds=at), metadata=metadata)))
+
+    dispatched = 0
+    next_arrival = 0
+    second = 0
+    while next_arrival < len(arrivals) or queue.size:
+        clock.now = BASE + timedelta(seconds=second)
+        while next_arrival < len(arrivals) and arrivals[next_arrival][0] <= second:
+            queue.enqueue(arrivals[next_arrival][1])
+            next_arrival += 1
+        if queue.dequeue() is not None:
+            dispatched += 1
+        second += 1
+    return queue.stats()["deadlines_missed"], dispatched
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=800)
+    parser.add_argument("--overloads", type=float, nargs="+", default=[2, 5])
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    print(f"{'overload':>9}{'mode':>10}{'dispatched':>12}{'missed':>8}{'miss rate':>11}")
+    for overload in args.overloads:
+        for mode in (SchedulingMode.LEGACY, SchedulingMode.DEADLINE):
+            missed, dispatched = run(mode, args.tasks, overload, args.seed)
+            print(f"{overload:>8}x{mode.value:>10}{dispatched:>12}{missed:>8}{missed / dispatched:>11.1%}")
+
+
+if __name__ == "__main__":
+    main()
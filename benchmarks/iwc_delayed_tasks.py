@@ -0,0 +1,81 @@
+"""Dequeue cost as the number of delayed retries grows.
+
+    PYTHONPATH=lib python benchmarks/iwc_delayed_tasks.py [--delayed 1000 10000 100000 1000000]
+
+Half of ``--ready`` tasks are dispatched while ``--delayed`` retries wait
+for their backoff under a virtual clock; the clock then advances so that
+about one retry becomes due per dequeue while the other half drains. Both columns should stay flat as
+the number of waiting retries grows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from solutions.IWC.queue_solution_legacy import Queue, SchedulingMode
+from solutions.IWC.retry_policy import RetryPolicy
+from solutions.IWC.task_types import TaskDispatch, TaskSubmission
+
+
+class VirtualClock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def run(delayed: int, ready: int, seed: int) -> tuple[float, float]:
+    start = datetime(2026, 1, 17, 19, 30)
+    clock = VirtualClock(start)
+    queue = Queue(
+        scheduling=SchedulingMode.FAIR_SHARE,
+        clock=clock,
+        retry_policies={
+            "bank_statements": RetryPolicy(base_delay=timedelta(minutes=10), max_delay=timedelta(minutes=10)),
+        },
+        rng=random.Random(seed),
+    )
+    for user_id in range(delayed):
+        queue.retry(TaskDispatch(provider="bank_statements", user_id=user_id))
+    for user_id in range(delayed, delayed + ready):
+        queue.enqueue(TaskSubmission(provider="id_verification", user_id=user_id, timestamp=start))
+
+    dequeues = ready // 2
+    waiting = []
+    for _ in range(dequeues):
+        started = time.perf_counter()
+        queue.dequeue()
+        waiting.append(time.perf_counter() - started)
+
+    # Backoff of the first attempt is jittered over [5, 10] minutes.
+    step = timedelta(minutes=5) / delayed
+    clock.now = start + timedelta(minutes=5)
+    promoting = []
+    for _ in range(dequeues):
+        clock.now += step
+        started = time.perf_counter()
+        queue.dequeue()
+        promoting.append(time.perf_counter() - started)
+    return statistics.median(waiting), statistics.median(promoting)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--delayed", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--ready", type=int, default=400)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'delayed':>10}{'dequeue, none due (us)':>26}{'dequeue, promoting (us)':>26}")
+    for delayed in args.delayed:
+        waiting, promoting = run(delayed, args.ready, args.seed)
+        print(f"{delayed:>10}{waiting * 1e6:>26.1f}{promoting * 1e6:>26.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Dequeue cost against queue size for the fair-share and deadline schedulers.
+
+    PYTHONPATH=lib python benchmarks/iwc_dequeue_scaling.py [--sizes 1000 10000 100000] [--dequeues 2000]
+
+Fills a queue with one id_verification task per user, oldest first (in
+deadline mode each task's deadline follows its timestamp), then times
+``--dequeues`` dequeues from the full queue. Both schedulers hand out the
+oldest task first here, so every dequeue moves the queue's age bounds. The
+legacy scheduler sorts the whole backlog on every dequeue by design and is
+left out.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from solutions.IWC.queue_solution_legacy import ID_VERIFICATION_PROVIDER, Queue, SchedulingMode
+from solutions.IWC.task_types import TaskSubmission
+
+BASE = datetime(2026, 1, 17, 19, 30)
+
+
+def run(mode: SchedulingMode, size: int, dequeues: int) -> float:
+    queue = Queue(scheduling=mode, clock=lambda: BASE)
+    for user_id in range(size):
+        timestamp = BASE + timedelta(milliseconds=user_id)
+        metadata = {"deadline": timestamp + timedelta(hours=1)} if mode is SchedulingMode.DEADLINE else {}
+        queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=user_id, timestamp=timestamp, metadata=metadata))
+
+    dequeues = min(dequeues, size)
+    started = time.perf_counter()
+    for _ in range(dequeues):
+        queue.dequeue()
+    return (time.perf_counter() - started) / dequeues
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--dequeues", type=int, default=2_000)
+    args = parser.parse_args()
+
+    modes = (SchedulingMode.FAIR_SHARE, SchedulingMode.DEADLINE)
+    print(f"{'tasks':>8}" + "".join(f"{mode.name.lower() + ' (us)':>18}" for mode in modes))
+    for size in args.sizes:
+        print(f"{size:>8}" + "".join(f"{run(mode, size, args.dequeues) * 1e6:>18.1f}" for mode in modes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Tail wait times on a skewed workload: legacy ordering vs fair-share (DRR).
+
+    PYTHONPATH=lib python benchmarks/iwc_fair_share.py [--ticks 2000] [--heavy-users 10]
+
+Each tick one task is dispatched. A handful of heavy users keep every
+provider queued (so the rule of three keeps promoting them to HIGH) while
+light users trickle in with a single task. Wait time is measured in ticks
+from submission to dispatch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+from datetime import datetime, timedelta
+
+from solutions.IWC.queue_solution_legacy import Queue, SchedulingMode, REGISTERED_PROVIDERS
+from solutions.IWC.task_types import TaskSubmission
+
+BASE = datetime(2026, 1, 17, 19, 30)
+LIGHT_USER_OFFSET = 1_000_000
+
+
+def percentile(values: list[int], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def run(mode: SchedulingMode, ticks: int, heavy_users: int, light_rate: float, seed: int) -> tuple[dict[str, list[int]], dict[str, int]]:
+    rng = random.Random(seed)
+    queue = Queue(scheduling=mode)
+    submitted: dict[tuple[int, str], int] = {}
+    waits: dict[str, list[int]] = {"heavy": [], "light": []}
+    next_light_user = LIGHT_USER_OFFSET
+
+    def submit(user_id: int, provider: str, tick: int) -> None:
+        submitted.setdefault((user_id, provider), tick)
+        queue.enqueue(TaskSubmission(provider=provider, user_id=user_id, timestamp=BASE + timedelta(seconds=tick)))
+
+    for tick in range(ticks):
+        for user_id in range(heavy_users):
+            provider = REGISTERED_PROVIDERS[rng.randrange(len(REGISTERED_PROVIDERS))].name
+            if rng.random() < 0.5:
+                submit(user_id, provider, tick)
+        if rng.random() < light_rate:
+            submit(next_light_user, rng.choice(REGISTERED_PROVIDERS).name, tick)
+            next_light_user += 1
+
+        dispatched = queue.dequeue()
+        if dispatched is None:
+            continue
+        started = submitted.pop((dispatched.user_id, dispatched.provider), tick)
+        group = "light" if dispatched.user_id >= LIGHT_USER_OFFSET else "heavy"
+        waits[group].append(tick - started)
+
+    unserved = {"heavy": 0, "light": 0}
+    for user_id, _ in submitted:
+        unserved["light" if user_id >= LIGHT_USER_OFFSET else "heavy"] += 1
+    return waits, unserved
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=2_000)
+    parser.add_argument("--heavy-users", type=int, default=10)
+    parser.add_argument("--light-rate", type=float, default=0.3, help="light-user arrivals per tick")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'mode':<12}{'group':<8}{'served':>8}{'unserved':>10}{'p50':>8}{'p90':>8}{'p99':>8}{'max':>8}")
+    for mode in (SchedulingMode.LEGACY, SchedulingMode.FAIR_SHARE):
+        waits, unserved = run(mode, args.ticks, args.heavy_users, args.light_rate, args.seed)
+        for group, values in waits.items():
+            print(
+                f"{mode.value:<12}{group:<8}{len(values):>8}{unserved[group]:>10}"
+                f"{statistics.median(values) if values else 0:>8.0f}"
+                f"{percentile(values, 0.90):>8.0f}{percentile(values, 0.99):>8.0f}"
+                f"{max(values, default=0):>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Ingest rate: shared-memory ring vs ``multiprocessing.Queue``.
+
+    PYTHONPATH=lib python benchmarks/iwc_ingest_ring.py [--producers 4] [--tasks 50000]
+
+Each producer process submits ``--tasks`` records; the parent process plays the
+scheduler and decodes every record back into a ``TaskSubmission``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import time
+from datetime import datetime
+
+from solutions.IWC.ingest_ring import IngestRing
+from solutions.IWC.queue_solution_legacy import REGISTERED_PROVIDERS
+from solutions.IWC.task_types import TaskSubmission
+
+TIMESTAMP = datetime(2026, 1, 17, 19, 30)
+
+
+def _task(i: int) -> TaskSubmission:
+    return TaskSubmission(
+        provider=REGISTERED_PROVIDERS[i % len(REGISTERED_PROVIDERS)].name,
+        user_id=i,
+        timestamp=TIMESTAMP,
+    )
+
+
+def _ring_producer(ring: IngestRing, count: int) -> None:
+    for i in range(count):
+        ring.put(_task(i), timeout=None)
+
+
+def _mp_queue_producer(queue, count: int) -> None:
+    for i in range(count):
+        queue.put(_task(i))
+
+
+def bench_ring(producers: int, tasks: int, capacity: int, batch: int) -> float:
+    ring = IngestRing.create(capacity=capacity)
+    workers = [
+        multiprocessing.Process(target=_ring_producer, args=(ring, tasks))
+        for _ in range(producers)
+    ]
+    expected = producers * tasks
+    received = 0
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    while received < expected:
+        received += len(ring.drain(batch))
+    elapsed = time.perf_counter() - started
+    for worker in workers:
+        worker.join()
+    ring.close()
+    return expected / elapsed
+
+
+def bench_mp_queue(producers: int, tasks: int, capacity: int) -> float:
+    queue = multiprocessing.Queue(maxsize=capacity)
+    workers = [
+        multiprocessing.Process(target=_mp_queue_producer, args=(queue, tasks))
+        for _ in range(producers)
+    ]
+    expected = producers * tasks
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for _ in range(expected):
+        queue.get()
+    elapsed = time.perf_counter() - started
+    for worker in workers:
+        worker.join()
+    return expected / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--producers", type=int, default=4)
+    parser.add_argument("--tasks", type=int, default=50_000, help="tasks per producer")
+    parser.add_argument("--capacity", type=int, default=65_536)
+    parser.add_argument("--batch", type=int, default=256)
+    args = parser.parse_args()
+
+    ring_rate = bench_ring(args.producers, args.tasks, args.capacity, args.batch)
+    queue_rate = bench_mp_queue(args.producers, args.tasks, args.capacity)
+    print(f"shared-memory ring      : {ring_rate:12,.0f} tasks/s")
+    print(f"multiprocessing.Queue   : {queue_rate:12,.0f} tasks/s")
+    print(f"speed-up                : {ring_rate / queue_rate:12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
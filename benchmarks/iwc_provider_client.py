@@ -0,0 +1,94 @@
+"""Dispatch throughput: pooled keep-alive client vs one connection per call.
+
+    PYTHONPATH=lib python benchmarks/iwc_provider_client.py [--tasks 2000] [--workers 16]
+
+Workers pull tasks from a ``Queue`` and call the local provider stub server,
+which simulates a small latency per provider.
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from datetime import datetime, timedelta
+
+from solutions.IWC.provider_client import ProviderClient
+from solutions.IWC.provider_stub_server import ProviderStubServer, StubBehaviour
+from solutions.IWC.queue_solution_legacy import Queue, REGISTERED_PROVIDERS
+from solutions.IWC.task_types import TaskSubmission
+
+BASE = datetime(2026, 1, 17, 19, 30)
+
+
+def _fill_queue(tasks: int) -> Queue:
+    queue = Queue()
+    for i in range(tasks):
+        queue.enqueue(
+            TaskSubmission(
+                provider=REGISTERED_PROVIDERS[i % len(REGISTERED_PROVIDERS)].name,
+                user_id=i,
+                timestamp=BASE + timedelta(seconds=i),
+            )
+        )
+    return queue
+
+
+def bench(stub: ProviderStubServer, tasks: int, workers: int, keep_alive: bool) -> tuple[float, int]:
+    queue = _fill_queue(tasks)
+    dispatched = [queue.dequeue() for _ in range(queue.size)]
+    count = len(dispatched)
+    lock = threading.Lock()
+
+    client = ProviderClient(
+        base_urls=stub.base_urls,
+        max_in_flight=workers,
+        keep_alive=keep_alive,
+        on_complete=queue.record_completion,
+    )
+
+    def worker() -> None:
+        while True:
+            with lock:
+                if not dispatched:
+                    return
+                task = dispatched.pop()
+            client.fetch(task)
+
+    opened_before = stub.connections_accepted
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    client.close()
+    failed = sum(stats["failed"] for stats in queue.stats()["providers"].values())
+    if failed:
+        raise RuntimeError(f"{failed} provider calls failed during the benchmark")
+    return count / elapsed, stub.connections_accepted - opened_before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=2_000)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.002, help="simulated provider latency (s)")
+    args = parser.parse_args()
+
+    behaviours = {
+        provider.name: StubBehaviour(latency=args.latency, jitter=args.latency / 2)
+        for provider in REGISTERED_PROVIDERS
+    }
+    with ProviderStubServer(behaviours, seed=0) as stub:
+        pooled_rate, pooled_connections = bench(stub, args.tasks, args.workers, keep_alive=True)
+        fresh_rate, fresh_connections = bench(stub, args.tasks, args.workers, keep_alive=False)
+
+    print(f"pooled keep-alive        : {pooled_rate:10,.0f} tasks/s  ({pooled_connections} connections)")
+    print(f"connection per call      : {fresh_rate:10,.0f} tasks/s  ({fresh_connections} connections)")
+    print(f"speed-up                 : {pooled_rate / fresh_rate:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
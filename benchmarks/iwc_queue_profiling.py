@@ -0,0 +1,79 @@
+"""Cost of the queue profiling mode on enqueue + dequeue throughput.
+
+    PYTHONPATH=lib python benchmarks/iwc_queue_profiling.py [--users 500] [--repeats 5]
+
+Fills a legacy queue with a credit_check and a bank_statements task per
+user (so every dequeue regroups, rewrites and sorts the backlog), then
+drains it, under four settings: profiling off, phase markers only (a
+profiler attached but not started), markers plus stack sampling, and all
+of that plus tracemalloc. Runs of the four settings are interleaved; each
+setting reports the median wall time of ``--repeats`` runs, its overhead
+against "off", and the sampler's own measure of the time it took.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from solutions.IWC.queue_profiler import ProfilingPolicy, QueueProfiler
+from solutions.IWC.queue_solution_legacy import Queue
+from solutions.IWC.task_types import TaskSubmission
+
+
+def run(users: int, mode: str, output_dir: str) -> tuple[float, float | None]:
+    profiler = None
+    if mode != "off":
+        profiler = QueueProfiler(ProfilingPolicy(
+            output_dir=output_dir,
+            trace_allocations=mode == "sampling + tracemalloc",
+        ))
+    queue = Queue(profiler=profiler)
+    if profiler is not None and mode != "markers":
+        profiler.start()
+
+    start = datetime(2026, 1, 17, 19, 30)
+    started = time.perf_counter()
+    for user_id in range(users):
+        timestamp = start + timedelta(milliseconds=user_id)
+        queue.enqueue(TaskSubmission(provider="credit_check", user_id=user_id, timestamp=timestamp))
+        queue.enqueue(TaskSubmission(provider="bank_statements", user_id=user_id, timestamp=timestamp))
+    while queue.dequeue() is not None:
+        pass
+    elapsed = time.perf_counter() - started
+
+    sampler_overhead = None
+    if profiler is not None and mode != "markers":
+        profiler.stop()
+        sampler_overhead = profiler.stats()["sampler_overhead"]
+    return elapsed, sampler_overhead
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    modes = ("off", "markers", "sampling", "sampling + tracemalloc")
+    results: dict[str, list[tuple[float, float | None]]] = {mode: [] for mode in modes}
+    with tempfile.TemporaryDirectory() as output_dir:
+        run(args.users, "off", output_dir)  # warm-up
+        for _ in range(args.repeats):
+            for mode in modes:
+                results[mode].append(run(args.users, mode, output_dir))
+
+    print(f"{'mode':<24}{'wall (s)':>10}{'overhead':>10}{'sampler self-time':>19}")
+    baseline = statistics.median(elapsed for elapsed, _ in results["off"])
+    for mode in modes:
+        wall = statistics.median(elapsed for elapsed, _ in results[mode])
+        sampler = [overhead for _, overhead in results[mode] if overhead is not None]
+        sampler_text = f"{statistics.median(sampler):.2%}" if sampler else "-"
+        print(f"{mode:<24}{wall:>10.3f}{wall / baseline - 1:>10.1%}{sampler_text:>19}")
+
+
+if __name__ == "__main__":
+    main()
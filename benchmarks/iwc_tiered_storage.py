@@ -0,0 +1,96 @@
+"""Resident memory and dequeue latency of a bank_statements backlog, with and without tiering.
+
+    PYTHONPATH=lib python benchmarks/iwc_tiered_storage.py [--sizes 10000 100000 1000000]
+
+Each measurement runs in a fresh interpreter so RSS growth is attributable
+to the backlog alone. The backlog is one deprioritised bank_statements task
+per user, 100 microseconds apart (so even a million of them stay clear of
+reprioritisation), plus 50 id_verification tasks spread through it. Dequeue
+latency is the median of the first ``--dequeues`` dequeues; the legacy
+selector is quadratic in the resident queue, so the untiered latency is only
+measured up to ``--max-untiered-dequeue-size`` tasks.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+LIB_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lib")
+
+_PROBE = """
+import json, os, statistics, time
+from datetime import datetime, timedelta
+from solutions.IWC.queue_solution_legacy import Queue
+from solutions.IWC.task_spill import TieringPolicy
+from solutions.IWC.task_types import TaskSubmission
+
+def rss_bytes():
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+size, resident_limit, dequeues, measure_dequeue = {size}, {resident_limit}, {dequeues}, {measure_dequeue}
+start = datetime(2026, 1, 17, 19, 30)
+queue = Queue(tiering=TieringPolicy(resident_limit=resident_limit) if resident_limit else None)
+before = rss_bytes()
+for user_id in range(size):
+    timestamp = start + timedelta(microseconds=100 * user_id)
+    provider = "id_verification" if user_id % max(size // 50, 1) == 0 else "bank_statements"
+    queue.enqueue(TaskSubmission(provider=provider, user_id=user_id, timestamp=timestamp))
+grown = rss_bytes() - before
+
+latencies = []
+if measure_dequeue:
+    for _ in range(dequeues):
+        started = time.perf_counter()
+        queue.dequeue()
+        latencies.append(time.perf_counter() - started)
+print(json.dumps({{
+    "rss": grown,
+    "dequeue": statistics.median(latencies) if latencies else None,
+}}))
+"""
+
+
+def measure(size: int, resident_limit: int, dequeues: int, measure_dequeue: bool) -> dict:
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            _PROBE.format(
+                size=size,
+                resident_limit=resident_limit,
+                dequeues=dequeues,
+                measure_dequeue=measure_dequeue,
+            ),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": LIB_DIR},
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--resident-limit", type=int, default=200)
+    parser.add_argument("--dequeues", type=int, default=20)
+    parser.add_argument("--max-untiered-dequeue-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"{'tasks':>10}{'mode':>10}{'RSS growth (MiB)':>20}{'dequeue p50 (ms)':>20}")
+    for size in args.sizes:
+        for label, resident_limit in (("untiered", 0), ("tiered", args.resident_limit)):
+            measure_dequeue = resident_limit > 0 or size <= args.max_untiered_dequeue_size
+            result = measure(size, resident_limit, args.dequeues, measure_dequeue)
+            latency = "-" if result["dequeue"] is None else f"{result['dequeue'] * 1000:.2f}"
+            print(f"{size:>10}{label:>10}{result['rss'] / 2**20:>20.1f}{latency:>20}")
+
+
+if __name__ == "__main__":
+    main()
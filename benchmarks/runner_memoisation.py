@@ -0,0 +1,105 @@
+"""Replay traffic against maze and render handlers, with and without memoisation.
+
+    PYTHONPATH=lib python benchmarks/runner_memoisation.py [--requests 2000] [--distinct 200]
+
+The AMZ/HOC solutions in this tree are still stubs, so the replay runs
+against stand-in handlers with the same signatures that do comparable work
+(carve a maze by randomised depth-first search, render a card house as
+text). Requests are drawn with a Zipf-like skew over ``--distinct`` inputs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from runner.handler_kinds import stateless
+from runner.memoisation import MemoisationRegistry
+
+
+class StandInMapping:
+    @stateless
+    def amazing_maze(self, rows, columns, maze_generation_options):
+        rng = random.Random(maze_generation_options.get("seed", 0))
+        grid = [["#"] * (2 * columns + 1) for _ in range(2 * rows + 1)]
+        stack = [(0, 0)]
+        visited = {(0, 0)}
+        grid[1][1] = " "
+        while stack:
+            row, column = stack[-1]
+            neighbours = [
+                (row + dr, column + dc)
+                for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                if 0 <= row + dr < rows and 0 <= column + dc < columns and (row + dr, column + dc) not in visited
+            ]
+            if not neighbours:
+                stack.pop()
+                continue
+            next_row, next_column = rng.choice(neighbours)
+            grid[row + next_row + 1][column + next_column + 1] = " "
+            grid[2 * next_row + 1][2 * next_column + 1] = " "
+            visited.add((next_row, next_column))
+            stack.append((next_row, next_column))
+        return "\n".join("".join(line) for line in grid)
+
+    @stateless
+    def render_house(self, catalogue_entry_name, rendering_options):
+        levels = len(catalogue_entry_name) * rendering_options.get("scale", 1)
+        width = 4 * levels
+        lines = []
+        for level in range(levels):
+            cards = "/\\" * (level + 1)
+            lines.append(cards.center(width, rendering_options.get("fill", " ")))
+            lines.append(("_" * (2 * level + 2)).center(width))
+        return "\n".join(lines)
+
+
+def build_workload(requests: int, distinct: int, seed: int) -> list[tuple[str, tuple]]:
+    rng = random.Random(seed)
+    inputs = []
+    for i in range(distinct):
+        if i % 2:
+            inputs.append(("amazing_maze", (30 + i % 20, 30 + i % 17, {"seed": i, "options": ["ENTRY_EXIT"]})))
+        else:
+            inputs.append(("render_house", (f"house-{i:04d}", {"scale": 8 + i % 5, "fill": "."})))
+    weights = [1 / (rank + 1) for rank in range(distinct)]
+    return rng.choices(inputs, weights=weights, k=requests)
+
+
+def replay(mapping, workload: list[tuple[str, tuple]]) -> float:
+    started = time.perf_counter()
+    for method, args in workload:
+        getattr(mapping, method)(*args)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--distinct", type=int, default=200)
+    parser.add_argument("--maxsize", type=int, default=128)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    workload = build_workload(args.requests, args.distinct, args.seed)
+
+    plain = StandInMapping()
+    baseline = replay(plain, workload)
+
+    memoised = StandInMapping()
+    registry = MemoisationRegistry(maxsize=args.maxsize).enable("amazing_maze", "render_house")
+    registry.install(memoised)
+    cached = replay(memoised, workload)
+
+    print(f"no memoisation : {baseline:8.3f}s  ({args.requests / baseline:10,.0f} req/s)")
+    print(f"memoised       : {cached:8.3f}s  ({args.requests / cached:10,.0f} req/s)")
+    for name, stats in registry.stats().items():
+        print(f"  {name:<14} hit ratio {stats['hit_ratio']:.1%} ({stats['hits']} hits, {stats['misses']} misses)")
+
+    for method, args_ in workload[:50]:
+        assert getattr(plain, method)(*args_) == getattr(memoised, method)(*args_)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Runner cold-start cost: import time and time to first handled request.
+
+    PYTHONPATH=lib python benchmarks/runner_startup.py [--runs 20]
+
+Every run is a fresh interpreter, as for a short-lived runner process. The
+"eager" row touches every solution up front, which is what building
+``EntryPointMapping`` used to cost.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+LIB_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lib")
+
+_PROBE = """
+import json, time
+started = time.perf_counter()
+from entry_point_mapping import EntryPointMapping
+mapping = EntryPointMapping()
+imported = time.perf_counter()
+if {eager}:
+    for name, value in vars(EntryPointMapping).items():
+        if name.endswith(("_solution", "_entrypoint")):
+            getattr(mapping, name)
+mapping.sum(1, 2)
+first_request = time.perf_counter()
+print(json.dumps({{"import": imported - started, "first_request": first_request - started}}))
+"""
+
+
+def measure(eager: bool, runs: int) -> dict[str, float]:
+    samples: dict[str, list[float]] = {"import": [], "first_request": []}
+    env = {**os.environ, "PYTHONPATH": LIB_DIR}
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(eager=eager)],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        ).stdout
+        for key, value in json.loads(output).items():
+            samples[key].append(value)
+    return {key: statistics.median(values) for key, values in samples.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'mode':<8}{'import (ms)':>14}{'first request (ms)':>22}")
+    for label, eager in (("lazy", False), ("eager", True)):
+        result = measure(eager, args.runs)
+        print(f"{label:<8}{result['import'] * 1000:>14.2f}{result['first_request'] * 1000:>22.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,67 +1,92 @@
-from solutions.SUM.sum_solution import SumSolution
-from solutions.HLO.hello_solution import HelloSolution
-from solutions.FIZ.fizz_buzz_solution import FizzBuzzSolution
-from solutions.CHK.checkout_solution import CheckoutSolution
-from solutions.RBT.rabbit_hole_solution import RabbitHoleSolution
-from solutions.HOC.house_of_cards_solution import HouseOfCardsSolution
-from solutions.AMZ.amazing_solution import AmazingSolution
-from solutions.ULT.ultimate_solution import UltimateSolution
-from solutions.DMO.demo_round1_solution import DemoRound1Solution
-from solutions.DMO.demo_round2_solution import DemoRound2Solution
-from solutions.DMO.demo_round3_solution import DemoRound3Solution
-from solutions.DMO.inventory_item import InventoryItem
-from solutions.DMO.demo_round4n5_solution import DemoRound4n5Solution
-from solutions.IWC.queue_solution_entrypoint import QueueSolutionEntrypoint
+import threading
+from importlib import import_module
 
 from dataclasses import is_dataclass, asdict
 
-from solutions.IWC.task_types import TaskSubmission
+from runner.handler_kinds import stateless
+
+
+class _LazySolution:
+    """Imports and constructs a solution class the first time it is used.
+
+    The instance is then stored on the mapping itself, shadowing this
+    descriptor, so later lookups are plain attribute reads.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, module_name, class_name):
+        self._module_name = module_name
+        self._class_name = class_name
+        self._attribute_name = None
+
+    def __set_name__(self, owner, name):
+        self._attribute_name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        with self._lock:
+            solution = instance.__dict__.get(self._attribute_name)
+            if solution is None:
+                solution_class = getattr(import_module(self._module_name), self._class_name)
+                solution = instance.__dict__[self._attribute_name] = solution_class()
+        return solution
+
 
 class EntryPointMapping:
-    def __init__(self):
-        self.sum_solution = SumSolution()
-        self.hello_solution = HelloSolution()
-        self.fizz_buzz_solution = FizzBuzzSolution()
-        self.checkout_solution = CheckoutSolution()
-        self.rabbit_hole_solution = RabbitHoleSolution()
-        self.house_of_cards_solution = HouseOfCardsSolution()
-        self.amazing_solution = AmazingSolution()
-        self.ultimate_solution = UltimateSolution()
-        self.demo_round1_solution = DemoRound1Solution()
-        self.demo_round2_solution = DemoRound2Solution()
-        self.demo_round3_solution = DemoRound3Solution()
-        self.demo_round4n5_solution = DemoRound4n5Solution()
-        self.queue_solution_entrypoint = QueueSolutionEntrypoint()
+    sum_solution = _LazySolution("solutions.SUM.sum_solution", "SumSolution")
+    hello_solution = _LazySolution("solutions.HLO.hello_solution", "HelloSolution")
+    fizz_buzz_solution = _LazySolution("solutions.FIZ.fizz_buzz_solution", "FizzBuzzSolution")
+    checkout_solution = _LazySolution("solutions.CHK.checkout_solution", "CheckoutSolution")
+    rabbit_hole_solution = _LazySolution("solutions.RBT.rabbit_hole_solution", "RabbitHoleSolution")
+    house_of_cards_solution = _LazySolution("solutions.HOC.house_of_cards_solution", "HouseOfCardsSolution")
+    amazing_solution = _LazySolution("solutions.AMZ.amazing_solution", "AmazingSolution")
+    ultimate_solution = _LazySolution("solutions.ULT.ultimate_solution", "UltimateSolution")
+    demo_round1_solution = _LazySolution("solutions.DMO.demo_round1_solution", "DemoRound1Solution")
+    demo_round2_solution = _LazySolution("solutions.DMO.demo_round2_solution", "DemoRound2Solution")
+    demo_round3_solution = _LazySolution("solutions.DMO.demo_round3_solution", "DemoRound3Solution")
+    demo_round4n5_solution = _LazySolution("solutions.DMO.demo_round4n5_solution", "DemoRound4n5Solution")
+    queue_solution_entrypoint = _LazySolution("solutions.IWC.queue_solution_entrypoint", "QueueSolutionEntrypoint")
 
     # ~~~~~~~~ Single method challenges ~~~~~~
     
+    @stateless
     def sum(self, *args):
         return self.sum_solution.compute(*args)
 
+    @stateless
     def hello(self, *args):
         return self.hello_solution.hello(*args)
 
+    @stateless
     def fizz_buzz(self, *args):
         return self.fizz_buzz_solution.fizz_buzz(*args)
 
+    @stateless
     def checkout(self, *args):
         return self.checkout_solution.checkout(*args)
 
+    @stateless
     def rabbit_hole(self, *args):
         return self.rabbit_hole_solution.rabbit_hole(*args)
 
+    @stateless
     def render_house(self, *args):
         return self.house_of_cards_solution.render_house(*args)
 
+    @stateless
     def amazing_maze(self, *args):
         return self.amazing_solution.amazing_maze(*args)
 
+    @stateless
     def ultimate_maze(self, *args):
         return self.ultimate_solution.ultimate_maze(*args)
 
     # ~~~~~~~~ IWC queue challenge ~~~~~~
 
     def enqueue(self, task):
+        from solutions.IWC.task_types import TaskSubmission
         task_submission = TaskSubmission(**task)
         return self.queue_solution_entrypoint.enqueue(task_submission)
 
@@ -83,30 +108,38 @@ class EntryPointMapping:
 
     # ~~~~~~~~ Demo rounds ~~~~~~
     
+    @stateless
     def increment(self, *args):
         return self.demo_round1_solution.increment(*args)
 
+    @stateless
     def to_uppercase(self, *args):
         return self.demo_round1_solution.to_uppercase(*args)
 
+    @stateless
     def letter_to_santa(self):
         return self.demo_round1_solution.letter_to_santa()
 
+    @stateless
     def count_lines(self, *args):
         return self.demo_round1_solution.count_lines(*args)
 
     # Round 2
+    @stateless
     def array_sum(self, *args):
         return self.demo_round2_solution.array_sum(*args)
 
+    @stateless
     def int_range(self, *args):
         return self.demo_round2_solution.int_range(*args)
 
+    @stateless
     def filter_pass(self, *args):
         return self.demo_round2_solution.filter_pass(*args)
 
     # Round 3
     def inventory_add(self, inventory_item, number):
+        from solutions.DMO.inventory_item import InventoryItem
         item = InventoryItem(**inventory_item)
         return self.demo_round3_solution.inventory_add(item, number)
 
@@ -115,11 +148,11 @@ class EntryPointMapping:
 
     def inventory_get(self, *args):
         response = self.demo_round3_solution.inventory_get(*args)
-        if is_dataclass(response):
-            # noinspection PyDataclass
-            return asdict(response)
-        return response
+        if response is None:
+            return None
+        return response.as_dict()
 
     # Round 4 & 5
+    @stateless
     def waves(self, *args):
         return self.demo_round4n5_solution.waves(*args)
@@ -0,0 +1,118 @@
+"""Concurrent request dispatch in front of ``EntryPointMapping``.
+
+Handlers marked ``@stateless`` are pure functions of their arguments and run
+on a worker pool; every other handler touches solution state (the IWC queue,
+the demo inventory) and runs on a single lane in arrival order. Responses
+are always handed back in request order.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator
+
+from runner.handler_kinds import is_stateless
+
+
+@dataclass
+class Request:
+    id: str
+    method: str
+    params: list[Any] = field(default_factory=list)
+
+
+@dataclass
+class Response:
+    id: str
+    result: Any = None
+    error: BaseException | None = None
+
+
+_worker_mapping = None
+
+
+def _invoke_in_worker(method: str, params: list[Any]) -> Any:
+    # Process pool entry point: each worker process keeps its own mapping, which
+    # is safe because only stateless handlers are sent here.
+    global _worker_mapping
+    if _worker_mapping is None:
+        from entry_point_mapping import EntryPointMapping
+        _worker_mapping = EntryPointMapping()
+    return getattr(_worker_mapping, method)(*params)
+
+
+class ConcurrentDispatcher:
+    """Routes requests to a stateless worker pool or the ordered stateful lane.
+
+    ``process`` keeps at most ``max_pending`` requests in flight, so a long
+    request stream is consumed with bounded memory.
+    """
+
+    def __init__(
+        self,
+        entry_point_mapping,
+        max_workers: int = 4,
+        use_processes: bool = False,
+        max_pending: int = 64,
+    ) -> None:
+        self._mapping = entry_point_mapping
+        self._use_processes = use_processes
+        self._max_pending = max_pending
+        self._stateless_pool: Executor
+        if use_processes:
+            # Imported on demand: it pulls in multiprocessing, which the runner
+            # otherwise never needs at startup.
+            from concurrent.futures import ProcessPoolExecutor
+            self._stateless_pool = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            self._stateless_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stateless")
+        self._stateful_lane = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stateful")
+
+    def submit(self, method: str, params: Iterable[Any] = ()) -> Future:
+        try:
+            handler = getattr(self._mapping, method)
+        except AttributeError as error:
+            # Like a handler error, an unknown method fails only its own request.
+            future: Future = Future()
+            future.set_exception(error)
+            return future
+        params = list(params)
+        if not is_stateless(handler):
+            return self._stateful_lane.submit(handler, *params)
+        if self._use_processes:
+            return self._stateless_pool.submit(_invoke_in_worker, method, params)
+        return self._stateless_pool.submit(handler, *params)
+
+    def process(self, requests: Iterable[Request]) -> Iterator[Response]:
+        pending: deque[tuple[Request, Future]] = deque()
+        for request in requests:
+            pending.append((request, self.submit(request.method, request.params)))
+            if len(pending) >= self._max_pending:
+                yield self._collect(*pending.popleft())
+        while pending:
+            yield self._collect(*pending.popleft())
+
+    @staticmethod
+    def _collect(request: Request, future: Future) -> Response:
+        error = future.exception()
+        if error is not None:
+            return Response(id=request.id, error=error)
+        return Response(id=request.id, result=future.result())
+
+    def handler(self, method: str):
+        """Blocking callable for ``with_solution_for`` registrations."""
+        def dispatch(*params):
+            return self.submit(method, params).result()
+        return dispatch
+
+    def close(self) -> None:
+        self._stateless_pool.shutdown()
+        self._stateful_lane.shutdown()
+
+    def __enter__(self) -> "ConcurrentDispatcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
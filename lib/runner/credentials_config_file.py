@@ -1,3 +1,4 @@
+import functools
 import os
 
 
@@ -14,7 +15,12 @@ def read_from_config_file_with_default(key, default_value):
 # ~~~~ Helpers
 
 
+@functools.lru_cache(maxsize=None)
 def read_properties_file():
+    """
+    Parse config/credentials.config once per process; call
+    read_properties_file.cache_clear() to pick up edits.
+    """
     current_dir = os.path.dirname(__file__)
     properties = load_properties(os.path.join(current_dir, "..", "..", "config", "credentials.config"))
     return properties
@@ -0,0 +1,14 @@
+"""Markers describing how ``EntryPointMapping`` handlers may be scheduled.
+
+Kept free of heavy imports: ``entry_point_mapping`` imports it at startup.
+"""
+
+
+def stateless(handler):
+    """Marks a handler as a pure function of its arguments, safe to run concurrently."""
+    handler.stateless = True
+    return handler
+
+
+def is_stateless(handler) -> bool:
+    return getattr(handler, "stateless", False)
@@ -0,0 +1,139 @@
+"""Opt-in memoisation for pure ``EntryPointMapping`` handlers.
+
+Only handlers marked ``@stateless`` can be memoised. Arguments arrive from
+the runner as JSON-like values, so lists and dicts are frozen into hashable
+keys; scalar types are part of the key so ``1``, ``1.0`` and ``True`` never
+share an entry.
+
+```python
+registry = MemoisationRegistry(maxsize=512)
+registry.enable("render_house", "amazing_maze")
+registry.install(entry_point_mapping)
+...
+registry.stats()["render_house"]["hit_ratio"]
+```
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+from runner.handler_kinds import is_stateless
+
+_IMMUTABLE_RESULTS = (str, bytes, int, float, bool, type(None), tuple, frozenset)
+
+
+def freeze(value: Any) -> Any:
+    """Hashable, type-tagged key for a JSON-like argument value."""
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(freeze(item) for item in value))
+    if isinstance(value, dict):
+        return (dict, frozenset((freeze(k), freeze(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return (frozenset, frozenset(freeze(item) for item in value))
+    return (type(value), value)
+
+
+class MemoisedHandler:
+    """Bounded LRU cache in front of one handler, with hit/miss counters."""
+
+    def __init__(self, handler: Callable[..., Any], maxsize: int = 256) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        functools.update_wrapper(self, handler)
+        self._handler = handler
+        self._maxsize = maxsize
+        self._results: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, *args: Any) -> Any:
+        key = freeze(args)
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return self._copy(self._results[key])
+            self.misses += 1
+
+        result = self._handler(*args)
+        with self._lock:
+            self._results[key] = result
+            if len(self._results) > self._maxsize:
+                self._results.popitem(last=False)
+        return self._copy(result)
+
+    @staticmethod
+    def _copy(result: Any) -> Any:
+        # Callers may mutate what they get back; a cached list or dict must not change.
+        if isinstance(result, _IMMUTABLE_RESULTS):
+            return result
+        return copy.deepcopy(result)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+    def stats(self) -> dict[str, float]:
+        calls = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._results),
+            "hit_ratio": self.hits / calls if calls else 0.0,
+        }
+
+
+def memoise(maxsize: int = 256):
+    """Decorator form of ``MemoisedHandler`` for standalone pure functions."""
+    def decorate(handler: Callable[..., Any]) -> MemoisedHandler:
+        return MemoisedHandler(handler, maxsize)
+    return decorate
+
+
+class MemoisationRegistry:
+    """Per-handler memoisation switches applied to an ``EntryPointMapping``."""
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._maxsize = maxsize
+        self._sizes: dict[str, int] = {}
+        self._handlers: dict[str, MemoisedHandler] = {}
+
+    def enable(self, *names: str, maxsize: int | None = None) -> "MemoisationRegistry":
+        for name in names:
+            self._sizes[name] = maxsize or self._maxsize
+        return self
+
+    def disable(self, *names: str) -> "MemoisationRegistry":
+        for name in names:
+            self._sizes.pop(name, None)
+        return self
+
+    def install(self, entry_point_mapping) -> None:
+        """Wrap the enabled handlers on ``entry_point_mapping`` in place.
+
+        Handlers disabled since a previous install are restored to the plain
+        method.
+        """
+        for name in list(self._handlers):
+            if name not in self._sizes:
+                vars(entry_point_mapping).pop(name, None)
+                del self._handlers[name]
+
+        for name, maxsize in self._sizes.items():
+            handler = getattr(type(entry_point_mapping), name).__get__(entry_point_mapping)
+            if not is_stateless(handler):
+                raise ValueError(f"Handler {name!r} is stateful and cannot be memoised")
+            memoised = self._handlers[name] = MemoisedHandler(handler, maxsize)
+            setattr(entry_point_mapping, name, memoised)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        return {name: handler.stats() for name, handler in self._handlers.items()}
+
+
+__all__ = ["MemoisationRegistry", "MemoisedHandler", "freeze", "memoise"]
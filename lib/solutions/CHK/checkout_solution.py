@@ -1,6 +1,19 @@
+from typing import Iterable
+
+from solutions.CHK.pricing import DEFAULT_PRICE_LIST, PricingEngine
+
+_DEFAULT_ENGINE = DEFAULT_PRICE_LIST.compile()
+
 
 class CheckoutSolution:
 
+    def __init__(self, engine: PricingEngine | None = None):
+        self._engine = engine or _DEFAULT_ENGINE
+
     # skus = unicode string
     def checkout(self, skus):
-        raise NotImplementedError()
+        return self._engine.price(skus)
+
+    def checkout_many(self, baskets: Iterable[str]) -> list[int]:
+        price = self._engine.price
+        return [price(skus) for skus in baskets]
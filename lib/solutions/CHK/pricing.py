@@ -0,0 +1,207 @@
+"""Price list and offers for ``CheckoutSolution``, compiled once into lookup tables.
+
+``PriceList.compile()`` turns every offer into per-SKU data the basket
+pricer only has to index:
+
+* multi-buys (``3A for 130``) and same-SKU freebies (``2F get one F free``,
+  i.e. ``3F for 2F``) become a table of the cheapest cost of ``n`` paid
+  units, filled by dynamic programming up to the point after which the best
+  per-unit deal always repeats;
+* cross-SKU freebies (``2E get one B free``) reduce the count of the free SKU
+  before it is priced;
+* group bundles (``any 3 of S, T, X, Y, Z for 45``) keep their SKUs sorted by
+  price, most expensive first, so the bundled units are always the priciest.
+
+A basket is then one ``Counter`` pass over the SKU string plus a table
+lookup per distinct SKU.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Mapping, Sequence
+
+
+@dataclass(frozen=True)
+class MultiPrice:
+    """``quantity`` of ``sku`` for ``price``."""
+
+    sku: str
+    quantity: int
+    price: int
+
+
+@dataclass(frozen=True)
+class FreeItem:
+    """Every ``quantity`` of ``sku`` bought gets one ``free_sku`` free."""
+
+    sku: str
+    quantity: int
+    free_sku: str
+
+
+@dataclass(frozen=True)
+class GroupOffer:
+    """Any ``quantity`` of ``skus``, mixed freely, for ``price``."""
+
+    skus: tuple[str, ...]
+    quantity: int
+    price: int
+
+
+@dataclass
+class PriceList:
+    prices: Mapping[str, int]
+    multi_prices: Sequence[MultiPrice] = ()
+    free_items: Sequence[FreeItem] = ()
+    group_offers: Sequence[GroupOffer] = ()
+
+    def compile(self) -> "PricingEngine":
+        return PricingEngine(self)
+
+
+@dataclass
+class _CostTable:
+    """Cheapest cost of ``n`` units; beyond the table ``step`` units cost ``step_price``."""
+
+    costs: list[int]
+    step: int
+    step_price: int
+
+    def cost(self, count: int) -> int:
+        limit = len(self.costs) - 1
+        if count <= limit:
+            return self.costs[count]
+        steps = -(-(count - limit) // self.step)
+        return self.costs[count - steps * self.step] + steps * self.step_price
+
+
+@dataclass
+class _Group:
+    quantity: int
+    price: int
+    skus_by_price: list[tuple[str, int]] = field(default_factory=list)
+
+
+def _cost_table(unit_price: int, deals: list[tuple[int, int]]) -> _CostTable:
+    deals = [(1, unit_price), *deals]
+    step, step_price = min(deals, key=lambda deal: (deal[1] / deal[0], deal[0]))
+    # Past max_quantity * step units some optimal basket always contains the
+    # best per-unit deal, so larger counts reuse the table one step down.
+    limit = max(quantity for quantity, _ in deals) * step
+    costs = [0] * (limit + 1)
+    for count in range(1, limit + 1):
+        costs[count] = min(costs[count - quantity] + price for quantity, price in deals if quantity <= count)
+    return _CostTable(costs, step, step_price)
+
+
+class PricingEngine:
+    """Prices baskets from a compiled ``PriceList``."""
+
+    def __init__(self, price_list: PriceList) -> None:
+        self._prices = dict(price_list.prices)
+        deals: dict[str, list[tuple[int, int]]] = {sku: [] for sku in self._prices}
+        self._free_items: list[tuple[str, int, str]] = []
+
+        for offer in price_list.multi_prices:
+            self._check_sku(offer.sku)
+            deals[offer.sku].append((offer.quantity, offer.price))
+        for offer in price_list.free_items:
+            self._check_sku(offer.sku)
+            self._check_sku(offer.free_sku)
+            if offer.free_sku == offer.sku:
+                deals[offer.sku].append((offer.quantity + 1, offer.quantity * self._prices[offer.sku]))
+            else:
+                self._free_items.append((offer.sku, offer.quantity, offer.free_sku))
+
+        self._groups: list[_Group] = []
+        grouped: set[str] = set()
+        for offer in price_list.group_offers:
+            for sku in offer.skus:
+                self._check_sku(sku)
+                if sku in grouped or deals[sku]:
+                    raise ValueError(f"SKU {sku!r} cannot be in a group offer and in another offer")
+                grouped.add(sku)
+            skus_by_price = sorted(((sku, self._prices[sku]) for sku in offer.skus), key=lambda item: -item[1])
+            self._groups.append(_Group(offer.quantity, offer.price, skus_by_price))
+
+        self._unit_prices = {sku: price for sku, price in self._prices.items() if not deals[sku] and sku not in grouped}
+        self._cost_tables = {sku: _cost_table(self._prices[sku], sku_deals) for sku, sku_deals in deals.items() if sku_deals}
+
+    def _check_sku(self, sku: str) -> None:
+        if sku not in self._prices:
+            raise ValueError(f"offer refers to unknown SKU {sku!r}")
+
+    def price(self, skus: str) -> int:
+        """Total for the basket, or -1 if it is not a string of known SKUs."""
+        if not isinstance(skus, str):
+            return -1
+        counts = Counter(skus)
+        if not counts.keys() <= self._prices.keys():
+            return -1
+
+        for sku, quantity, free_sku in self._free_items:
+            if counts[sku] >= quantity and counts[free_sku]:
+                counts[free_sku] = max(counts[free_sku] - counts[sku] // quantity, 0)
+
+        total = 0
+        for sku, count in counts.items():
+            unit_price = self._unit_prices.get(sku)
+            if unit_price is not None:
+                total += unit_price * count
+            elif sku in self._cost_tables:
+                total += self._cost_tables[sku].cost(count)
+        for group in self._groups:
+            total += self._group_cost(group, counts)
+        return total
+
+    @staticmethod
+    def _group_cost(group: _Group, counts: Counter) -> int:
+        # Bundling the priciest units first, chunk by chunk, and paying the
+        # cheaper of bundle and unit prices for each chunk is optimal.
+        total = 0
+        pending: list[int] = []
+        for sku, price in group.skus_by_price:
+            count = counts[sku]
+            while count and pending:
+                pending.append(price)
+                count -= 1
+                if len(pending) == group.quantity:
+                    total += min(sum(pending), group.price)
+                    pending = []
+            full, rest = divmod(count, group.quantity)
+            total += full * min(group.quantity * price, group.price)
+            pending.extend([price] * rest)
+        return total + sum(pending)
+
+
+DEFAULT_PRICE_LIST = PriceList(
+    prices={
+        "A": 50, "B": 30, "C": 20, "D": 15, "E": 40, "F": 10, "G": 20, "H": 10, "I": 35,
+        "J": 60, "K": 70, "L": 90, "M": 15, "N": 40, "O": 10, "P": 50, "Q": 30, "R": 50,
+        "S": 20, "T": 20, "U": 40, "V": 50, "W": 20, "X": 17, "Y": 20, "Z": 21,
+    },
+    multi_prices=[
+        MultiPrice("A", 3, 130), MultiPrice("A", 5, 200),
+        MultiPrice("B", 2, 45),
+        MultiPrice("H", 5, 45), MultiPrice("H", 10, 80),
+        MultiPrice("K", 2, 120),
+        MultiPrice("P", 5, 200),
+        MultiPrice("Q", 3, 80),
+        MultiPrice("V", 2, 90), MultiPrice("V", 3, 130),
+    ],
+    free_items=[
+        FreeItem("E", 2, "B"),
+        FreeItem("F", 2, "F"),
+        FreeItem("N", 3, "M"),
+        FreeItem("R", 3, "Q"),
+        FreeItem("U", 3, "U"),
+    ],
+    group_offers=[
+        GroupOffer(("S", "T", "X", "Y", "Z"), 3, 45),
+    ],
+)
+
+
+__all__ = ["DEFAULT_PRICE_LIST", "FreeItem", "GroupOffer", "MultiPrice", "PriceList", "PricingEngine"]
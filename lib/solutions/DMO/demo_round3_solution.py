@@ -1,12 +1,22 @@
+from solutions.DMO.inventory_store import InventoryStore
+
 
 class DemoRound3Solution:
-    
+
+    def __init__(self):
+        self._inventory = InventoryStore()
+
     def inventory_add(self, inventory_item, number):
-        raise NotImplementedError()
-    
+        self._inventory.add(inventory_item, number)
+
+    def inventory_add_many(self, entries):
+        self._inventory.add_many(entries)
+
     def inventory_size(self):
-        raise NotImplementedError()
+        return self._inventory.size
 
     def inventory_get(self, item_sku):
-        raise NotImplementedError()
-        
\ No newline at end of file
+        return self._inventory.get(item_sku)
+
+    def inventory_get_many(self, item_skus):
+        return self._inventory.get_many(item_skus)
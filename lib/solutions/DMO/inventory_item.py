@@ -1,7 +1,12 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class InventoryItem:
     sku: str
     name: str
-    price: int
+    price: int | float
+
+    def as_dict(self):
+        # Same result as dataclasses.asdict for these flat fields, without
+        # its recursive copy.
+        return {"sku": self.sku, "name": self.name, "price": self.price}
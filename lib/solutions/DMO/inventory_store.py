@@ -0,0 +1,89 @@
+"""Columnar inventory for ``DemoRound3Solution``.
+
+Records are stored column by column rather than as one object per SKU:
+names are interned (catalogues repeat them heavily), prices live in a
+double array and quantities in a machine-integer one, and a SKU hash index
+maps each SKU to its row. ``InventoryItem`` objects are only built when a record is
+read back.
+"""
+
+from __future__ import annotations
+
+import numbers
+import sys
+from array import array
+from typing import Iterable
+
+from solutions.DMO.inventory_item import InventoryItem
+
+
+class InventoryStore:
+    """SKU-indexed inventory with O(1) add, get and total quantity.
+
+    Adding an SKU that is already stocked increases its quantity and
+    replaces its name and price with the latest ones.
+    """
+
+    def __init__(self) -> None:
+        self._rows: dict[str, int] = {}
+        self._skus: list[str] = []
+        self._names: list[str] = []
+        # Whole-number prices come back as ints, as they were added.
+        self._prices = array("d")
+        self._quantities = array("q")
+        self._total_quantity = 0
+
+    def add(self, item: InventoryItem, number: int) -> None:
+        # Checked up front so that a bad record leaves every column untouched.
+        if not isinstance(number, int):
+            raise ValueError(f"number must be an integer, got {number!r}")
+        if number < 0:
+            raise ValueError("number must not be negative")
+        if not isinstance(item.price, numbers.Real):
+            raise ValueError(f"price must be a number, got {item.price!r}")
+        row = self._rows.get(item.sku)
+        if row is None:
+            self._rows[item.sku] = len(self._skus)
+            self._skus.append(item.sku)
+            self._names.append(sys.intern(item.name))
+            self._prices.append(item.price)
+            self._quantities.append(number)
+        else:
+            self._names[row] = sys.intern(item.name)
+            self._prices[row] = item.price
+            self._quantities[row] += number
+        self._total_quantity += number
+
+    def add_many(self, entries: Iterable[tuple[InventoryItem, int]]) -> None:
+        add = self.add
+        for item, number in entries:
+            add(item, number)
+
+    def get(self, sku: str) -> InventoryItem | None:
+        row = self._rows.get(sku)
+        if row is None:
+            return None
+        price = self._prices[row]
+        return InventoryItem(self._skus[row], self._names[row], int(price) if price.is_integer() else price)
+
+    def get_many(self, skus: Iterable[str]) -> list[InventoryItem | None]:
+        get = self.get
+        return [get(sku) for sku in skus]
+
+    def quantity(self, sku: str) -> int:
+        row = self._rows.get(sku)
+        return 0 if row is None else self._quantities[row]
+
+    @property
+    def size(self) -> int:
+        """Total quantity across all SKUs."""
+        return self._total_quantity
+
+    def __len__(self) -> int:
+        return len(self._skus)
+
+    def __contains__(self, sku: object) -> bool:
+        return sku in self._rows
+
+
+__all__ = ["InventoryStore"]
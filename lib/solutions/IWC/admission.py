@@ -0,0 +1,58 @@
+"""Capacity limits and overflow policies for ``Queue`` admission control."""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from enum import Enum
+
+from solutions.IWC.task_types import TaskSubmission
+
+
+class OverflowPolicy(Enum):
+    """What ``Queue.try_enqueue`` does when a submission would exceed a limit.
+
+    ``SHED_DEPRIORITISED`` evicts the most recently queued deprioritised
+    (bank_statements) tasks to make room under ``max_tasks``/``max_bytes``;
+    per-user and per-provider limits are never relieved by shedding, so a
+    submission over those is rejected. ``BLOCK`` waits up to
+    ``block_timeout`` seconds for other threads to dequeue.
+    """
+
+    REJECT = "reject"
+    SHED_DEPRIORITISED = "shed_deprioritised"
+    BLOCK = "block"
+
+
+@dataclass
+class QueueLimits:
+    """Bounds enforced on enqueue; ``None`` leaves a dimension unbounded."""
+
+    max_tasks: int | None = None
+    max_tasks_per_user: int | None = None
+    max_tasks_per_provider: int | None = None
+    max_bytes: int | None = None
+    policy: OverflowPolicy = OverflowPolicy.REJECT
+    block_timeout: float | None = 1.0
+
+
+_TASK_BASE_BYTES = (
+    sys.getsizeof(TaskSubmission(provider="", user_id=0, timestamp=""))
+    + sys.getsizeof({})
+    + 64  # queue dict slot, key tuple and index entries
+)
+_METADATA_ENTRY_BYTES = 100
+
+
+def estimate_task_bytes(task: TaskSubmission) -> int:
+    """Approximate resident cost of a queued task, in O(1)."""
+    timestamp = task.timestamp
+    timestamp_bytes = len(timestamp) + 49 if isinstance(timestamp, str) else 48
+    return (
+        _TASK_BASE_BYTES
+        + timestamp_bytes
+        + _METADATA_ENTRY_BYTES * len(task.metadata)
+    )
+
+
+__all__ = ["OverflowPolicy", "QueueLimits", "estimate_task_bytes"]
@@ -0,0 +1,296 @@
+"""Discrete-event capacity simulation driving the real ``Queue``.
+
+Arrivals, dispatches and completions are events on a virtual clock, so the
+queue's own scheduling rules (rule of three, bank_statements
+deprioritisation, dependencies, dedup) decide the dispatch order while hours
+of traffic run in seconds of wall time:
+
+```python
+simulator = CapacitySimulator(
+    arrivals=[PoissonArrivals("id_verification", rate_per_hour=600, users=5_000)],
+    service_times={"id_verification": exponential(mean=2.0)},
+    workers=2,
+    seed=7,
+)
+report = simulator.run(hours=1_000)
+print(report.summary())
+```
+"""
+
+from __future__ import annotations
+
+import csv
+import heapq
+import math
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, Iterator, Mapping, Sequence
+
+from solutions.IWC.queue_solution_legacy import Priority, Queue
+from solutions.IWC.task_types import TaskSubmission
+
+ServiceTime = Callable[[random.Random], float]
+
+SIMULATION_START = datetime(2026, 1, 1)
+
+
+def fixed(seconds: float) -> ServiceTime:
+    return lambda rng: seconds
+
+
+def exponential(mean: float) -> ServiceTime:
+    return lambda rng: rng.expovariate(1.0 / mean)
+
+
+def lognormal(mean: float, sigma: float) -> ServiceTime:
+    """Log-normal service time with the given mean; ``sigma`` sets the tail."""
+    mu = math.log(mean) - sigma ** 2 / 2
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+@dataclass
+class PoissonArrivals:
+    """Submissions for one provider at ``rate_per_hour``.
+
+    User ids are drawn uniformly from ``user_offset + range(users)``; a
+    per-user process is ``users=1``.
+    """
+
+    provider: str
+    rate_per_hour: float
+    users: int = 1_000
+    user_offset: int = 0
+
+    def events(self, rng: random.Random, duration: float) -> Iterator[tuple[float, str, int]]:
+        rate = self.rate_per_hour / 3600.0
+        if rate <= 0:
+            return
+        now = rng.expovariate(rate)
+        while now < duration:
+            yield now, self.provider, self.user_offset + rng.randrange(self.users)
+            now += rng.expovariate(rate)
+
+
+@dataclass
+class TraceArrivals:
+    """Replays recorded submissions given as ``(offset seconds, provider, user_id)``."""
+
+    rows: Sequence[tuple[float, str, int]]
+
+    @classmethod
+    def from_csv(cls, path: str) -> "TraceArrivals":
+        """Read a trace with ``provider`` and ``user_id`` columns.
+
+        Times come from an ``offset_seconds`` column or, failing that, an ISO
+        ``timestamp`` column taken relative to the earliest row.
+        """
+        with open(path, newline="") as trace_file:
+            records = list(csv.DictReader(trace_file))
+        if records and "offset_seconds" in records[0]:
+            offsets = [float(record["offset_seconds"]) for record in records]
+        else:
+            timestamps = [datetime.fromisoformat(record["timestamp"]) for record in records]
+            offsets = [(timestamp - min(timestamps)).total_seconds() for timestamp in timestamps] if timestamps else []
+        rows = [(offset, record["provider"], int(record["user_id"])) for offset, record in zip(offsets, records)]
+        return cls(sorted(rows))
+
+    def events(self, rng: random.Random, duration: float) -> Iterator[tuple[float, str, int]]:
+        for row in self.rows:
+            if row[0] >= duration:
+                return
+            yield row
+
+
+ArrivalProcess = PoissonArrivals | TraceArrivals
+
+
+class _VirtualClock:
+    def __init__(self) -> None:
+        self.seconds = 0.0
+
+    def __call__(self) -> datetime:
+        return SIMULATION_START + timedelta(seconds=self.seconds)
+
+
+def _percentile(ordered: Sequence[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+@dataclass
+class WaitStats:
+    count: int
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> "WaitStats":
+        ordered = sorted(samples)
+        return cls(
+            count=len(ordered),
+            p50=_percentile(ordered, 0.50),
+            p90=_percentile(ordered, 0.90),
+            p99=_percentile(ordered, 0.99),
+            max=ordered[-1] if ordered else 0.0,
+        )
+
+
+@dataclass
+class SimulationReport:
+    """Results of one run; times are in simulated seconds."""
+
+    duration: float
+    workers: int
+    arrivals: int
+    completed: int
+    busy_seconds: float
+    depth: list[tuple[float, int]] = field(default_factory=list)
+    waits_by_provider: dict[str, WaitStats] = field(default_factory=dict)
+    waits_by_tier: dict[str, WaitStats] = field(default_factory=dict)
+
+    @property
+    def throughput_per_hour(self) -> float:
+        return self.completed / self.duration * 3600.0 if self.duration else 0.0
+
+    @property
+    def utilisation(self) -> float:
+        return self.busy_seconds / (self.workers * self.duration) if self.duration else 0.0
+
+    @property
+    def final_depth(self) -> int:
+        return self.depth[-1][1] if self.depth else 0
+
+    def summary(self) -> str:
+        lines = [
+            f"{self.duration / 3600:.0f} h simulated, {self.workers} workers: "
+            f"{self.arrivals} submissions, {self.completed} dispatches completed",
+            f"throughput {self.throughput_per_hour:.1f}/h, utilisation {self.utilisation:.1%}, "
+            f"max depth {max((depth for _, depth in self.depth), default=0)}, final depth {self.final_depth}",
+            f"{'wait (s)':<24}{'count':>9}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}",
+        ]
+        for label, waits in (*self.waits_by_provider.items(), *self.waits_by_tier.items()):
+            lines.append(
+                f"{label:<24}{waits.count:>9}{waits.p50:>10.1f}{waits.p90:>10.1f}{waits.p99:>10.1f}{waits.max:>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+class CapacitySimulator:
+    """Runs arrival processes against ``workers`` identical workers.
+
+    ``queue_factory`` builds the queue under test from the virtual clock, so
+    any ``Queue`` configuration can be simulated. Every random draw comes
+    from ``seed``, so a run is reproducible.
+    """
+
+    def __init__(
+        self,
+        arrivals: Iterable[ArrivalProcess],
+        service_times: Mapping[str, ServiceTime],
+        workers: int,
+        seed: int = 0,
+        default_service_time: ServiceTime = exponential(1.0),
+        sample_interval: float = 300.0,
+        queue_factory: Callable[[Callable[[], datetime]], Queue] | None = None,
+    ) -> None:
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+        self._arrivals = list(arrivals)
+        self._service_times = dict(service_times)
+        self._default_service_time = default_service_time
+        self._workers = workers
+        self._seed = seed
+        self._sample_interval = sample_interval
+        self._queue_factory = queue_factory or (lambda clock: Queue(clock=clock))
+
+    def run(self, hours: float) -> SimulationReport:
+        duration = hours * 3600.0
+        clock = _VirtualClock()
+        queue = self._queue_factory(clock)
+        service_rng = random.Random(self._seed)
+        arrival_events = heapq.merge(*(
+            process.events(random.Random(self._seed * 1_000 + index + 1), duration)
+            for index, process in enumerate(self._arrivals)
+        ))
+
+        completions: list[float] = []
+        idle_workers = self._workers
+        arrivals = completed = 0
+        busy_seconds = 0.0
+        depth: list[tuple[float, int]] = []
+        next_sample = 0.0
+        waits_by_provider: dict[str, list[float]] = {}
+        waits_by_tier: dict[str, list[float]] = {}
+
+        next_arrival = next(arrival_events, None)
+        while next_arrival is not None or completions:
+            if completions and (next_arrival is None or completions[0] <= next_arrival[0]):
+                now = heapq.heappop(completions)
+                arrival = None
+            else:
+                now, provider, user_id = arrival = next_arrival
+                next_arrival = next(arrival_events, None)
+
+            while next_sample <= min(now, duration):
+                depth.append((next_sample, queue.size))
+                next_sample += self._sample_interval
+            clock.seconds = now
+
+            if arrival is None:
+                completed += 1
+                idle_workers += 1
+            else:
+                arrivals += 1
+                queue.enqueue(TaskSubmission(provider=provider, user_id=user_id, timestamp=clock()))
+
+            while idle_workers:
+                dispatched = queue.dequeue_submission()
+                if dispatched is None:
+                    break
+                task = dispatched.submission
+                wait = now - (task.timestamp - SIMULATION_START).total_seconds()
+                waits_by_provider.setdefault(task.provider, []).append(wait)
+                # The metadata holds the priority the queue dispatched it under.
+                tier_label = Priority.coerce(task.metadata.get("priority")).name.lower()
+                if dispatched.deprioritised:
+                    tier_label += " (deprioritised)"
+                waits_by_tier.setdefault(tier_label, []).append(wait)
+
+                service = self._service_times.get(task.provider, self._default_service_time)(service_rng)
+                busy_seconds += service
+                idle_workers -= 1
+                heapq.heappush(completions, now + service)
+
+        while next_sample <= duration:
+            depth.append((next_sample, queue.size))
+            next_sample += self._sample_interval
+
+        return SimulationReport(
+            duration=max(duration, clock.seconds),
+            workers=self._workers,
+            arrivals=arrivals,
+            completed=completed,
+            busy_seconds=busy_seconds,
+            depth=depth,
+            waits_by_provider={name: WaitStats.from_samples(samples) for name, samples in sorted(waits_by_provider.items())},
+            waits_by_tier={
+                name: WaitStats.from_samples(samples)
+                for name, samples in sorted(waits_by_tier.items(), key=lambda item: (Priority[item[0].split()[0].upper()], item[0]))
+            },
+        )
+
+
+__all__ = [
+    "CapacitySimulator",
+    "PoissonArrivals",
+    "SimulationReport",
+    "TraceArrivals",
+    "WaitStats",
+    "exponential",
+    "fixed",
+    "lognormal",
+]
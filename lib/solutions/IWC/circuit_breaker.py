@@ -0,0 +1,149 @@
+"""Per-provider circuit breakers fed by dispatch outcomes."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Deque, Mapping
+
+
+class BreakerState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class BreakerPolicy:
+    """``failure_threshold`` consecutive failures open the breaker.
+
+    After ``reset_timeout`` seconds open it lets ``half_open_probes`` tasks
+    through; a successful probe closes it, a failed one opens it again. A
+    probe that has not reported back within ``probe_timeout`` seconds gives
+    up its slot, so a lost completion cannot hold the breaker half-open.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    half_open_probes: int = 1
+    probe_timeout: float = 60.0
+
+
+class CircuitBreaker:
+    """Closed/open/half-open state machine for one provider.
+
+    The open to half-open transition happens lazily when ``state`` is read.
+    """
+
+    def __init__(self, policy: BreakerPolicy, clock: Callable[[], float] = time.monotonic) -> None:
+        self._policy = policy
+        self._clock = clock
+        self._state = BreakerState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_started: Deque[float] = deque()
+        self.times_opened = 0
+
+    @property
+    def state(self) -> BreakerState:
+        if self._state is BreakerState.OPEN and self._clock() - self._opened_at >= self._policy.reset_timeout:
+            self._state = BreakerState.HALF_OPEN
+            self._probe_started.clear()
+        return self._state
+
+    def try_acquire_probe(self) -> bool:
+        if self.state is not BreakerState.HALF_OPEN:
+            return False
+        now = self._clock()
+        probe_started = self._probe_started
+        while probe_started and now - probe_started[0] >= self._policy.probe_timeout:
+            probe_started.popleft()
+        if len(probe_started) >= self._policy.half_open_probes:
+            return False
+        probe_started.append(now)
+        return True
+
+    def release_probe(self) -> None:
+        """Return a probe slot that was acquired but not used."""
+        if self._probe_started:
+            self._probe_started.pop()
+
+    def release_all_probes(self) -> None:
+        self._probe_started.clear()
+
+    def record(self, success: bool) -> BreakerState:
+        state = self.state
+        if success:
+            if state is BreakerState.HALF_OPEN or state is BreakerState.CLOSED:
+                self._state = BreakerState.CLOSED
+                self._consecutive_failures = 0
+            # Late successes from calls made before the breaker opened do not
+            # close it; only a probe can.
+            return self._state
+
+        if state is BreakerState.HALF_OPEN:
+            self._open()
+        elif state is BreakerState.CLOSED:
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self._policy.failure_threshold:
+                self._open()
+        return self._state
+
+    def _open(self) -> None:
+        self._state = BreakerState.OPEN
+        self._opened_at = self._clock()
+        self._consecutive_failures = 0
+        self.times_opened += 1
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self._consecutive_failures,
+            "times_opened": self.times_opened,
+        }
+
+
+class ProviderCircuitBreakers:
+    """One ``CircuitBreaker`` per provider, created on first use.
+
+    ``clock`` returns seconds and defaults to ``time.monotonic``; it only has
+    to be monotonic, so tests and simulations can drive it by hand.
+    """
+
+    def __init__(
+        self,
+        policy_by_provider: Mapping[str, BreakerPolicy] | None = None,
+        default_policy: BreakerPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._policy_by_provider: dict[str, BreakerPolicy] = dict(policy_by_provider or {})
+        self._default_policy = default_policy or BreakerPolicy()
+        self._clock = clock
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def breaker(self, provider: str) -> CircuitBreaker:
+        breaker = self._breakers.get(provider)
+        if breaker is None:
+            policy = self._policy_by_provider.get(provider, self._default_policy)
+            breaker = self._breakers[provider] = CircuitBreaker(policy, self._clock)
+        return breaker
+
+    def is_closed(self, provider: str) -> bool:
+        breaker = self._breakers.get(provider)
+        return breaker is None or breaker.state is BreakerState.CLOSED
+
+    def record(self, provider: str, success: bool) -> BreakerState:
+        return self.breaker(provider).record(success)
+
+    def release_all_probes(self) -> None:
+        """Free every probe slot, e.g. once the tasks holding them are purged."""
+        for breaker in self._breakers.values():
+            breaker.release_all_probes()
+
+    def stats(self) -> dict[str, dict[str, object]]:
+        return {provider: breaker.as_dict() for provider, breaker in self._breakers.items()}
+
+
+__all__ = ["BreakerPolicy", "BreakerState", "CircuitBreaker", "ProviderCircuitBreakers"]
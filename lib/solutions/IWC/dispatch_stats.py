@@ -0,0 +1,48 @@
+"""Per-provider dispatch instrumentation fed by completed provider calls."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class ProviderDispatchStats:
+    """Running completion counters and latency summary for one provider."""
+
+    completed: int = 0
+    failed: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    ewma_latency: float = 0.0
+
+    smoothing: float = 0.2
+
+    def record(self, latency: float, success: bool) -> None:
+        if self.completed + self.failed == 0:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency += self.smoothing * (latency - self.ewma_latency)
+
+        if success:
+            self.completed += 1
+        else:
+            self.failed += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    @property
+    def mean_latency(self) -> float:
+        calls = self.completed + self.failed
+        return self.total_latency / calls if calls else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "completed": self.completed,
+            "failed": self.failed,
+            "mean_latency": self.mean_latency,
+            "max_latency": self.max_latency,
+            "ewma_latency": self.ewma_latency,
+        }
+
+
+__all__ = ["ProviderDispatchStats"]
@@ -0,0 +1,197 @@
+"""Shared-memory ingest ring between API processes and a scheduler process.
+
+API processes encode ``TaskSubmission`` records directly into a
+``multiprocessing.shared_memory`` block; one scheduler process drains them in
+batches into a ``Queue``. Nothing is pickled on the hot path and a full ring
+is reported back to the producer instead of growing without bound.
+
+```python
+ring = IngestRing.create(capacity=65536)
+
+# API process (the ring pickles as a handle to the same shared block)
+if not ring.put(TaskSubmission(provider="credit_check", user_id=1, timestamp=datetime.now())):
+    return {"status": "busy"}  # backpressure
+
+# scheduler process
+serve_ingest(ring, queue, stop_event)
+```
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+from typing import Sequence
+
+from solutions.IWC.queue_solution_legacy import Queue, REGISTERED_PROVIDERS
+from solutions.IWC.task_codec import TaskCodec
+from solutions.IWC.task_types import TaskSubmission
+
+# capacity, record size, head (records consumed), tail (records published), rejected puts
+_HEADER_FIELDS = 5
+_HEADER_SIZE = 64
+_CAPACITY, _RECORD_SIZE, _HEAD, _TAIL, _REJECTED = range(_HEADER_FIELDS)
+
+
+class IngestRing:
+    """Multi-producer, single-consumer ring of fixed-size task records.
+
+    Producers serialise on a process-shared lock while claiming a slot; the
+    consumer never takes the lock, it only reads the published tail and
+    advances the head once a batch has been decoded.
+    """
+
+    def __init__(
+        self,
+        shm: shared_memory.SharedMemory,
+        lock,
+        codec: TaskCodec,
+        owner: bool,
+    ) -> None:
+        self._shm = shm
+        self._lock = lock
+        self._codec = codec
+        self._owner = owner
+        self._header = shm.buf[:_HEADER_SIZE].cast("q")
+        self._capacity = self._header[_CAPACITY]
+        self._record_size = self._header[_RECORD_SIZE]
+
+    @classmethod
+    def create(
+        cls,
+        capacity: int,
+        name: str | None = None,
+        provider_names: Sequence[str] | None = None,
+    ) -> "IngestRing":
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        codec = TaskCodec(provider_names or [p.name for p in REGISTERED_PROVIDERS])
+        shm = shared_memory.SharedMemory(
+            name=name, create=True, size=_HEADER_SIZE + capacity * codec.record_size
+        )
+        header = shm.buf[:_HEADER_SIZE].cast("q")
+        header[_CAPACITY] = capacity
+        header[_RECORD_SIZE] = codec.record_size
+        header[_HEAD] = 0
+        header[_TAIL] = 0
+        header[_REJECTED] = 0
+        header.release()
+        return cls(shm, multiprocessing.Lock(), codec, owner=True)
+
+    def __getstate__(self) -> dict[str, object]:
+        return {"name": self._shm.name, "lock": self._lock, "codec": self._codec}
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        shm = shared_memory.SharedMemory(name=state["name"], create=False)
+        self.__init__(shm, state["lock"], state["codec"], owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def size(self) -> int:
+        return self._header[_TAIL] - self._header[_HEAD]
+
+    @property
+    def rejected(self) -> int:
+        return self._header[_REJECTED]
+
+    def _offset(self, sequence: int) -> int:
+        return _HEADER_SIZE + (sequence % self._capacity) * self._record_size
+
+    def _publish(self, task: TaskSubmission, count_rejection: bool) -> bool:
+        header = self._header
+        with self._lock:
+            tail = header[_TAIL]
+            if tail - header[_HEAD] >= self._capacity:
+                if count_rejection:
+                    header[_REJECTED] += 1
+                return False
+            self._codec.encode_into(self._shm.buf, self._offset(tail), task)
+            header[_TAIL] = tail + 1
+        return True
+
+    def try_put(self, task: TaskSubmission) -> bool:
+        """Publish ``task`` if a slot is free; ``False`` signals backpressure."""
+        return self._publish(task, count_rejection=True)
+
+    def put(self, task: TaskSubmission, timeout: float | None = 0.0) -> bool:
+        """Publish ``task``, waiting up to ``timeout`` seconds for the ring to drain.
+
+        ``timeout=None`` waits indefinitely. Returns ``False`` when the ring is
+        still full once the timeout has elapsed.
+        """
+        if self._publish(task, count_rejection=timeout == 0):
+            return True
+        if timeout == 0:
+            return False
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pause = 0.0001
+        while deadline is None or time.monotonic() < deadline:
+            time.sleep(pause)
+            pause = min(pause * 2, 0.01)
+            if self._publish(task, count_rejection=False):
+                return True
+        return self.try_put(task)
+
+    def drain(self, max_batch: int | None = None) -> list[TaskSubmission]:
+        """Decode and release up to ``max_batch`` records. Single consumer only."""
+        header = self._header
+        head = header[_HEAD]
+        available = header[_TAIL] - head
+        if max_batch is not None:
+            available = min(available, max_batch)
+        if available <= 0:
+            return []
+
+        buffer = self._shm.buf
+        decode = self._codec.decode_from
+        tasks = [decode(buffer, self._offset(head + i)) for i in range(available)]
+        header[_HEAD] = head + available
+        return tasks
+
+    def drain_into(self, queue: Queue, max_batch: int | None = None) -> int:
+        tasks = self.drain(max_batch)
+        for task in tasks:
+            queue.enqueue(task)
+        return len(tasks)
+
+    def close(self) -> None:
+        self._header.release()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+def serve_ingest(
+    ring: IngestRing,
+    queue: Queue,
+    stop_event,
+    max_batch: int = 256,
+    idle_interval: float = 0.001,
+) -> int:
+    """Scheduler-process loop: drain ``ring`` into ``queue`` until ``stop_event`` is set.
+
+    Whatever is still in the ring when the event is set is drained before
+    returning. Returns the number of records ingested.
+    """
+    ingested = 0
+    while not stop_event.is_set():
+        drained = ring.drain_into(queue, max_batch)
+        ingested += drained
+        if drained == 0:
+            time.sleep(idle_interval)
+
+    while drained := ring.drain_into(queue, max_batch):
+        ingested += drained
+    return ingested
+
+
+__all__ = ["IngestRing", "serve_ingest"]
@@ -0,0 +1,185 @@
+"""Pooled HTTP client used by queue workers to call the registered providers.
+
+Each provider gets a keep-alive connection pool for its ``base_url`` and a
+bound on the number of requests it may have in flight at once. Every call
+reports its latency and outcome through ``on_complete`` so the queue can
+account for it:
+
+```python
+client = ProviderClient(on_complete=queue.record_completion)
+task = queue.dequeue()
+response = client.fetch(task)
+if response.ok:
+    queue.record_result(task, response.body)
+```
+"""
+
+from __future__ import annotations
+
+import http.client
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Mapping
+from urllib.parse import urlsplit
+
+from solutions.IWC.queue_solution_legacy import Provider, REGISTERED_PROVIDERS
+from solutions.IWC.task_types import TaskDispatch
+
+
+class ProviderClientError(Exception):
+    """Raised when a provider call fails before an HTTP response is received."""
+
+
+@dataclass
+class ProviderResponse:
+    provider: str
+    user_id: int
+    status: int
+    body: bytes
+    latency: float
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+
+class _ConnectionPool:
+    """LIFO pool of idle keep-alive connections to one origin."""
+
+    def __init__(self, base_url: str, timeout: float) -> None:
+        parts = urlsplit(base_url)
+        if parts.scheme == "https":
+            self._connection_class = http.client.HTTPSConnection
+        elif parts.scheme == "http":
+            self._connection_class = http.client.HTTPConnection
+        else:
+            raise ValueError(f"Unsupported provider URL {base_url!r}")
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path_prefix = parts.path.rstrip("/")
+        self._timeout = timeout
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+    def path_for(self, path: str) -> str:
+        return f"{self._path_prefix}{path}"
+
+    def acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Return a connection and whether it was reused from the pool."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+            self.connections_opened += 1
+        return self._connection_class(self._host, self._port, timeout=self._timeout), False
+
+    def release(self, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle.append(connection)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+class ProviderClient:
+    """Dispatches ``TaskDispatch`` requests to providers over pooled connections.
+
+    ``max_in_flight`` bounds concurrent requests per provider (an int for all
+    providers or a mapping by provider name); callers beyond the bound block
+    until a slot frees up. ``base_urls`` overrides a provider's ``base_url``,
+    which is how tests point the client at a local stub server.
+    """
+
+    def __init__(
+        self,
+        providers: Iterable[Provider] = REGISTERED_PROVIDERS,
+        max_in_flight: int | Mapping[str, int] = 8,
+        timeout: float = 5.0,
+        base_urls: Mapping[str, str] | None = None,
+        keep_alive: bool = True,
+        on_complete: Callable[[TaskDispatch, float, bool], None] | None = None,
+    ) -> None:
+        base_urls = base_urls or {}
+        self._keep_alive = keep_alive
+        self._on_complete = on_complete
+        self._pools: dict[str, _ConnectionPool] = {}
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+
+        for provider in providers:
+            limit = max_in_flight if isinstance(max_in_flight, int) else max_in_flight.get(provider.name, 8)
+            self._pools[provider.name] = _ConnectionPool(base_urls.get(provider.name, provider.base_url), timeout)
+            self._slots[provider.name] = threading.BoundedSemaphore(limit)
+
+    def _request(self, pool: _ConnectionPool, path: str) -> tuple[int, bytes]:
+        connection, reused = pool.acquire()
+        try:
+            connection.request(
+                "GET",
+                pool.path_for(path),
+                headers={"Connection": "keep-alive" if self._keep_alive else "close"},
+            )
+            response = connection.getresponse()
+            body = response.read()
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+            connection.close()
+            if not reused:
+                raise
+            # The server dropped an idle keep-alive connection; GETs are safe to replay once.
+            return self._request(pool, path)
+        except BaseException:
+            connection.close()
+            raise
+
+        if self._keep_alive and not response.will_close:
+            pool.release(connection)
+        else:
+            connection.close()
+        return response.status, body
+
+    def fetch(self, task: TaskDispatch) -> ProviderResponse:
+        pool = self._pools.get(task.provider)
+        if pool is None:
+            raise ValueError(f"Provider {task.provider!r} is not registered with this client")
+
+        with self._slots[task.provider]:
+            started = time.perf_counter()
+            try:
+                status, body = self._request(pool, f"/users/{task.user_id}")
+            except (OSError, http.client.HTTPException) as error:
+                self._report(task, time.perf_counter() - started, False)
+                raise ProviderClientError(f"{task.provider} request failed: {error}") from error
+            latency = time.perf_counter() - started
+
+        response = ProviderResponse(
+            provider=task.provider,
+            user_id=task.user_id,
+            status=status,
+            body=body,
+            latency=latency,
+        )
+        self._report(task, latency, response.ok)
+        return response
+
+    def _report(self, task: TaskDispatch, latency: float, success: bool) -> None:
+        if self._on_complete is not None:
+            self._on_complete(task, latency, success)
+
+    def connections_opened(self, provider: str) -> int:
+        return self._pools[provider].connections_opened
+
+    def close(self) -> None:
+        for pool in self._pools.values():
+            pool.close()
+
+    def __enter__(self) -> "ProviderClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+__all__ = ["ProviderClient", "ProviderClientError", "ProviderResponse"]
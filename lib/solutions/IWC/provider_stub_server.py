@@ -0,0 +1,133 @@
+"""Local HTTP stand-in for the registered providers.
+
+Serves every provider from one ``ThreadingHTTPServer`` under ``/<provider>/``
+and simulates each provider's latency and error rate, so the client layer
+can be exercised and benchmarked without leaving the machine.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Mapping
+
+from solutions.IWC.queue_solution_legacy import REGISTERED_PROVIDERS
+
+
+@dataclass
+class StubBehaviour:
+    """Latency is drawn uniformly from ``latency ± jitter`` seconds."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "_StubHTTPServer"
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.count_connection()
+
+    def do_GET(self) -> None:
+        provider, _, rest = self.path.lstrip("/").partition("/")
+        behaviour = self.server.behaviours.get(provider)
+        if behaviour is None:
+            self._respond(404, {"error": f"unknown provider {provider}"})
+            return
+
+        delay, failed = self.server.draw(behaviour)
+        if delay > 0:
+            time.sleep(delay)
+        if failed:
+            self._respond(behaviour.error_status, {"error": f"{provider} unavailable"})
+        else:
+            self._respond(200, {"provider": provider, "resource": rest})
+
+    def _respond(self, status: int, payload: dict[str, str]) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, behaviours: Mapping[str, StubBehaviour], seed: int | None) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.behaviours = dict(behaviours)
+        self.connections_accepted = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def handle_error(self, request, client_address) -> None:
+        # Clients that time out hang up mid-response; that is expected here.
+        pass
+
+    def count_connection(self) -> None:
+        with self._lock:
+            self.connections_accepted += 1
+
+    def draw(self, behaviour: StubBehaviour) -> tuple[float, bool]:
+        with self._lock:
+            delay = behaviour.latency + self._random.uniform(-behaviour.jitter, behaviour.jitter)
+            failed = self._random.random() < behaviour.error_rate
+        return max(delay, 0.0), failed
+
+
+class ProviderStubServer:
+    """Runs the stub server on a background thread for the life of a ``with`` block."""
+
+    def __init__(
+        self,
+        behaviours: Mapping[str, StubBehaviour] | None = None,
+        seed: int | None = None,
+    ) -> None:
+        if behaviours is None:
+            behaviours = {provider.name: StubBehaviour() for provider in REGISTERED_PROVIDERS}
+        self._server = _StubHTTPServer(behaviours, seed)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    @property
+    def base_urls(self) -> dict[str, str]:
+        host, port = self._server.server_address[:2]
+        return {name: f"http://{host}:{port}/{name}" for name in self._server.behaviours}
+
+    @property
+    def connections_accepted(self) -> int:
+        return self._server.connections_accepted
+
+    def start(self) -> "ProviderStubServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> "ProviderStubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+__all__ = ["ProviderStubServer", "StubBehaviour"]
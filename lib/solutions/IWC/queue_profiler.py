@@ -0,0 +1,302 @@
+"""Low-overhead profiling of the queue hot path, switchable at runtime.
+
+``Queue`` wraps its hot path in named phases (``enqueue``, ``dequeue`` and,
+inside them, ``collect_dependencies``, ``user_regrouping``,
+``metadata_rewrite`` and ``final_sort``). With profiling off the markers are
+a shared ``nullcontext``. With a ``QueueProfiler`` attached:
+
+* every phase records its call count, wall time and, with
+  ``trace_allocations=True``, the net and peak bytes ``tracemalloc`` saw
+  while it ran;
+* a sampler thread periodically reads ``sys._current_frames()`` for threads
+  inside a phase and counts their stacks, prefixed by the phase path;
+* every ``flush_interval`` seconds the counted stacks are written as
+  ``stacks-NNNNNN.folded`` (collapsed stacks, the input format of
+  flamegraph.pl and speedscope) next to ``report-NNNNNN.txt`` with the phase
+  table and, when tracing allocations, the top allocation sites since the
+  previous report. Only the last ``max_files`` of each are kept.
+
+The sampler times itself and lengthens its interval so that it never takes
+more than ``max_overhead`` of wall time; the measured figure is reported
+as ``sampler_overhead``. Phase markers and sampling cost little enough to
+leave on; ``tracemalloc`` slows every allocation down (several times over on
+the dequeue path), so allocation tracing is opt-in for short investigations.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Deque
+
+PHASES = (
+    "enqueue",
+    "dequeue",
+    "collect_dependencies",
+    "user_regrouping",
+    "metadata_rewrite",
+    "final_sort",
+)
+
+
+@dataclass
+class ProfilingPolicy:
+    """Where reports go and how often; intervals are in seconds.
+
+    ``max_overhead`` is the fraction of wall time the sampler may use.
+    """
+
+    output_dir: str = "queue_profiles"
+    sample_interval: float = 0.005
+    flush_interval: float = 10.0
+    max_files: int = 12
+    top_n: int = 20
+    trace_allocations: bool = False
+    tracemalloc_frames: int = 1
+    max_overhead: float = 0.02
+    max_stack_depth: int = 64
+
+
+@dataclass
+class PhaseStats:
+    calls: int = 0
+    seconds: float = 0.0
+    net_bytes: int = 0
+    peak_bytes: int = 0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "calls": self.calls,
+            "seconds": self.seconds,
+            "mean_seconds": self.seconds / self.calls if self.calls else 0.0,
+            "net_bytes": self.net_bytes,
+            "peak_bytes": self.peak_bytes,
+        }
+
+
+class _NullProfiler:
+    _null_phase = contextlib.nullcontext()
+
+    def phase(self, name: str) -> contextlib.AbstractContextManager:
+        return self._null_phase
+
+
+NULL_PROFILER = _NullProfiler()
+
+
+class _Phase:
+    __slots__ = ("_profiler", "_name", "_thread_id", "_parent", "_traced", "_started", "_start_bytes", "_peak_seen")
+
+    def __init__(self, profiler: "QueueProfiler", name: str) -> None:
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self) -> None:
+        profiler = self._profiler
+        self._thread_id = threading.get_ident()
+        self._parent = profiler._active.get(self._thread_id, ())
+        profiler._active[self._thread_id] = (*self._parent, self._name)
+        self._traced = profiler._tracing
+        if self._traced:
+            self._start_bytes = self._peak_seen = tracemalloc.get_traced_memory()[0]
+            # The traced peak is global: each phase resets it on entry and
+            # hands the peak it saw to the enclosing phase on exit.
+            tracemalloc.reset_peak()
+            profiler._open_phases.setdefault(self._thread_id, []).append(self)
+        self._started = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        elapsed = time.perf_counter() - self._started
+        profiler = self._profiler
+        stats = profiler._phases[self._name]
+        stats.calls += 1
+        stats.seconds += elapsed
+        if self._traced:
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, self._peak_seen)
+            stats.net_bytes += current - self._start_bytes
+            stats.peak_bytes = max(stats.peak_bytes, peak - self._start_bytes)
+            open_phases = profiler._open_phases[self._thread_id]
+            open_phases.pop()
+            if open_phases:
+                open_phases[-1]._peak_seen = max(open_phases[-1]._peak_seen, peak)
+            else:
+                del profiler._open_phases[self._thread_id]
+        if self._parent:
+            profiler._active[self._thread_id] = self._parent
+        else:
+            profiler._active.pop(self._thread_id, None)
+
+
+class QueueProfiler:
+    """Phase timing, stack sampling and allocation reports for one ``Queue``.
+
+    Attach with ``Queue.set_profiler`` (or ``QueueSolutionEntrypoint.
+    enable_profiling``); ``start`` launches the sampler and ``stop`` writes a
+    final report.
+    """
+
+    def __init__(self, policy: ProfilingPolicy | None = None) -> None:
+        self._policy = policy or ProfilingPolicy()
+        self._phases: dict[str, PhaseStats] = {name: PhaseStats() for name in PHASES}
+        self._active: dict[int, tuple[str, ...]] = {}
+        self._open_phases: dict[int, list[_Phase]] = {}
+        self._stacks: Counter[str] = Counter()
+        self._frame_labels: dict[object, str] = {}
+        self._tracing = False
+        self._started_tracemalloc = False
+        self._previous_snapshot: tracemalloc.Snapshot | None = None
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._sequence = 0
+        self._written: Deque[tuple[str, ...]] = deque()
+        self._samples = 0
+        self._sampler_seconds = 0.0
+        self._interval = self._policy.sample_interval
+        self._started_at = 0.0
+        self._stopped_at: float | None = None
+
+    @property
+    def output_dir(self) -> str:
+        return self._policy.output_dir
+
+    def phase(self, name: str) -> _Phase:
+        return _Phase(self, name)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        os.makedirs(self._policy.output_dir, exist_ok=True)
+        if self._policy.trace_allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self._policy.tracemalloc_frames)
+                self._started_tracemalloc = True
+            self._previous_snapshot = self._snapshot()
+            self._tracing = True
+        self._started_at = time.perf_counter()
+        self._stopped_at = None
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="queue-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self.flush()
+        self._stopped_at = time.perf_counter()
+        self._tracing = False
+        self._previous_snapshot = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _run(self) -> None:
+        policy = self._policy
+        next_flush = time.perf_counter() + policy.flush_interval
+        while not self._stop_event.wait(self._interval):
+            started = time.perf_counter()
+            self._sample()
+            if started >= next_flush:
+                self.flush()
+                next_flush = started + policy.flush_interval
+            cost = time.perf_counter() - started
+            self._sampler_seconds += cost
+            # Sampling runs under the GIL, so its cost comes straight out of
+            # the queue's time; stretch the interval to stay within budget.
+            self._interval = max(policy.sample_interval, cost / policy.max_overhead)
+
+    def _sample(self) -> None:
+        self._samples += 1
+        active = dict(self._active)
+        if not active:
+            return
+        frames = sys._current_frames()
+        for thread_id, phases in active.items():
+            frame = frames.get(thread_id)
+            if frame is not None:
+                self._stacks[";".join((*phases, *self._frame_path(frame)))] += 1
+
+    def _frame_path(self, frame) -> list[str]:
+        labels = self._frame_labels
+        path = []
+        depth = self._policy.max_stack_depth
+        while frame is not None and depth:
+            code = frame.f_code
+            label = labels.get(code)
+            if label is None:
+                label = labels[code] = f"{code.co_name} ({os.path.basename(code.co_filename)})"
+            path.append(label)
+            frame = frame.f_back
+            depth -= 1
+        path.reverse()
+        return path
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+
+    def flush(self) -> None:
+        """Write the stacks sampled since the last flush and an allocation report."""
+        with self._flush_lock:
+            stacks, self._stacks = self._stacks, Counter()
+            self._sequence += 1
+            stacks_path = os.path.join(self._policy.output_dir, f"stacks-{self._sequence:06d}.folded")
+            report_path = os.path.join(self._policy.output_dir, f"report-{self._sequence:06d}.txt")
+            with open(stacks_path, "w") as stacks_file:
+                for stack, count in stacks.most_common():
+                    stacks_file.write(f"{stack} {count}\n")
+            with open(report_path, "w") as report_file:
+                report_file.write(self._report())
+
+            self._written.append((stacks_path, report_path))
+            while len(self._written) > self._policy.max_files:
+                for path in self._written.popleft():
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(path)
+
+    def _report(self) -> str:
+        stats = self.stats()
+        lines = [
+            f"samples {stats['samples']}, sampler overhead {stats['sampler_overhead']:.2%}, "
+            f"interval {stats['sample_interval'] * 1e3:.1f} ms",
+            "",
+            f"{'phase':<22}{'calls':>10}{'total s':>12}{'mean us':>12}{'net KiB':>12}{'peak KiB':>12}",
+        ]
+        for name, phase in stats["phases"].items():
+            lines.append(
+                f"{name:<22}{phase['calls']:>10}{phase['seconds']:>12.3f}{phase['mean_seconds'] * 1e6:>12.1f}"
+                f"{phase['net_bytes'] / 1024:>12.1f}{phase['peak_bytes'] / 1024:>12.1f}"
+            )
+        if self._tracing:
+            snapshot = self._snapshot()
+            lines += ["", f"top {self._policy.top_n} allocation sites since the previous report:"]
+            for difference in snapshot.compare_to(self._previous_snapshot, "lineno")[: self._policy.top_n]:
+                lines.append(str(difference))
+            self._previous_snapshot = snapshot
+        return "\n".join(lines) + "\n"
+
+    def stats(self) -> dict[str, object]:
+        elapsed = (self._stopped_at or time.perf_counter()) - self._started_at if self._started_at else 0.0
+        return {
+            "phases": {name: phase.as_dict() for name, phase in self._phases.items()},
+            "samples": self._samples,
+            "sample_interval": self._interval,
+            "sampler_seconds": self._sampler_seconds,
+            "sampler_overhead": self._sampler_seconds / elapsed if elapsed else 0.0,
+            "reports_written": self._sequence,
+        }
+
+
+__all__ = ["NULL_PROFILER", "PHASES", "PhaseStats", "ProfilingPolicy", "QueueProfiler"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from solutions.IWC.queue_profiler import ProfilingPolicy, QueueProfiler
 from solutions.IWC.queue_solution_legacy import Queue
 from solutions.IWC.task_types import TaskDispatch, TaskSubmission
 
@@ -9,6 +10,7 @@ class QueueSolutionEntrypoint:
 
     def __init__(self) -> None:
         self._queue: Queue = Queue()
+        self._profiler: QueueProfiler | None = None
 
     def enqueue(self, task: TaskSubmission) -> int:
         return self._queue.enqueue(task)
@@ -25,3 +27,22 @@ class QueueSolutionEntrypoint:
     def purge(self) -> bool:
         return self._queue.purge()
 
+    def stats(self) -> dict[str, object]:
+        return self._queue.stats()
+
+    def enable_profiling(self, policy: ProfilingPolicy | None = None) -> str:
+        """Start profiling the queue; returns the directory reports are written to."""
+        if self._profiler is None:
+            self._profiler = QueueProfiler(policy)
+            self._queue.set_profiler(self._profiler)
+            self._profiler.start()
+        return self._profiler.output_dir
+
+    def disable_profiling(self) -> dict[str, object] | None:
+        """Stop profiling, write a final report and return the profiler's stats."""
+        if self._profiler is None:
+            return None
+        profiler, self._profiler = self._profiler, None
+        self._queue.set_profiler(None)
+        profiler.stop()
+        return profiler.stats()
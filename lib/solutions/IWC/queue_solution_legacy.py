@@ -1,16 +1,37 @@
+import contextlib
+import heapq
+import itertools
+import numbers
+import random
+import threading
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from datetime import datetime
-from enum import IntEnum
-from typing import Dict, Tuple, List
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Callable, Deque, Dict, Tuple, List, Mapping
 
 # LEGACY CODE ASSET
 # RESOLVED on deploy
-from solutions.IWC.task_types import TaskSubmission, TaskDispatch
-
-class Priority(IntEnum):
-    """Represents the queue ordering tiers observed in the legacy system."""
-    HIGH = 1
-    NORMAL = 2
+from solutions.IWC.task_types import DispatchedSubmission, Priority, TaskSubmission, TaskDispatch, EnqueueOutcome
+from solutions.IWC.admission import OverflowPolicy, QueueLimits, estimate_task_bytes
+from solutions.IWC.circuit_breaker import BreakerState, ProviderCircuitBreakers
+from solutions.IWC.result_cache import ProviderResultCache
+from solutions.IWC.dispatch_stats import ProviderDispatchStats
+from solutions.IWC.retry_policy import DEFAULT_RETRY_POLICY, RetryPolicy
+from solutions.IWC.task_codec import TaskCodec, from_micros, to_micros
+from solutions.IWC.task_spill import SpillFile, TieringPolicy
+from solutions.IWC.queue_profiler import NULL_PROFILER, QueueProfiler
+
+class SchedulingMode(Enum):
+    """Dispatch ordering used by ``Queue``; chosen at construction."""
+    LEGACY = "legacy"
+    FAIR_SHARE = "fair_share"
+    DEADLINE = "deadline"
+
+DEFAULT_FAIR_SHARE_WEIGHTS: Mapping[Priority, int] = {
+    Priority.HIGH: 2,
+    Priority.NORMAL: 1,
+}
 
 @dataclass
 class Provider:
@@ -20,6 +41,13 @@ class Provider:
 
 MAX_TIMESTAMP = datetime.max.replace(tzinfo=None)
 
+# Internal age at which a deprioritised task regains its normal place.
+REPRIORITISE_AFTER_SECONDS = 300
+
+# Spill heap entries pack (timestamp micros, slot) into one int.
+_SLOT_BITS = 32
+_SLOT_MASK = (1 << _SLOT_BITS) - 1
+
 COMPANIES_HOUSE_PROVIDER = Provider(
     name="companies_house", base_url="https://fake.companieshouse.co.uk", depends_on=[]
 )
@@ -49,12 +77,128 @@ REGISTERED_PROVIDERS: list[Provider] = [
 ]
 
 class Queue:
-    def __init__(self):
+    def __init__(
+        self,
+        result_cache: ProviderResultCache | None = None,
+        scheduling: SchedulingMode = SchedulingMode.LEGACY,
+        fair_share_weights: Mapping[Priority, int] | None = None,
+        fair_share_quantum: int = 1,
+        clock: Callable[[], datetime] | None = None,
+        deadline_at_risk_window: timedelta = timedelta(seconds=60),
+        limits: QueueLimits | None = None,
+        tiering: TieringPolicy | None = None,
+        retry_policies: Mapping[str, RetryPolicy] | None = None,
+        rng: random.Random | None = None,
+        circuit_breakers: ProviderCircuitBreakers | None = None,
+        profiler: QueueProfiler | None = None,
+    ):
         self._queue: Dict[Tuple[str, str], TaskSubmission] = {}
         self._deprioritised_providers: List[str] = [BANK_STATEMENTS_PROVIDER.name]
 
         self._oldest_task_timestamp: datetime | None = None
         self._newest_task_timestamp: datetime | None = None
+        # Queued tasks per timestamp (in microseconds), with a min-heap and a
+        # max-heap over the timestamps to keep the bounds above current in
+        # O(log n). Heap entries whose count has dropped to zero are skipped
+        # when they reach the top.
+        self._timestamp_counts: Dict[int, int] = {}
+        self._oldest_heap: List[int] = []
+        self._newest_heap: List[int] = []
+        # Without a clock this is the queue's time once it has drained.
+        self._latest_submission_timestamp: datetime | None = None
+
+        self._result_cache = result_cache
+        self._dispatch_stats: Dict[str, ProviderDispatchStats] = {}
+
+        # Every queued key carries the sequence number it was inserted with. Mode
+        # specific indexes store (sequence, key) and drop entries whose sequence
+        # no longer matches, so removals never have to search them.
+        self._scheduling = scheduling
+        self._task_sequences: Dict[Tuple[str, str], int] = {}
+        self._next_sequence = 0
+
+        # Deficit round robin state for SchedulingMode.FAIR_SHARE.
+        self._fair_share_weights = dict(fair_share_weights or DEFAULT_FAIR_SHARE_WEIGHTS)
+        self._fair_share_quantum = fair_share_quantum
+        self._active_users: Deque[int] = deque()
+        self._user_fifos: Dict[int, Deque[Tuple[int, Tuple[str, str]]]] = {}
+        self._user_deficits: Dict[int, int] = {}
+        self._head_user_credited = False
+
+        # Earliest-deadline-first state for SchedulingMode.DEADLINE. Without a
+        # clock, "now" is the newest submission timestamp, the same notion of
+        # time the bank_statements reprioritisation rule uses.
+        self._clock = clock
+        self._deadline_at_risk_window = deadline_at_risk_window
+        self._deadline_heap: List[Tuple[datetime, int, Tuple[str, str]]] = []
+        self._tier_heaps: Dict[Priority, List[Tuple[datetime, datetime, int, Tuple[str, str]]]] = {}
+        self._deadlines_missed = 0
+        self._deadlines_promoted = 0
+
+        # Capacity accounting, updated in O(1) on every insert and removal.
+        # Deprioritised keys are kept in insertion order so shedding can take the
+        # most recently queued one first.
+        self._limits = limits
+        self._user_counts: Dict[int, int] = {}
+        self._provider_counts: Dict[str, int] = {}
+        self._task_bytes: Dict[Tuple[str, str], int] = {}
+        self._bytes_used = 0
+        self._deprioritised_keys: OrderedDict[Tuple[str, str], None] = OrderedDict()
+        self._admitted = 0
+        self._rejected = 0
+        self._shed = 0
+        self._capacity_changed: threading.Condition | None = None
+        if limits is not None and limits.policy is OverflowPolicy.BLOCK:
+            self._capacity_changed = threading.Condition(threading.RLock())
+
+        # Cold tier: deprioritised tasks that cannot be dispatched soon live as
+        # records in a memory-mapped file. Only key -> slot and a heap of packed
+        # (timestamp micros, slot) ints stay in memory; a heap entry is stale once
+        # its slot no longer holds a record with that timestamp.
+        if tiering is not None and scheduling is not SchedulingMode.LEGACY:
+            raise ValueError("Tiered storage is only supported with SchedulingMode.LEGACY")
+        if tiering is not None and circuit_breakers is not None:
+            # Parking only reaches resident tasks: a spilled task of an open
+            # provider would count as ready and then be parked on fault-in.
+            raise ValueError("Tiered storage cannot be combined with circuit breakers")
+        self._tiering = tiering
+        self._spill_file: SpillFile | None = None
+        if tiering is not None:
+            codec = TaskCodec([provider.name for provider in REGISTERED_PROVIDERS])
+            self._spill_file = SpillFile(codec, tiering.path)
+        self._spilled: Dict[Tuple[str, str], int] = {}
+        self._spill_order: List[int] = []
+        self._spilled_total = 0
+        self._faulted_in = 0
+
+        # Submissions with a future not_before wait in a heap keyed by ready
+        # time and go through the normal enqueue path once due, so checking
+        # for due tasks costs O(log n) per promotion. Failed attempts are
+        # counted per key until the provider completes the task.
+        self._delayed: List[Tuple[datetime, int, TaskSubmission]] = []
+        self._delayed_sequence = itertools.count()
+        self._retry_policies = dict(retry_policies or {})
+        self._rng = rng or random.Random()
+        self._attempts: Dict[Tuple[str, str], int] = {}
+        self._retries_exhausted = 0
+
+        # While a provider's breaker is not closed its tasks, and tasks of the
+        # same user that depend on them, are parked per provider outside the
+        # dispatch indexes. _provider_keys indexes resident keys by provider so
+        # opening a breaker parks them without scanning the queue. _probe_keys
+        # holds probes let through but not yet dispatched: one removed any other
+        # way hands its slot back to the breaker.
+        self._circuit_breakers = circuit_breakers
+        self._parked: Dict[str, OrderedDict[Tuple[str, str], TaskSubmission]] = {}
+        self._provider_keys: Dict[str, Dict[Tuple[str, str], None]] = {}
+        self._probe_keys: Dict[Tuple[str, str], None] = {}
+        self._prerequisites: Dict[str, List[str]] = {p.name: p.depends_on for p in REGISTERED_PROVIDERS}
+        self._dependents: Dict[str, List[str]] = {
+            p.name: [d.name for d in REGISTERED_PROVIDERS if p.name in d.depends_on] for p in REGISTERED_PROVIDERS
+        }
+
+        # Phase markers on the hot path; a shared nullcontext unless profiling.
+        self._profiler = profiler or NULL_PROFILER
 
     def _collect_dependencies(self, task: TaskSubmission) -> list[TaskSubmission]:
         provider = next((p for p in REGISTERED_PROVIDERS if p.name == task.provider), None)
@@ -68,6 +212,8 @@ class Queue:
                 user_id=task.user_id,
                 timestamp=task.timestamp,
             )
+            if "deadline" in task.metadata:
+                dependency_task.metadata["deadline"] = task.metadata["deadline"]
             tasks.extend(self._collect_dependencies(dependency_task))
             tasks.append(dependency_task)
         return tasks
@@ -79,18 +225,13 @@ class Queue:
 
     def _should_reprioritise_deprioritised_task(self, task: TaskSubmission) -> bool:
         task_internal_age = int((self._newest_task_timestamp - self._timestamp_for_task(task)).total_seconds())
-        is_task_internal_age_above_limit = task_internal_age >= 300
+        is_task_internal_age_above_limit = task_internal_age >= REPRIORITISE_AFTER_SECONDS
 
         return self._should_deprioritise_task(task) and is_task_internal_age_above_limit
 
     @staticmethod
     def _priority_for_task(task):
-        metadata = task.metadata
-        raw_priority = metadata.get("priority", Priority.NORMAL)
-        try:
-            return Priority(raw_priority)
-        except (TypeError, ValueError):
-            return Priority.NORMAL
+        return Priority.coerce(task.metadata.get("priority", Priority.NORMAL))
 
     @staticmethod
     def _earliest_group_timestamp_for_task(task):
@@ -103,129 +244,915 @@ class Queue:
         return metadata.get("complexity_weighting", 1)
 
     @staticmethod
-    def _timestamp_for_task(task):
-        timestamp = task.timestamp
+    def _normalise_timestamp(timestamp):
         if isinstance(timestamp, datetime):
-            return timestamp.replace(tzinfo=None)
+            return timestamp if timestamp.tzinfo is None else timestamp.replace(tzinfo=None)
         if isinstance(timestamp, str):
             return datetime.fromisoformat(timestamp).replace(tzinfo=None)
         return timestamp
 
+    @staticmethod
+    def _timestamp_for_task(task):
+        return Queue._normalise_timestamp(task.timestamp)
+
+    @staticmethod
+    def _deadline_for_task(task):
+        deadline = task.metadata.get("deadline")
+        if deadline is None:
+            return None
+        return Queue._normalise_timestamp(deadline)
+
+    def _now(self):
+        if self._clock is not None:
+            return self._normalise_timestamp(self._clock())
+        return self._newest_task_timestamp
+
+    def _has_fresh_result(self, task: TaskSubmission) -> bool:
+        if self._result_cache is None:
+            return False
+        return self._result_cache.is_fresh(task.user_id, task.provider)
+
+    def _synchronised(self):
+        # Only a blocking overflow policy makes the queue shared between threads.
+        if self._capacity_changed is None:
+            return contextlib.nullcontext()
+        return self._capacity_changed
+
+    def _is_queued(self, task_key):
+        return task_key in self._queue or task_key in self._spilled or self._is_parked(task_key)
+
+    def _capacity_violation(self, tasks):
+        limits = self._limits
+        new_tasks = [t for t in tasks if not self._is_queued((t.user_id, t.provider))]
+        if not new_tasks:
+            return None
+
+        if limits.max_tasks is not None and self._queued_size + len(new_tasks) > limits.max_tasks:
+            return "max_tasks"
+        if limits.max_bytes is not None:
+            incoming_bytes = sum(estimate_task_bytes(t) for t in new_tasks)
+            if self._bytes_used + incoming_bytes > limits.max_bytes:
+                return "max_bytes"
+        if limits.max_tasks_per_user is not None:
+            user_id = new_tasks[0].user_id
+            if self._user_counts.get(user_id, 0) + len(new_tasks) > limits.max_tasks_per_user:
+                return "max_tasks_per_user"
+        if limits.max_tasks_per_provider is not None:
+            for task in new_tasks:
+                if self._provider_counts.get(task.provider, 0) + 1 > limits.max_tasks_per_provider:
+                    return "max_tasks_per_provider"
+        return None
+
+    def _shed_victims(self, tasks):
+        """Deprioritised keys to evict so ``tasks`` fit under the global limits, or None."""
+        limits = self._limits
+        new_tasks = [t for t in tasks if not self._is_queued((t.user_id, t.provider))]
+        if all(self._should_deprioritise_task(t) for t in new_tasks):
+            # Evicting one bank_statements task to admit another gains nothing.
+            return None
+
+        excess_tasks = 0
+        if limits.max_tasks is not None:
+            excess_tasks = self._queued_size + len(new_tasks) - limits.max_tasks
+        excess_bytes = 0
+        if limits.max_bytes is not None:
+            excess_bytes = self._bytes_used + sum(estimate_task_bytes(t) for t in new_tasks) - limits.max_bytes
+
+        incoming_keys = {(t.user_id, t.provider) for t in tasks}
+        victims = []
+        # Spilled tasks were queued after the resident backlog filled up, so
+        # they go first.
+        for task_key in itertools.chain(reversed(self._spilled), reversed(self._deprioritised_keys)):
+            if excess_tasks <= 0 and excess_bytes <= 0:
+                break
+            if task_key in incoming_keys:
+                continue
+            victims.append(task_key)
+            excess_tasks -= 1
+            excess_bytes -= self._task_bytes.get(task_key, 0)
+
+        if excess_tasks > 0 or excess_bytes > 0:
+            return None
+        return victims
+
+    def _admit(self, tasks, timeout, shed):
+        """Apply the overflow policy; returns the violated limit if ``tasks`` are rejected."""
+        violation = self._capacity_violation(tasks)
+        if violation is None:
+            return None
+
+        policy = self._limits.policy
+        if policy is OverflowPolicy.SHED_DEPRIORITISED and violation in ("max_tasks", "max_bytes"):
+            victims = self._shed_victims(tasks)
+            if victims is None:
+                return violation
+            for task_key in victims:
+                self._remove_task(task_key)
+                shed.append(TaskDispatch(provider=task_key[1], user_id=task_key[0]))
+            self._shed += len(victims)
+            return self._capacity_violation(tasks)
+
+        if policy is OverflowPolicy.BLOCK:
+            if self._capacity_changed.wait_for(lambda: self._capacity_violation(tasks) is None, timeout):
+                return None
+            return self._capacity_violation(tasks)
+
+        return violation
+
+    @staticmethod
+    def _apply_metadata_defaults(task):
+        metadata = task.metadata
+        metadata.setdefault("priority", Priority.NORMAL)
+        metadata.setdefault("group_earliest_timestamp", MAX_TIMESTAMP)
+        metadata.setdefault("complexity_weighting", 1)
+
+    def set_profiler(self, profiler: QueueProfiler | None) -> None:
+        """Attach ``profiler`` to the hot-path phase markers, or detach with ``None``."""
+        self._profiler = profiler or NULL_PROFILER
+
     def enqueue(self, item: TaskSubmission) -> int:
-        tasks = [*self._collect_dependencies(item), item]
+        return self.try_enqueue(item).size
+
+    def try_enqueue(self, item: TaskSubmission, timeout: float | None = None) -> EnqueueOutcome:
+        """Enqueue ``item`` and its dependencies, subject to the configured limits.
+
+        ``timeout`` overrides ``QueueLimits.block_timeout`` for the BLOCK policy.
+        """
+        with self._synchronised(), self._profiler.phase("enqueue"):
+            return self._try_enqueue(item, timeout)
+
+    def _try_enqueue(self, item, timeout, due=False):
+        complexity = item.metadata.get("complexity_weighting", 1)
+        if not isinstance(complexity, numbers.Real):
+            # It is a sort key next to the queue's own numeric weightings.
+            raise ValueError(f"complexity_weighting must be a number, got {complexity!r}")
+        if item.attempt:
+            task_key = (item.user_id, item.provider)
+            self._attempts[task_key] = max(self._attempts.get(task_key, 0), item.attempt)
+
+        ready_at = None if due else self._ready_time_for_task(item)
+        if ready_at is not None:
+            heapq.heappush(self._delayed, (ready_at, next(self._delayed_sequence), item))
+            return EnqueueOutcome(accepted=True, size=self.ready_size, reason="delayed")
+
+        if self._has_fresh_result(item):
+            return EnqueueOutcome(accepted=True, size=self.ready_size, reason="cached")
+
+        with self._profiler.phase("collect_dependencies"):
+            dependencies = self._collect_dependencies(item)
+        tasks = [
+            *(t for t in dependencies if not self._has_fresh_result(t)),
+            item,
+        ]
+        for task in tasks:
+            self._apply_metadata_defaults(task)
+
+        shed: list[TaskDispatch] = []
+        if self._limits is not None:
+            if timeout is None:
+                timeout = self._limits.block_timeout
+            rejection = self._admit(tasks, timeout, shed)
+            if rejection is not None:
+                self._rejected += 1
+                return EnqueueOutcome(accepted=False, size=self.ready_size, reason=rejection, shed=shed)
+        self._admitted += 1
 
         for task in tasks:
             task_key = (task.user_id, task.provider)
+            if self._spilled:
+                # Bring the user's cold task back so grouping and dedup see it.
+                self._fault_in_user(task.user_id)
 
             existing_match = self._queue.get(task_key, None)
+            parked_bucket = self._parked.get(task.provider) if self._parked else None
+            if existing_match is None and parked_bucket is not None:
+                existing_match = parked_bucket.get(task_key)
 
             if existing_match:
-                if existing_match.timestamp < task.timestamp:
+                if self._timestamp_for_task(existing_match) < self._timestamp_for_task(task):
                     task.timestamp = existing_match.timestamp
 
-            if self._oldest_task_timestamp is None or self._timestamp_for_task(task) < self._oldest_task_timestamp:
-                self._oldest_task_timestamp = self._timestamp_for_task(task)
-            
-            if self._newest_task_timestamp is None or self._timestamp_for_task(task) > self._newest_task_timestamp:
-                self._newest_task_timestamp = self._timestamp_for_task(task)
-
-            metadata = task.metadata
-            metadata.setdefault("priority", Priority.NORMAL)
-            metadata.setdefault("group_earliest_timestamp", MAX_TIMESTAMP)
-            metadata.setdefault("complexity_weighting", 1)
-            self._queue[task_key] = task
-        return self.size
+                existing_deadline = self._deadline_for_task(existing_match)
+                if existing_deadline is not None:
+                    deadline = self._deadline_for_task(task)
+                    if deadline is None or existing_deadline < deadline:
+                        task.metadata["deadline"] = existing_match.metadata["deadline"]
 
-    def dequeue(self):
-        if self.size == 0:
+            if existing_match is None:
+                self._insert_task(task_key, task)
+            else:
+                if self._timestamp_for_task(task) != self._timestamp_for_task(existing_match):
+                    # The bounds only widen here: until a task at either bound
+                    # leaves, the newest timestamp submitted is still "now".
+                    self._uncount_timestamp(self._timestamp_for_task(existing_match), refresh_bounds=False)
+                    self._count_timestamp(self._timestamp_for_task(task))
+                if parked_bucket is not None and task_key in parked_bucket:
+                    parked_bucket[task_key] = task
+                else:
+                    self._queue[task_key] = task
+                task_bytes = estimate_task_bytes(task)
+                self._bytes_used += task_bytes - self._task_bytes[task_key]
+                self._task_bytes[task_key] = task_bytes
+                if self._scheduling is SchedulingMode.DEADLINE and task_key in self._task_sequences:
+                    # Re-index under the merged deadline/priority; the entries pushed
+                    # for the original submission share its sequence and go stale
+                    # once either copy is dispatched.
+                    self._index_deadline_task(self._task_sequences[task_key], task_key, task)
+        return EnqueueOutcome(accepted=True, size=self.ready_size, shed=shed)
+
+    def _ready_time_for_task(self, task):
+        """``not_before`` when it is still in the future, otherwise None.
+
+        Without a clock the queue's time only advances with submissions, so a
+        delayed task on an otherwise idle queue is measured against its own
+        timestamp.
+        """
+        if task.not_before is None:
             return None
+        not_before = self._normalise_timestamp(task.not_before)
+        now = self._now() or self._timestamp_for_task(task)
+        return not_before if not_before > now else None
+
+    def _promote_due_tasks(self):
+        now = self._now()
+        if now is None:
+            return
+        delayed = self._delayed
+        while delayed and delayed[0][0] <= now:
+            entry = heapq.heappop(delayed)
+            # Shedding can move the queue's time back, so a task judged due
+            # here is not measured against not_before again.
+            if not self._try_enqueue(entry[2], timeout=0, due=True).accepted:
+                # Admission applies when a task becomes ready; try again on
+                # the next dequeue rather than dropping it.
+                heapq.heappush(delayed, entry)
+                break
+
+    def retry(self, task: TaskDispatch, timestamp: datetime | None = None) -> EnqueueOutcome:
+        """Re-submit a failed dispatch after its provider's backoff delay.
+
+        ``timestamp`` is when the failure happened; it defaults to the queue's
+        current time, which without a clock is the newest submission it has
+        seen. Once the provider's ``max_attempts`` is used up the task
+        is dropped and the outcome carries ``reason="max_attempts"``.
+        """
+        with self._synchronised():
+            task_key = (task.user_id, task.provider)
+            attempt = self._attempts.get(task_key, 0) + 1
+            policy = self._retry_policies.get(task.provider, DEFAULT_RETRY_POLICY)
+            if not policy.allows(attempt):
+                self._attempts.pop(task_key, None)
+                self._retries_exhausted += 1
+                return EnqueueOutcome(accepted=False, size=self.ready_size, reason="max_attempts")
+
+            now = timestamp or self._now() or self._latest_submission_timestamp
+            if now is None:
+                raise ValueError("retry() needs a timestamp until the queue has a clock or has seen a submission")
+            return self._try_enqueue(
+                TaskSubmission(
+                    provider=task.provider,
+                    user_id=task.user_id,
+                    timestamp=now,
+                    not_before=now + policy.delay(attempt, self._rng),
+                    attempt=attempt,
+                ),
+                timeout=0,
+            )
 
-        queued_tasks = list(self._queue.values())
-
-        user_ids = {task.user_id for task in queued_tasks}
-        task_count = {}
-        priority_timestamps = {}
-        user_lowest_priorities = {}
+    def _count_timestamp(self, timestamp):
+        micros = to_micros(timestamp)
+        count = self._timestamp_counts.get(micros, 0)
+        self._timestamp_counts[micros] = count + 1
+        if not count:
+            heapq.heappush(self._oldest_heap, micros)
+            heapq.heappush(self._newest_heap, -micros)
+
+        if self._oldest_task_timestamp is None or timestamp < self._oldest_task_timestamp:
+            self._oldest_task_timestamp = timestamp
+        if self._newest_task_timestamp is None or timestamp > self._newest_task_timestamp:
+            self._newest_task_timestamp = timestamp
+        if self._latest_submission_timestamp is None or timestamp > self._latest_submission_timestamp:
+            self._latest_submission_timestamp = timestamp
+
+    def _uncount_timestamp(self, timestamp, refresh_bounds=True):
+        timestamp_counts = self._timestamp_counts
+        micros = to_micros(timestamp)
+        count = timestamp_counts[micros] - 1
+        if count:
+            timestamp_counts[micros] = count
+        else:
+            del timestamp_counts[micros]
+            if len(self._newest_heap) > 2 * len(timestamp_counts) + 64:
+                # Entries below the top are only skipped once they surface, so
+                # rebuild the heaps before the skipped ones outnumber the live ones.
+                self._oldest_heap = list(timestamp_counts)
+                heapq.heapify(self._oldest_heap)
+                self._newest_heap = [-micros for micros in timestamp_counts]
+                heapq.heapify(self._newest_heap)
+
+        if not refresh_bounds:
+            return
+        if not timestamp_counts:
+            self._oldest_task_timestamp = None
+            self._newest_task_timestamp = None
+        elif timestamp == self._oldest_task_timestamp or timestamp == self._newest_task_timestamp:
+            oldest_heap = self._oldest_heap
+            while oldest_heap[0] not in timestamp_counts:
+                heapq.heappop(oldest_heap)
+            newest_heap = self._newest_heap
+            while -newest_heap[0] not in timestamp_counts:
+                heapq.heappop(newest_heap)
+            self._oldest_task_timestamp = from_micros(oldest_heap[0])
+            self._newest_task_timestamp = from_micros(-newest_heap[0])
+
+    def _insert_task(self, task_key, task):
+        self._count_timestamp(self._timestamp_for_task(task))
+        spill = self._should_spill_task(task)
+
+        self._user_counts[task.user_id] = self._user_counts.get(task.user_id, 0) + 1
+        self._provider_counts[task.provider] = self._provider_counts.get(task.provider, 0) + 1
+
+        if spill:
+            self._spill_task(task_key, task)
+        else:
+            self._make_resident(task_key, task)
+
+    def _make_resident(self, task_key, task):
+        task_bytes = self._task_bytes[task_key] = estimate_task_bytes(task)
+        self._bytes_used += task_bytes
+        if self._should_deprioritise_task(task):
+            self._deprioritised_keys[task_key] = None
+
+        if self._should_park_task(task):
+            self._park_task(task_key, task)
+        else:
+            self._place_task(task_key, task)
+
+    def _place_task(self, task_key, task):
+        """Make a resident task visible to the dispatch indexes."""
+        self._queue[task_key] = task
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        self._task_sequences[task_key] = sequence
+        if self._circuit_breakers is not None:
+            self._provider_keys.setdefault(task.provider, {})[task_key] = None
+
+        if self._scheduling is SchedulingMode.FAIR_SHARE:
+            fifo = self._user_fifos.get(task.user_id)
+            if fifo is None:
+                fifo = self._user_fifos[task.user_id] = deque()
+                self._user_deficits[task.user_id] = 0
+                self._active_users.append(task.user_id)
+            fifo.append((sequence, task_key))
+        elif self._scheduling is SchedulingMode.DEADLINE:
+            self._index_deadline_task(sequence, task_key, task)
+
+    def _index_deadline_task(self, sequence, task_key, task):
+        deadline = self._deadline_for_task(task)
+        if deadline is not None:
+            heapq.heappush(self._deadline_heap, (deadline, sequence, task_key))
+
+        tier_heap = self._tier_heaps.setdefault(self._priority_for_task(task), [])
+        heapq.heappush(
+            tier_heap,
+            (deadline or MAX_TIMESTAMP, self._timestamp_for_task(task), sequence, task_key),
+        )
 
-        for user_id in user_ids:
-            user_tasks = [t for t in queued_tasks if t.user_id == user_id]
-            earliest_timestamp = sorted(user_tasks, key=lambda t: t.timestamp)[0].timestamp
-            user_lowest_priorities[user_id] = max(
-                [self._priority_for_task(t) for t in user_tasks]
+    def _unplace_task(self, task_key):
+        # Mode index entries go stale with the sequence number.
+        task = self._queue.pop(task_key)
+        del self._task_sequences[task_key]
+        if self._circuit_breakers is not None:
+            self._provider_keys[task.provider].pop(task_key, None)
+        return task
+
+    def _is_parked(self, task_key):
+        parked_bucket = self._parked.get(task_key[1]) if self._parked else None
+        return parked_bucket is not None and task_key in parked_bucket
+
+    def _has_parked_prerequisite(self, task):
+        return any(self._is_parked((task.user_id, provider)) for provider in self._prerequisites.get(task.provider, ()))
+
+    def _should_park_task(self, task):
+        if self._circuit_breakers is None:
+            return False
+        return not self._circuit_breakers.is_closed(task.provider) or self._has_parked_prerequisite(task)
+
+    def _park_task(self, task_key, task):
+        self._parked.setdefault(task.provider, OrderedDict())[task_key] = task
+
+    def _unpark_task(self, task_key):
+        parked_bucket = self._parked[task_key[1]]
+        task = parked_bucket.pop(task_key)
+        if not parked_bucket:
+            del self._parked[task_key[1]]
+        self._place_task(task_key, task)
+
+    def _park_provider(self, provider):
+        for task_key in list(self._provider_keys.get(provider, ())):
+            self._probe_keys.pop(task_key, None)
+            self._park_task(task_key, self._unplace_task(task_key))
+            self._park_dependents(task_key)
+
+    def _park_dependents(self, task_key):
+        user_id, provider = task_key
+        for dependent in self._dependents.get(provider, ()):
+            dependent_key = (user_id, dependent)
+            if dependent_key in self._queue:
+                self._park_task(dependent_key, self._unplace_task(dependent_key))
+                self._park_dependents(dependent_key)
+
+    def _release_provider(self, provider):
+        """Unpark a recovered provider's tasks, then dependents no longer held back."""
+        pending = [provider]
+        while pending:
+            name = pending.pop(0)
+            for task_key, task in list(self._parked.get(name, {}).items()):
+                if not self._should_park_task(task):
+                    self._unpark_task(task_key)
+            pending.extend(self._dependents.get(name, ()))
+
+    def _release_probes(self):
+        """Let one parked task through for each half-open breaker."""
+        for provider, parked_bucket in list(self._parked.items()):
+            breaker = self._circuit_breakers.breaker(provider)
+            if not breaker.try_acquire_probe():
+                continue
+            probe_key = next(
+                (task_key for task_key, task in parked_bucket.items() if not self._has_parked_prerequisite(task)),
+                None,
             )
-            priority_timestamps[user_id] = earliest_timestamp
-            task_count[user_id] = len(user_tasks)
-
-        for task in queued_tasks:
-            metadata = task.metadata
-            current_earliest = metadata.get("group_earliest_timestamp", MAX_TIMESTAMP)
-            raw_priority = metadata.get("priority")
-
-            try:
-                priority_level = Priority(raw_priority)
-            except (TypeError, ValueError):
-                priority_level = None
-
-            if priority_level is None or priority_level == Priority.NORMAL:
-                metadata["group_earliest_timestamp"] = MAX_TIMESTAMP                
-                if task_count[task.user_id] >= 3:
-                    metadata["group_earliest_timestamp"] = priority_timestamps[task.user_id]
-                    metadata["priority"] = Priority.HIGH
-                else:
-                    metadata["priority"] = Priority.NORMAL
+            if probe_key is None:
+                breaker.release_probe()
             else:
-                metadata["group_earliest_timestamp"] = current_earliest
-                metadata["priority"] = priority_level
+                self._unpark_task(probe_key)
+                self._probe_keys[probe_key] = None
+
+    def _is_near_reprioritisation(self, task):
+        margin = self._tiering.fault_in_margin.total_seconds()
+        task_internal_age = (self._newest_task_timestamp - self._timestamp_for_task(task)).total_seconds()
+        return task_internal_age >= REPRIORITISE_AFTER_SECONDS - margin
+
+    def _should_spill_task(self, task):
+        # Only a user's sole task is spilled: any sibling counts towards the
+        # user's group in _select_legacy, so it has to stay visible there. An
+        # explicit HIGH priority keeps it ahead of every NORMAL task.
+        return (
+            self._tiering is not None
+            and len(self._queue) >= self._tiering.resident_limit
+            and self._should_deprioritise_task(task)
+            and self._priority_for_task(task) is Priority.NORMAL
+            and task.user_id not in self._user_counts
+            and not self._is_near_reprioritisation(task)
+        )
 
-                if self._should_deprioritise_task(task) and not self._should_reprioritise_deprioritised_task(task):
-                    metadata["priority"] = user_lowest_priorities[task.user_id]
-
-            if self._should_deprioritise_task(task) and not self._should_reprioritise_deprioritised_task(task):
-                metadata["complexity_weighting"] = 2
-
-        queued_tasks.sort(
-            key=lambda i: (
-                self._priority_for_task(i),
-                self._earliest_group_timestamp_for_task(i),
-                self._complexity_weighting_for_task(i),
-                self._timestamp_for_task(i),
-                self._should_reprioritise_deprioritised_task(i) == False
-            )
+    def _spill_task(self, task_key, task):
+        slot = self._spill_file.write(task)
+        self._spilled[task_key] = slot
+        heapq.heappush(self._spill_order, self._spill_file.timestamp_micros(slot) << _SLOT_BITS | slot)
+        self._spilled_total += 1
+
+    def _fault_in(self, task_key):
+        slot = self._spilled.pop(task_key)
+        task = self._spill_file.read(slot)
+        self._spill_file.release(slot)
+        self._make_resident(task_key, task)
+        self._faulted_in += 1
+
+    def _is_live_spill_entry(self, entry):
+        return self._spill_file.timestamp_micros(entry & _SLOT_MASK) == entry >> _SLOT_BITS
+
+    def _trim_spill_order(self):
+        spill_order = self._spill_order
+        while spill_order and not self._is_live_spill_entry(spill_order[0]):
+            heapq.heappop(spill_order)
+
+    def _fault_in_user(self, user_id):
+        for provider in self._deprioritised_providers:
+            if (user_id, provider) in self._spilled:
+                self._fault_in((user_id, provider))
+
+    def _fault_in_spilled(self):
+        """Bring spilled tasks back, oldest first, as they approach the head.
+
+        A task is due once it is within ``fault_in_margin`` of reprioritisation,
+        or whenever the resident queue is below half of ``resident_limit``; at
+        most ``fault_in_batch`` tasks are read per dequeue.
+        """
+        policy = self._tiering
+        horizon = to_micros(self._newest_task_timestamp) - int(
+            (REPRIORITISE_AFTER_SECONDS - policy.fault_in_margin.total_seconds()) * 1_000_000
         )
+        low_watermark = max(policy.resident_limit // 2, 1)
+        spill_order = self._spill_order
+        for _ in range(policy.fault_in_batch):
+            self._trim_spill_order()
+            if not spill_order:
+                break
+            if spill_order[0] >> _SLOT_BITS > horizon and len(self._queue) >= low_watermark:
+                break
+            task = self._spill_file.read(heapq.heappop(spill_order) & _SLOT_MASK)
+            self._fault_in((task.user_id, task.provider))
+
+    def _remove_task(self, task_key):
+        slot = self._spilled.pop(task_key, None) if self._spilled else None
+        if slot is not None:
+            task = self._spill_file.read(slot)
+            self._spill_file.release(slot)
+        else:
+            if self._is_parked(task_key):
+                parked_bucket = self._parked[task_key[1]]
+                task = parked_bucket.pop(task_key)
+                if not parked_bucket:
+                    del self._parked[task_key[1]]
+            else:
+                task = self._unplace_task(task_key)
+            self._bytes_used -= self._task_bytes.pop(task_key)
+
+        if self._probe_keys and task_key in self._probe_keys:
+            del self._probe_keys[task_key]
+            self._circuit_breakers.breaker(task.provider).release_probe()
+
+        self._user_counts[task.user_id] -= 1
+        if not self._user_counts[task.user_id]:
+            del self._user_counts[task.user_id]
+        self._provider_counts[task.provider] -= 1
+        self._deprioritised_keys.pop(task_key, None)
+        if self._capacity_changed is not None:
+            self._capacity_changed.notify_all()
+
+        self._uncount_timestamp(self._timestamp_for_task(task))
+        return task
+
+    def _is_current(self, sequence, task_key):
+        return self._task_sequences.get(task_key) == sequence
+
+    def _fair_share_weight_for_task(self, task):
+        return max(self._fair_share_weights.get(self._priority_for_task(task), 1), 1)
+
+    def _select_fair_share(self):
+        """Deficit round robin across users: O(1) amortised per dequeue.
+
+        The user at the head of the active ring is credited ``quantum * weight``
+        once per turn and served while its deficit covers the cost
+        (``complexity_weighting``) of its oldest task; it then moves to the back.
+        """
+        while True:
+            user_id = self._active_users[0]
+            fifo = self._user_fifos[user_id]
+            while fifo and not self._is_current(*fifo[0]):
+                fifo.popleft()
+
+            if not fifo:
+                self._active_users.popleft()
+                del self._user_fifos[user_id]
+                del self._user_deficits[user_id]
+                self._head_user_credited = False
+                continue
+
+            task_key = fifo[0][1]
+            task = self._queue[task_key]
+            cost = max(int(self._complexity_weighting_for_task(task)), 1)
+
+            if self._user_deficits[user_id] >= cost:
+                self._user_deficits[user_id] -= cost
+                fifo.popleft()
+                return task_key
+
+            if not self._head_user_credited:
+                self._user_deficits[user_id] += self._fair_share_quantum * self._fair_share_weight_for_task(task)
+                self._head_user_credited = True
+                continue
+
+            self._active_users.rotate(-1)
+            self._head_user_credited = False
+
+    def _select_deadline(self):
+        """Earliest deadline first, blended with the priority tiers.
+
+        A task whose slack (deadline - now) has fallen inside the at-risk window,
+        but is not yet negative, is dispatched ahead of every tier, found through the deadline-ordered
+        heap. Otherwise the highest non-empty tier is served, earliest deadline
+        first and then oldest submission.
+        """
+        deadline_heap = self._deadline_heap
+        now = self._now()
+        # Entries for dispatched tasks are stale. Tasks that have already missed
+        # their deadline leave the index too: promoting them would only make the
+        # next task late as well, so they keep their place in their tier instead.
+        while deadline_heap and (deadline_heap[0][0] < now or not self._is_current(*deadline_heap[0][1:])):
+            heapq.heappop(deadline_heap)
+
+        if deadline_heap and deadline_heap[0][0] - now <= self._deadline_at_risk_window:
+            self._deadlines_promoted += 1
+            return heapq.heappop(deadline_heap)[2]
+
+        for priority in sorted(self._tier_heaps):
+            tier_heap = self._tier_heaps[priority]
+            while tier_heap:
+                _, _, sequence, task_key = heapq.heappop(tier_heap)
+                if self._is_current(sequence, task_key):
+                    return task_key
+        raise LookupError("deadline indexes are out of sync with the queue")
+
+    def _count_deadlines_at_risk(self, now):
+        if now is None:
+            return 0
+        threshold = now + self._deadline_at_risk_window
 
-        task = queued_tasks[0]
-        del self._queue[(task.user_id, task.provider)]
+        if self._scheduling is not SchedulingMode.DEADLINE:
+            return sum(
+                1 for task in self._queue.values()
+                if (deadline := self._deadline_for_task(task)) is not None and now <= deadline <= threshold
+            )
 
-        if self._timestamp_for_task(task) == self._oldest_task_timestamp or self._timestamp_for_task(task) == self._newest_task_timestamp:
-            if self.size == 0:
-                self._oldest_task_timestamp = None
-                self._newest_task_timestamp = None
-            else:
-                timestamps = [self._timestamp_for_task(t) for t in self._queue.values()]
-                self._oldest_task_timestamp = min(timestamps)
-                self._newest_task_timestamp = max(timestamps)
+        # Walk only the heap nodes inside the window; children are never earlier
+        # than their parent, so whole subtrees past the threshold are skipped.
+        deadline_heap = self._deadline_heap
+        counted = set()
+        pending = [0] if deadline_heap else []
+        while pending:
+            index = pending.pop()
+            deadline, sequence, task_key = deadline_heap[index]
+            if deadline > threshold:
+                continue
+            if deadline >= now and self._is_current(sequence, task_key):
+                counted.add(task_key)
+            pending.extend(child for child in (2 * index + 1, 2 * index + 2) if child < len(deadline_heap))
+        return len(counted)
+
+    def dequeue(self):
+        with self._synchronised(), self._profiler.phase("dequeue"):
+            return self._dequeue()
 
+    def _dequeue(self):
+        task_key = self._next_ready_task_key()
+        if task_key is None:
+            return None
+        task = self._dispatch_task(task_key)
         return TaskDispatch(
             provider=task.provider,
             user_id=task.user_id,
         )
 
+    def dequeue_submission(self) -> DispatchedSubmission | None:
+        """Like ``dequeue``, but returns the submission with the metadata it was dispatched under."""
+        with self._synchronised(), self._profiler.phase("dequeue"):
+            task_key = self._next_ready_task_key()
+            if task_key is None:
+                return None
+            task = self._queue[task_key]
+            deprioritised = self._should_deprioritise_task(task) and not self._should_reprioritise_deprioritised_task(task)
+            return DispatchedSubmission(self._dispatch_task(task_key), deprioritised)
+
+    def _next_ready_task_key(self):
+        self._refresh_ready_tasks()
+        if self.ready_size == 0:
+            return None
+        if self._spilled:
+            self._fault_in_spilled()
+        if not self._queue:
+            # Everything faulted in belonged to a parked provider.
+            return None
+
+        if self._scheduling is SchedulingMode.FAIR_SHARE:
+            return self._select_fair_share()
+        if self._scheduling is SchedulingMode.DEADLINE:
+            return self._select_deadline()
+        return self._select_legacy()
+
+    def _refresh_ready_tasks(self):
+        if self._delayed:
+            self._promote_due_tasks()
+        if self._parked:
+            self._release_probes()
+
+    def _dispatch_task(self, task_key):
+        """Remove the selected task from the queue and return the submission."""
+        task = self._queue[task_key]
+        deadline = self._deadline_for_task(task)
+        if deadline is not None and deadline < self._now():
+            self._deadlines_missed += 1
+        if self._probe_keys:
+            # A dispatched probe keeps its slot until its completion comes back.
+            self._probe_keys.pop(task_key, None)
+        return self._remove_task(task_key)
+
+    def _select_legacy(self):
+        queued_tasks = list(self._queue.values())
+
+        with self._profiler.phase("user_regrouping"):
+            task_count = {}
+            priority_timestamps = {}
+            user_lowest_priorities = {}
+
+            for task in queued_tasks:
+                user_id = task.user_id
+                priority = self._priority_for_task(task)
+                if user_id in task_count:
+                    task_count[user_id] += 1
+                    if task.timestamp < priority_timestamps[user_id]:
+                        priority_timestamps[user_id] = task.timestamp
+                    if priority > user_lowest_priorities[user_id]:
+                        user_lowest_priorities[user_id] = priority
+                else:
+                    task_count[user_id] = 1
+                    priority_timestamps[user_id] = task.timestamp
+                    user_lowest_priorities[user_id] = priority
+
+        with self._profiler.phase("metadata_rewrite"):
+            for task in queued_tasks:
+                metadata = task.metadata
+                current_earliest = metadata.get("group_earliest_timestamp", MAX_TIMESTAMP)
+                raw_priority = metadata.get("priority")
+
+                try:
+                    priority_level = Priority(raw_priority)
+                except (TypeError, ValueError):
+                    priority_level = None
+
+                if priority_level is None or priority_level == Priority.NORMAL:
+                    metadata["group_earliest_timestamp"] = MAX_TIMESTAMP                
+                    if task_count[task.user_id] >= 3:
+                        metadata["group_earliest_timestamp"] = priority_timestamps[task.user_id]
+                        metadata["priority"] = Priority.HIGH
+                    else:
+                        metadata["priority"] = Priority.NORMAL
+                else:
+                    metadata["group_earliest_timestamp"] = current_earliest
+                    metadata["priority"] = priority_level
+
+                    if self._should_deprioritise_task(task) and not self._should_reprioritise_deprioritised_task(task):
+                        metadata["priority"] = user_lowest_priorities[task.user_id]
+
+                if self._should_deprioritise_task(task) and not self._should_reprioritise_deprioritised_task(task):
+                    metadata["complexity_weighting"] = 2
+
+        with self._profiler.phase("final_sort"):
+            queued_tasks.sort(
+                key=lambda i: (
+                    self._priority_for_task(i),
+                    self._earliest_group_timestamp_for_task(i),
+                    self._complexity_weighting_for_task(i),
+                    self._timestamp_for_task(i),
+                    self._should_reprioritise_deprioritised_task(i) == False
+                )
+            )
+
+        task = queued_tasks[0]
+        return (task.user_id, task.provider)
+
     @property
     def size(self):
-        return len(self._queue.values())
+        """Tasks ``dequeue`` can hand out now, once due delayed tasks are promoted.
+
+        Delayed and parked tasks are not included; see ``delayed_size`` and
+        ``parked_size``.
+        """
+        with self._synchronised():
+            self._refresh_ready_tasks()
+            return self.ready_size
+
+    @property
+    def ready_size(self):
+        return len(self._queue) + len(self._spilled)
+
+    @property
+    def delayed_size(self):
+        return len(self._delayed)
+
+    @property
+    def parked_size(self):
+        return sum(len(parked_bucket) for parked_bucket in self._parked.values())
+
+    @property
+    def _queued_size(self):
+        return self.ready_size + self.parked_size
 
     @property
     def age(self):
-        if self.size == 0:
+        """Seconds between the oldest and newest queued task; delayed tasks are not included."""
+        if self._queued_size == 0:
             return 0
         
         return int((self._newest_task_timestamp - self._oldest_task_timestamp).total_seconds())
 
 
     def purge(self):
+        with self._synchronised():
+            return self._purge()
+
+    def _purge(self):
         self._queue = {}
+        self._oldest_task_timestamp = None
+        self._newest_task_timestamp = None
+        self._timestamp_counts = {}
+        self._oldest_heap = []
+        self._newest_heap = []
+        self._task_sequences = {}
+        self._active_users.clear()
+        self._user_fifos = {}
+        self._user_deficits = {}
+        self._head_user_credited = False
+        self._deadline_heap = []
+        self._tier_heaps = {}
+        self._user_counts = {}
+        self._provider_counts = {}
+        self._task_bytes = {}
+        self._bytes_used = 0
+        self._deprioritised_keys = OrderedDict()
+        self._spilled = {}
+        self._spill_order = []
+        self._delayed = []
+        self._attempts = {}
+        self._parked = {}
+        self._provider_keys = {}
+        self._probe_keys = {}
+        if self._circuit_breakers is not None:
+            self._circuit_breakers.release_all_probes()
+        if self._spill_file is not None:
+            self._spill_file.clear()
+        if self._capacity_changed is not None:
+            self._capacity_changed.notify_all()
         return True
 
+    def close(self) -> None:
+        """Release the spill file; only needed when tiered storage is enabled."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def __enter__(self) -> "Queue":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def record_result(self, task: TaskDispatch, result: object) -> None:
+        if self._result_cache is not None:
+            self._result_cache.put(task.user_id, task.provider, result)
+
+    def record_completion(self, task: TaskDispatch, latency: float, success: bool) -> None:
+        provider_stats = self._dispatch_stats.get(task.provider)
+        if provider_stats is None:
+            provider_stats = self._dispatch_stats[task.provider] = ProviderDispatchStats()
+        provider_stats.record(latency, success)
+        if success:
+            self._attempts.pop((task.user_id, task.provider), None)
+
+        if self._circuit_breakers is not None:
+            with self._synchronised():
+                breaker = self._circuit_breakers.breaker(task.provider)
+                previous_state = breaker.state
+                state = breaker.record(success)
+                if state is not previous_state:
+                    if state is BreakerState.OPEN:
+                        self._park_provider(task.provider)
+                    elif state is BreakerState.CLOSED:
+                        self._release_provider(task.provider)
+
+    def stats(self) -> dict[str, object]:
+        stats: dict[str, object] = {
+            "size": self.ready_size,
+            "ready": self.ready_size,
+            "delayed": self.delayed_size,
+            "parked": self.parked_size,
+            "age": self.age,
+            "deadlines_missed": self._deadlines_missed,
+            "deadlines_at_risk": self._count_deadlines_at_risk(self._now()),
+            "deadlines_promoted": self._deadlines_promoted,
+        }
+        if self._result_cache is not None:
+            stats["result_cache"] = self._result_cache.stats()
+        if self._limits is not None:
+            stats["admission"] = {
+                "admitted": self._admitted,
+                "rejected": self._rejected,
+                "shed": self._shed,
+                "bytes_used": self._bytes_used,
+            }
+        if self._attempts or self._retries_exhausted:
+            stats["retries"] = {
+                "pending": len(self._attempts),
+                "exhausted": self._retries_exhausted,
+            }
+        if self._circuit_breakers is not None:
+            stats["circuit_breakers"] = self._circuit_breakers.stats()
+        if self._tiering is not None:
+            stats["tiering"] = {
+                "resident": len(self._queue),
+                "spilled": len(self._spilled),
+                "spilled_total": self._spilled_total,
+                "faulted_in": self._faulted_in,
+            }
+        if self._profiler is not NULL_PROFILER:
+            stats["profiling"] = self._profiler.stats()
+        if self._dispatch_stats:
+            stats["providers"] = {
+                name: provider_stats.as_dict() for name, provider_stats in self._dispatch_stats.items()
+            }
+        return stats
+
 """
 ===================================================================================================
 
@@ -257,7 +1184,9 @@ async def lifespan(app: FastAPI):
 
 
 app = FastAPI(lifespan=lifespan)
-queue = Queue()
+# The clock lets delayed (retried) tasks fall due while no new submissions
+# arrive; queue.size only counts tasks that dequeue can hand out.
+queue = Queue(clock=datetime.now)
 
 
 @app.get("/")
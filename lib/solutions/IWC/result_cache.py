@@ -0,0 +1,98 @@
+"""Bounded cache of provider results keyed on ``(user_id, provider)``."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Callable, Mapping
+
+_MISSING = object()
+
+
+class ProviderResultCache:
+    """LRU cache whose entries expire after a per-provider TTL.
+
+    ``clock`` returns seconds and defaults to ``time.monotonic``; it only has
+    to be monotonic, so tests can drive it by hand.
+    """
+
+    def __init__(
+        self,
+        ttl_by_provider: Mapping[str, float] | None = None,
+        default_ttl: float = 60.0,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._ttl_by_provider: dict[str, float] = dict(ttl_by_provider or {})
+        self._default_ttl = default_ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[tuple[int, str], tuple[float, object]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def ttl_for(self, provider: str) -> float:
+        return self._ttl_by_provider.get(provider, self._default_ttl)
+
+    def _lookup(self, user_id: int, provider: str) -> object:
+        key = (user_id, provider)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return _MISSING
+
+        expires_at, result = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return _MISSING
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def get(self, user_id: int, provider: str, default: object = None) -> object:
+        result = self._lookup(user_id, provider)
+        return default if result is _MISSING else result
+
+    def is_fresh(self, user_id: int, provider: str) -> bool:
+        return self._lookup(user_id, provider) is not _MISSING
+
+    def put(self, user_id: int, provider: str, result: object) -> None:
+        ttl = self.ttl_for(provider)
+        if ttl <= 0:
+            return
+
+        key = (user_id, provider)
+        self._entries[key] = (self._clock() + ttl, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, user_id: int, provider: str) -> None:
+        self._entries.pop((user_id, provider), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+__all__ = ["ProviderResultCache"]
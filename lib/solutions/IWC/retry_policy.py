@@ -0,0 +1,39 @@
+"""Per-provider retry backoff for ``Queue.retry``."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import timedelta
+
+
+@dataclass
+class RetryPolicy:
+    """Capped exponential backoff with jitter.
+
+    Attempt ``n`` waits ``base_delay * multiplier ** (n - 1)``, capped at
+    ``max_delay``; ``jitter`` is the fraction of that delay drawn at random,
+    so retries of many tasks that failed together spread out instead of
+    arriving at the provider in one burst. ``max_attempts=None`` retries
+    forever.
+    """
+
+    base_delay: timedelta = timedelta(seconds=1)
+    max_delay: timedelta = timedelta(minutes=5)
+    multiplier: float = 2.0
+    jitter: float = 0.5
+    max_attempts: int | None = 10
+
+    def delay(self, attempt: int, rng: random.Random) -> timedelta:
+        exponent = min(max(attempt - 1, 0), 64)
+        capped = min(self.base_delay * self.multiplier ** exponent, self.max_delay)
+        return capped * (1 - self.jitter + self.jitter * rng.random())
+
+    def allows(self, attempt: int) -> bool:
+        return self.max_attempts is None or attempt <= self.max_attempts
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+__all__ = ["DEFAULT_RETRY_POLICY", "RetryPolicy"]
@@ -0,0 +1,142 @@
+"""Fixed-width binary encoding of ``TaskSubmission`` records.
+
+Records are packed straight into (and unpacked straight out of) a caller
+supplied buffer, so shared-memory and memory-mapped stores can move tasks
+around without pickling or intermediate ``bytes`` copies.
+"""
+
+from __future__ import annotations
+
+import numbers
+import struct
+from datetime import datetime, timedelta
+from typing import Sequence
+
+from solutions.IWC.task_types import Priority, TaskSubmission
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+_HAS_PRIORITY = 0x01
+_HAS_GROUP_EARLIEST = 0x02
+_HAS_COMPLEXITY = 0x04
+_HAS_DEADLINE = 0x08
+_HAS_NOT_BEFORE = 0x10
+
+# provider code, flags, priority, pad, attempt, complexity, user_id, timestamp,
+# group earliest, deadline, not_before
+_RECORD = struct.Struct("<BBBxIdqqqqq")
+
+
+def to_micros(timestamp: datetime | str) -> int:
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    return (timestamp.replace(tzinfo=None) - EPOCH) // MICROSECOND
+
+
+def from_micros(micros: int) -> datetime:
+    return EPOCH + timedelta(microseconds=micros)
+
+
+class TaskCodec:
+    """Packs the scheduling-relevant fields of a task into ``record_size`` bytes.
+
+    Providers are stored as a one-byte code into ``provider_names``; the
+    metadata hints understood by the queue, and ``not_before``, are stored
+    with presence flags so that decoding never invents values the submitter
+    did not send. Hints are read with the queue's own rules: an unrecognised
+    priority is NORMAL and a complexity weighting must be a number.
+    """
+
+    def __init__(self, provider_names: Sequence[str]) -> None:
+        self._provider_names: tuple[str, ...] = tuple(provider_names)
+        self._provider_codes: dict[str, int] = {
+            name: code for code, name in enumerate(self._provider_names, start=1)
+        }
+
+    @property
+    def record_size(self) -> int:
+        return _RECORD.size
+
+    def encode_into(self, buffer, offset: int, task: TaskSubmission) -> None:
+        provider_code = self._provider_codes.get(task.provider)
+        if provider_code is None:
+            raise ValueError(f"Provider {task.provider!r} has no record encoding")
+
+        metadata = task.metadata
+        flags = 0
+        priority = 0
+        complexity = 0.0
+        group_earliest = 0
+        deadline = 0
+        not_before = 0
+
+        if "priority" in metadata:
+            flags |= _HAS_PRIORITY
+            priority = Priority.coerce(metadata["priority"])
+        if "complexity_weighting" in metadata:
+            flags |= _HAS_COMPLEXITY
+            complexity = metadata["complexity_weighting"]
+            if not isinstance(complexity, numbers.Real):
+                raise ValueError(f"complexity_weighting must be a number, got {complexity!r}")
+        raw_group_earliest = metadata.get("group_earliest_timestamp")
+        if raw_group_earliest is not None and raw_group_earliest != datetime.max:
+            flags |= _HAS_GROUP_EARLIEST
+            group_earliest = to_micros(raw_group_earliest)
+        if metadata.get("deadline") is not None:
+            flags |= _HAS_DEADLINE
+            deadline = to_micros(metadata["deadline"])
+        if task.not_before is not None:
+            flags |= _HAS_NOT_BEFORE
+            not_before = to_micros(task.not_before)
+
+        _RECORD.pack_into(
+            buffer,
+            offset,
+            provider_code,
+            flags,
+            priority,
+            task.attempt,
+            complexity,
+            task.user_id,
+            to_micros(task.timestamp),
+            group_earliest,
+            deadline,
+            not_before,
+        )
+
+    def decode_from(self, buffer, offset: int) -> TaskSubmission:
+        (
+            provider_code,
+            flags,
+            priority,
+            attempt,
+            complexity,
+            user_id,
+            timestamp,
+            group_earliest,
+            deadline,
+            not_before,
+        ) = _RECORD.unpack_from(buffer, offset)
+
+        metadata: dict[str, object] = {}
+        if flags & _HAS_PRIORITY:
+            metadata["priority"] = priority
+        if flags & _HAS_GROUP_EARLIEST:
+            metadata["group_earliest_timestamp"] = from_micros(group_earliest)
+        if flags & _HAS_COMPLEXITY:
+            metadata["complexity_weighting"] = int(complexity) if complexity.is_integer() else complexity
+        if flags & _HAS_DEADLINE:
+            metadata["deadline"] = from_micros(deadline)
+
+        return TaskSubmission(
+            provider=self._provider_names[provider_code - 1],
+            user_id=user_id,
+            timestamp=from_micros(timestamp),
+            metadata=metadata,
+            not_before=from_micros(not_before) if flags & _HAS_NOT_BEFORE else None,
+            attempt=attempt,
+        )
+
+
+__all__ = ["TaskCodec", "to_micros", "from_micros"]
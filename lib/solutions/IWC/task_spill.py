@@ -0,0 +1,104 @@
+"""Cold-tier storage for queued tasks in a memory-mapped file.
+
+Tasks that cannot be dispatched soon are written as fixed-width records
+(see ``task_codec``) into an ``mmap``-backed file; the queue keeps only a
+small index entry per spilled task and reads the record back when the task
+approaches the head of the queue.
+"""
+
+from __future__ import annotations
+
+import mmap
+import tempfile
+from array import array
+from dataclasses import dataclass
+from datetime import timedelta
+
+from solutions.IWC.task_codec import TaskCodec, to_micros
+from solutions.IWC.task_types import TaskSubmission
+
+
+@dataclass
+class TieringPolicy:
+    """When ``Queue`` spills deprioritised tasks to disk and faults them back.
+
+    A deprioritised submission is spilled once ``resident_limit`` tasks are
+    already held in memory. Spilled tasks are faulted back in, oldest first,
+    when they come within ``fault_in_margin`` of the reprioritisation age or
+    when the resident queue drains below half of ``resident_limit``.
+    ``path=None`` uses an anonymous temporary file. Tiering needs
+    ``SchedulingMode.LEGACY`` and cannot be combined with circuit breakers.
+    """
+
+    resident_limit: int = 1_000
+    fault_in_margin: timedelta = timedelta(seconds=60)
+    fault_in_batch: int = 64
+    path: str | None = None
+
+
+class SpillFile:
+    """Slot-addressed record store over a growable memory-mapped file.
+
+    The timestamp of each live slot is also kept in memory (8 bytes a slot,
+    -1 once released) so callers can validate index entries without reading
+    records back.
+    """
+
+    def __init__(self, codec: TaskCodec, path: str | None = None, initial_slots: int = 1024) -> None:
+        self._codec = codec
+        self._record_size = codec.record_size
+        self._file = open(path, "w+b") if path is not None else tempfile.TemporaryFile()
+        self._capacity = 0
+        self._map: mmap.mmap | None = None
+        self._free_slots: list[int] = []
+        self._next_slot = 0
+        self._timestamps = array("q")
+        self._grow(max(initial_slots, 1))
+
+    def _grow(self, capacity: int) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._file.truncate(capacity * self._record_size)
+        self._map = mmap.mmap(self._file.fileno(), capacity * self._record_size)
+        self._timestamps.extend([-1] * (capacity - self._capacity))
+        self._capacity = capacity
+
+    def write(self, task: TaskSubmission) -> int:
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = self._next_slot
+            self._next_slot += 1
+            if slot >= self._capacity:
+                self._grow(self._capacity * 2)
+        self._codec.encode_into(self._map, slot * self._record_size, task)
+        self._timestamps[slot] = to_micros(task.timestamp)
+        return slot
+
+    def read(self, slot: int) -> TaskSubmission:
+        return self._codec.decode_from(self._map, slot * self._record_size)
+
+    def timestamp_micros(self, slot: int) -> int:
+        return self._timestamps[slot]
+
+    def release(self, slot: int) -> None:
+        self._timestamps[slot] = -1
+        self._free_slots.append(slot)
+
+    def clear(self) -> None:
+        self._free_slots = []
+        self._next_slot = 0
+        self._timestamps = array("q", [-1] * self._capacity)
+
+    @property
+    def slots_in_use(self) -> int:
+        return self._next_slot - len(self._free_slots)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+__all__ = ["SpillFile", "TieringPolicy"]
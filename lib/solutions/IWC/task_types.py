@@ -4,16 +4,41 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import IntEnum
+
+
+class Priority(IntEnum):
+    """Represents the queue ordering tiers observed in the legacy system."""
+    HIGH = 1
+    NORMAL = 2
+
+    @classmethod
+    def coerce(cls, raw_priority: object) -> "Priority":
+        """``raw_priority`` as a tier; values the queue does not recognise count as NORMAL."""
+        if type(raw_priority) is cls:
+            return raw_priority
+        try:
+            return cls(raw_priority)
+        except (TypeError, ValueError):
+            return cls.NORMAL
+
 
 
 @dataclass
 class TaskSubmission:
-    """Typed payload accepted by ``Queue.enqueue``."""
+    """Typed payload accepted by ``Queue.enqueue``.
+
+    A submission with a ``not_before`` time later than the queue's current
+    time is held back until it is due. ``attempt`` counts earlier failed
+    dispatches of the same task (0 for a first submission).
+    """
 
     provider: str
     user_id: int
     timestamp: datetime | str
     metadata: dict[str, object] = field(default_factory=dict)
+    not_before: datetime | str | None = None
+    attempt: int = 0
 
 @dataclass
 class TaskDispatch:
@@ -23,4 +48,33 @@ class TaskDispatch:
     user_id: int
 
 
-__all__ = ["TaskSubmission", "TaskDispatch"]
+@dataclass
+class DispatchedSubmission:
+    """Typed result of ``Queue.dequeue_submission``.
+
+    ``deprioritised`` is true when the task's provider is deprioritised and
+    the task had not yet waited long enough to be reprioritised when it was
+    dispatched.
+    """
+
+    submission: TaskSubmission
+    deprioritised: bool
+
+
+@dataclass
+class EnqueueOutcome:
+    """Typed result of ``Queue.try_enqueue``.
+
+    ``reason`` names the limit that caused a rejection, ``"cached"`` when a
+    fresh provider result made the submission unnecessary, or ``"delayed"``
+    when the submission is held until its ``not_before`` time. ``shed`` lists
+    the tasks evicted to make room for an accepted submission.
+    """
+
+    accepted: bool
+    size: int
+    reason: str | None = None
+    shed: list[TaskDispatch] = field(default_factory=list)
+
+
+__all__ = ["Priority", "TaskSubmission", "TaskDispatch", "DispatchedSubmission", "EnqueueOutcome"]
@@ -0,0 +1,80 @@
+import threading
+
+from entry_point_mapping import EntryPointMapping
+from runner.concurrent_dispatch import ConcurrentDispatcher, Request
+from runner.handler_kinds import stateless
+
+
+class SlowMapping:
+    def __init__(self, parties=4):
+        self.calls = []
+        self.stateless_threads = set()
+        # Passed only when ``parties`` calls are running at the same time.
+        self.rendezvous = threading.Barrier(parties, timeout=5)
+
+    @stateless
+    def meet(self, value):
+        self.stateless_threads.add(threading.current_thread().name)
+        self.rendezvous.wait()
+        return value
+
+    def record(self, value):
+        self.calls.append(value)
+        return len(self.calls)
+
+    @stateless
+    def fail(self):
+        raise ValueError("boom")
+
+
+def test_responses_come_back_in_request_order():
+    requests = [
+        Request(id="1", method="enqueue", params=[{"provider": "id_verification", "user_id": 1, "timestamp": "2025-10-20 12:00:00"}]),
+        Request(id="2", method="sum", params=[1, 2]),
+        Request(id="3", method="hello", params=["James"]),
+        Request(id="4", method="size"),
+        Request(id="5", method="dequeue"),
+        Request(id="6", method="size"),
+    ]
+
+    with ConcurrentDispatcher(EntryPointMapping()) as dispatcher:
+        responses = list(dispatcher.process(requests))
+
+    assert [r.id for r in responses] == ["1", "2", "3", "4", "5", "6"]
+    assert [r.result for r in responses] == [1, 3, "Hello, James!", 1, {"provider": "id_verification", "user_id": 1}, 0]
+
+
+def test_stateless_requests_overlap_and_stateful_stay_serial():
+    mapping = SlowMapping(parties=4)
+    requests = [Request(id=str(i), method="meet", params=[i]) for i in range(4)]
+    requests += [Request(id=f"r{i}", method="record", params=[i]) for i in range(20)]
+
+    with ConcurrentDispatcher(mapping, max_workers=4) as dispatcher:
+        responses = list(dispatcher.process(requests))
+
+    # The four stateless calls could only return by meeting at the barrier.
+    assert [r.error for r in responses] == [None] * 24
+    assert [r.result for r in responses] == [0, 1, 2, 3, *range(1, 21)]
+    assert mapping.calls == list(range(20))
+    assert len(mapping.stateless_threads) == 4
+
+
+def test_errors_are_returned_in_place():
+    with ConcurrentDispatcher(SlowMapping()) as dispatcher:
+        responses = list(dispatcher.process([Request(id="1", method="fail"), Request(id="2", method="record", params=["x"])]))
+
+    assert isinstance(responses[0].error, ValueError)
+    assert responses[1].result == 1
+
+
+def test_unknown_methods_are_errors_in_place():
+    with ConcurrentDispatcher(SlowMapping()) as dispatcher:
+        responses = list(dispatcher.process([Request(id="1", method="missing"), Request(id="2", method="record", params=["x"])]))
+
+    assert isinstance(responses[0].error, AttributeError)
+    assert responses[1].result == 1
+
+
+def test_handler_blocks_for_runner_registrations():
+    with ConcurrentDispatcher(EntryPointMapping()) as dispatcher:
+        assert dispatcher.handler("sum")(2, 3) == 5
@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+
+from entry_point_mapping import EntryPointMapping
+from runner import credentials_config_file
+
+
+LIB_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "lib")
+
+
+def test_solutions_are_constructed_on_first_use():
+    mapping = EntryPointMapping()
+    assert "sum_solution" not in vars(mapping)
+
+    assert mapping.sum(1, 2) == 3
+    assert mapping.sum_solution is vars(mapping)["sum_solution"]
+    assert "hello_solution" not in vars(mapping)
+
+
+def test_stateful_solutions_persist_between_calls():
+    mapping = EntryPointMapping()
+
+    mapping.enqueue({"provider": "id_verification", "user_id": 1, "timestamp": "2025-10-20 12:00:00"})
+
+    assert mapping.size() == 1
+    assert mapping.dequeue() == {"provider": "id_verification", "user_id": 1}
+
+
+def test_importing_the_mapping_does_not_import_solutions():
+    script = "import sys, entry_point_mapping; print(sorted(m for m in sys.modules if m.startswith('solutions')))"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True, env={**os.environ, "PYTHONPATH": LIB_DIR})
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_credentials_config_is_parsed_once(monkeypatch):
+    calls = []
+
+    def fake_load_properties(filepath):
+        calls.append(filepath)
+        return {"tdl_hostname": "localhost"}
+
+    monkeypatch.setattr(credentials_config_file, "load_properties", fake_load_properties)
+    credentials_config_file.read_properties_file.cache_clear()
+    try:
+        assert credentials_config_file.read_from_config_file("tdl_hostname") == "localhost"
+        assert credentials_config_file.read_from_config_file_with_default("tdl_journey_id", "none") == "none"
+        assert len(calls) == 1
+    finally:
+        credentials_config_file.read_properties_file.cache_clear()
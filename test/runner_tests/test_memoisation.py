@@ -0,0 +1,75 @@
+import pytest
+
+from entry_point_mapping import EntryPointMapping
+from runner.handler_kinds import is_stateless
+from runner.memoisation import MemoisationRegistry, memoise
+
+
+def test_memoised_function_counts_hits_and_misses():
+    calls = []
+
+    @memoise(maxsize=2)
+    def render(rows, options):
+        calls.append(rows)
+        return [rows, dict(options)]
+
+    assert render(3, {"walls": ["#"]}) == [3, {"walls": ["#"]}]
+    assert render(3, {"walls": ["#"]}) == [3, {"walls": ["#"]}]
+    assert render(4, {"walls": ["#"]}) == [4, {"walls": ["#"]}]
+
+    assert calls == [3, 4]
+    assert render.stats() == {"hits": 1, "misses": 2, "size": 2, "hit_ratio": 1 / 3}
+
+
+def test_cached_results_are_not_shared_with_callers():
+    @memoise()
+    def build(n):
+        return list(range(n))
+
+    build(3).append("mutated")
+
+    assert build(3) == [0, 1, 2]
+
+
+def test_argument_types_are_part_of_the_key():
+    @memoise()
+    def describe(value):
+        return repr(value)
+
+    assert describe(1) == "1"
+    assert describe(True) == "True"
+    assert describe([1]) == "[1]"
+    assert describe((1,)) == "(1,)"
+
+
+def test_least_recently_used_results_are_evicted():
+    @memoise(maxsize=1)
+    def square(n):
+        return n * n
+
+    square(2)
+    square(3)
+    square(2)
+
+    assert square.stats()["misses"] == 3
+
+
+def test_registry_installs_only_enabled_handlers():
+    mapping = EntryPointMapping()
+    registry = MemoisationRegistry().enable("sum")
+    registry.install(mapping)
+
+    assert mapping.sum(1, 2) == 3
+    assert mapping.sum(1, 2) == 3
+    assert mapping.hello("James") == "Hello, James!"
+    assert registry.stats() == {"sum": {"hits": 1, "misses": 1, "size": 1, "hit_ratio": 0.5}}
+    assert is_stateless(mapping.sum)
+
+    registry.disable("sum").install(mapping)
+    assert "sum" not in vars(mapping)
+    assert registry.stats() == {}
+
+
+def test_registry_refuses_stateful_handlers():
+    with pytest.raises(ValueError):
+        MemoisationRegistry().enable("dequeue").install(EntryPointMapping())
@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from solutions.CHK.checkout_solution import CheckoutSolution
+from solutions.CHK.pricing import FreeItem, GroupOffer, MultiPrice, PriceList
+
+
+@pytest.mark.parametrize("skus, expected", [
+    ("", 0),
+    ("ABCD", 115),
+    ("AAA", 130),
+    ("AAAAAAAA", 330),
+    ("AAAAAAAAA", 380),
+    ("BEE", 80),
+    ("BBEE", 110),
+    ("FFFF", 30),
+    ("H" * 15, 125),
+    ("KK", 120),
+    ("MNNN", 120),
+    ("QQQRRR", 210),
+    ("UUUU", 120),
+    ("VVVVV", 220),
+    ("STX", 45),
+    ("STXYZ", 82),
+    ("SSSZ", 65),
+])
+def test_checkout(skus, expected):
+    assert CheckoutSolution().checkout(skus) == expected
+
+
+@pytest.mark.parametrize("skus", ["a", "A-B", "AB ", None, 123])
+def test_invalid_input_returns_minus_one(skus):
+    assert CheckoutSolution().checkout(skus) == -1
+
+
+def test_large_counts_match_unbounded_dynamic_programming():
+    price_list = PriceList(prices={"A": 50}, multi_prices=[MultiPrice("A", 3, 130), MultiPrice("A", 5, 200), MultiPrice("A", 7, 290)])
+    checkout = CheckoutSolution(price_list.compile()).checkout
+
+    deals = [(1, 50), (3, 130), (5, 200), (7, 290)]
+    best = [0] * 200
+    for count in range(1, 200):
+        best[count] = min(best[count - quantity] + price for quantity, price in deals if quantity <= count)
+
+    assert [checkout("A" * count) for count in range(200)] == best
+
+
+def test_group_offer_skips_bundles_that_cost_more():
+    price_list = PriceList(prices={"X": 20, "Y": 10}, group_offers=[GroupOffer(("X", "Y"), 3, 45)])
+    checkout = CheckoutSolution(price_list.compile()).checkout
+
+    assert checkout("XXXYYY") == 45 + 30
+    assert checkout("XXYY") == 45 + 10
+
+
+def test_offer_on_unknown_sku_is_rejected():
+    with pytest.raises(ValueError):
+        PriceList(prices={"A": 50}, free_items=[FreeItem("A", 2, "B")]).compile()
+
+
+def test_checkout_many_matches_checkout():
+    rng = random.Random(3)
+    baskets = ["".join(rng.choices("ABEFHKNQRSTUVXYZ", k=rng.randrange(40))) for _ in range(200)] + ["x"]
+    solution = CheckoutSolution()
+
+    assert solution.checkout_many(baskets) == [solution.checkout(skus) for skus in baskets]
+    assert solution.checkout_many(baskets)[-1] == -1
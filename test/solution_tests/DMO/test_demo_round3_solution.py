@@ -0,0 +1,72 @@
+from dataclasses import asdict
+
+import pytest
+
+from entry_point_mapping import EntryPointMapping
+from solutions.DMO.demo_round3_solution import DemoRound3Solution
+from solutions.DMO.inventory_item import InventoryItem
+
+
+def test_add_get_and_size():
+    solution = DemoRound3Solution()
+    solution.inventory_add(InventoryItem("A1", "Apple", 30), 2)
+    solution.inventory_add(InventoryItem("B1", "Banana", 20), 3)
+
+    assert solution.inventory_size() == 5
+    assert solution.inventory_get("A1") == InventoryItem("A1", "Apple", 30)
+    assert solution.inventory_get("C1") is None
+
+
+def test_adding_a_stocked_sku_adds_quantity_and_keeps_latest_record():
+    solution = DemoRound3Solution()
+    solution.inventory_add(InventoryItem("A1", "Apple", 30), 2)
+    solution.inventory_add(InventoryItem("A1", "Green apple", 35), 4)
+
+    assert solution.inventory_size() == 6
+    assert solution.inventory_get("A1") == InventoryItem("A1", "Green apple", 35)
+
+
+def test_fractional_prices_are_kept():
+    solution = DemoRound3Solution()
+    solution.inventory_add(InventoryItem("A1", "Apple", 0.35), 1)
+    solution.inventory_add(InventoryItem("B1", "Banana", 20), 1)
+
+    assert solution.inventory_get("A1").price == 0.35
+    assert type(solution.inventory_get("B1").price) is int
+
+
+def test_invalid_records_leave_the_inventory_unchanged():
+    solution = DemoRound3Solution()
+    solution.inventory_add(InventoryItem("A1", "Apple", 30), 1)
+
+    with pytest.raises(ValueError):
+        solution.inventory_add(InventoryItem("B1", "Banana", "20"), 1)
+    with pytest.raises(ValueError):
+        solution.inventory_add(InventoryItem("A1", "Green apple", 35), 1.5)
+
+    assert solution.inventory_get("B1") is None
+    assert solution.inventory_get("A1") == InventoryItem("A1", "Apple", 30)
+    assert solution.inventory_size() == 1
+
+
+def test_bulk_add_and_get():
+    solution = DemoRound3Solution()
+    solution.inventory_add_many((InventoryItem(f"SKU{n}", "Widget", n), n) for n in range(1_000))
+
+    assert solution.inventory_size() == sum(range(1_000))
+    items = solution.inventory_get_many(["SKU7", "missing", "SKU999"])
+    assert items == [InventoryItem("SKU7", "Widget", 7), None, InventoryItem("SKU999", "Widget", 999)]
+    assert items[0].name is items[2].name
+
+
+def test_items_are_slotted():
+    assert not hasattr(InventoryItem("A1", "Apple", 30), "__dict__")
+
+
+def test_entry_point_returns_plain_dicts():
+    mapping = EntryPointMapping()
+    mapping.inventory_add({"sku": "A1", "name": "Apple", "price": 30}, 1)
+
+    assert mapping.inventory_get("A1") == asdict(InventoryItem("A1", "Apple", 30))
+    assert mapping.inventory_get("B1") is None
+    assert mapping.inventory_size() == 1
@@ -0,0 +1,92 @@
+import csv
+
+from solutions.IWC.capacity_simulator import CapacitySimulator, PoissonArrivals, TraceArrivals, exponential, fixed
+from solutions.IWC.queue_solution_legacy import Queue, SchedulingMode, BANK_STATEMENTS_PROVIDER, COMPANIES_HOUSE_PROVIDER, CREDIT_CHECK_PROVIDER, ID_VERIFICATION_PROVIDER
+
+
+def _simulator(workers=2, seed=3, rate_per_hour=600, mean=2.0, **kwargs):
+    return CapacitySimulator(
+        arrivals=[PoissonArrivals(ID_VERIFICATION_PROVIDER.name, rate_per_hour=rate_per_hour, users=10_000)],
+        service_times={ID_VERIFICATION_PROVIDER.name: exponential(mean)},
+        workers=workers,
+        seed=seed,
+        **kwargs,
+    )
+
+
+def test_same_seed_gives_the_same_report():
+    assert _simulator(seed=5).run(hours=20) == _simulator(seed=5).run(hours=20)
+    assert _simulator(seed=5).run(hours=20) != _simulator(seed=6).run(hours=20)
+
+
+def test_throughput_and_utilisation_match_the_offered_load():
+    report = _simulator(workers=2, rate_per_hour=900, mean=2.0).run(hours=100)
+
+    # 900/h at 2 s each on two workers is a quarter of their capacity.
+    assert abs(report.throughput_per_hour - 900) / 900 < 0.05
+    assert abs(report.utilisation - 0.25) < 0.02
+    assert report.final_depth == 0
+    assert report.waits_by_provider[ID_VERIFICATION_PROVIDER.name].count == report.completed
+
+
+def test_overload_grows_the_queue():
+    report = _simulator(workers=1, rate_per_hour=2_400, mean=3.0, sample_interval=60.0).run(hours=0.25)
+
+    assert report.utilisation > 0.95
+    assert report.final_depth > 200
+    assert report.depth == sorted(report.depth)
+
+
+def test_credit_check_dependency_and_deprioritised_tier_are_reported():
+    report = CapacitySimulator(
+        arrivals=[
+            PoissonArrivals(CREDIT_CHECK_PROVIDER.name, rate_per_hour=120, users=1_000),
+            PoissonArrivals(BANK_STATEMENTS_PROVIDER.name, rate_per_hour=120, users=1_000, user_offset=1_000),
+        ],
+        service_times={BANK_STATEMENTS_PROVIDER.name: fixed(20.0)},
+        workers=1,
+        seed=1,
+        default_service_time=fixed(1.0),
+    ).run(hours=50)
+
+    assert set(report.waits_by_provider) == {BANK_STATEMENTS_PROVIDER.name, COMPANIES_HOUSE_PROVIDER.name, CREDIT_CHECK_PROVIDER.name}
+    assert report.completed > report.arrivals
+    assert list(report.waits_by_tier) == ["normal", "normal (deprioritised)"]
+    assert report.waits_by_tier["normal (deprioritised)"].count == report.waits_by_provider[BANK_STATEMENTS_PROVIDER.name].count
+
+
+def test_trace_arrivals_from_csv(tmp_path):
+    trace = tmp_path / "trace.csv"
+    with open(trace, "w", newline="") as trace_file:
+        writer = csv.writer(trace_file)
+        writer.writerow(["timestamp", "provider", "user_id"])
+        writer.writerow(["2026-01-17T19:30:10", ID_VERIFICATION_PROVIDER.name, 2])
+        writer.writerow(["2026-01-17T19:30:00", ID_VERIFICATION_PROVIDER.name, 1])
+        writer.writerow(["2026-01-17T19:30:00", BANK_STATEMENTS_PROVIDER.name, 1])
+
+    arrivals = TraceArrivals.from_csv(str(trace))
+    assert arrivals.rows[0] == (0.0, BANK_STATEMENTS_PROVIDER.name, 1)
+
+    report = CapacitySimulator([arrivals], {}, workers=1, default_service_time=fixed(30.0)).run(hours=1)
+
+    assert (report.arrivals, report.completed) == (3, 3)
+    # One worker serves them back to back, 30 s each: user 2 arrives at 10 s
+    # and starts at 60 s.
+    assert report.waits_by_provider[ID_VERIFICATION_PROVIDER.name].max == 50.0
+
+
+def test_queue_factory_selects_the_queue_under_test():
+    report = _simulator(queue_factory=lambda clock: Queue(scheduling=SchedulingMode.FAIR_SHARE, clock=clock)).run(hours=10)
+
+    assert report.completed == report.arrivals
+
+
+def test_tiers_follow_the_queue_rule_not_the_wait():
+    # bank_statements waits 399 s behind a long id_verification call, but no
+    # newer submission arrives, so the queue still holds it back as
+    # deprioritised when it is dispatched.
+    arrivals = TraceArrivals([(0.0, ID_VERIFICATION_PROVIDER.name, 1), (1.0, BANK_STATEMENTS_PROVIDER.name, 2)])
+    report = CapacitySimulator([arrivals], {ID_VERIFICATION_PROVIDER.name: fixed(400.0)}, workers=1, default_service_time=fixed(1.0)).run(hours=1)
+
+    assert report.waits_by_provider[BANK_STATEMENTS_PROVIDER.name].max == 399.0
+    assert report.waits_by_tier["normal (deprioritised)"].count == 1
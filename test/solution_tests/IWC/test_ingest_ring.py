@@ -0,0 +1,122 @@
+import multiprocessing
+from datetime import datetime, timedelta
+
+import pytest
+
+from solutions.IWC.ingest_ring import IngestRing, serve_ingest
+from solutions.IWC.queue_solution_legacy import Queue, BANK_STATEMENTS_PROVIDER, COMPANIES_HOUSE_PROVIDER, CREDIT_CHECK_PROVIDER, Priority
+from solutions.IWC.task_codec import TaskCodec
+from solutions.IWC.task_spill import SpillFile
+from solutions.IWC.task_types import TaskSubmission
+
+
+datetime1 = datetime(2026, 1, 17, 19, 30)
+
+
+@pytest.fixture
+def ring():
+    ring = IngestRing.create(capacity=4)
+    yield ring
+    ring.close()
+
+
+def _produce(ring, user_ids):
+    for user_id in user_ids:
+        ring.put(TaskSubmission(provider=COMPANIES_HOUSE_PROVIDER.name, user_id=user_id, timestamp=datetime1), timeout=None)
+
+
+def test_round_trip_preserves_task_fields(ring):
+    task = TaskSubmission(provider=CREDIT_CHECK_PROVIDER.name, user_id=123, timestamp="2025-10-20 12:05:00", metadata={ "priority": Priority.HIGH })
+
+    assert ring.try_put(task)
+    [decoded] = ring.drain()
+
+    assert decoded.provider == CREDIT_CHECK_PROVIDER.name
+    assert decoded.user_id == 123
+    assert decoded.timestamp == datetime(2025, 10, 20, 12, 5)
+    assert decoded.metadata == { "priority": Priority.HIGH }
+
+
+def test_full_ring_signals_backpressure(ring):
+    for user_id in range(4):
+        assert ring.try_put(TaskSubmission(provider=BANK_STATEMENTS_PROVIDER.name, user_id=user_id, timestamp=datetime1))
+
+    assert ring.try_put(TaskSubmission(provider=BANK_STATEMENTS_PROVIDER.name, user_id=5, timestamp=datetime1)) == False
+    assert ring.put(TaskSubmission(provider=BANK_STATEMENTS_PROVIDER.name, user_id=5, timestamp=datetime1), timeout=0.01) == False
+    assert ring.rejected == 2
+    assert ring.size == 4
+
+
+def test_drain_wraps_around_in_batches(ring):
+    for batch in range(3):
+        for user_id in range(3):
+            assert ring.try_put(TaskSubmission(provider=BANK_STATEMENTS_PROVIDER.name, user_id=batch * 10 + user_id, timestamp=datetime1))
+        assert [t.user_id for t in ring.drain(max_batch=2)] == [batch * 10, batch * 10 + 1]
+        assert [t.user_id for t in ring.drain()] == [batch * 10 + 2]
+
+    assert ring.size == 0
+
+
+def test_drain_into_queue_applies_dependencies(ring):
+    queue = Queue()
+    ring.try_put(TaskSubmission(provider=CREDIT_CHECK_PROVIDER.name, user_id=123, timestamp=datetime1))
+
+    assert ring.drain_into(queue) == 1
+    assert queue.size == 2
+    assert queue.dequeue().provider == COMPANIES_HOUSE_PROVIDER.name
+
+
+def test_scheduler_drains_records_from_producer_processes(ring):
+    queue = Queue()
+    stop_event = multiprocessing.Event()
+    producers = [
+        multiprocessing.Process(target=_produce, args=(ring, range(offset, offset + 20)))
+        for offset in (0, 100)
+    ]
+    for producer in producers:
+        producer.start()
+
+    for producer in producers:
+        while producer.is_alive():
+            ring.drain_into(queue)
+        producer.join()
+    stop_event.set()
+    serve_ingest(ring, queue, stop_event)
+
+    assert queue.size == 40
+
+
+def test_metadata_is_read_with_the_queue_rules(ring):
+    for user_id, priority in enumerate(["high", None, 1]):
+        assert ring.try_put(TaskSubmission(
+            provider=BANK_STATEMENTS_PROVIDER.name,
+            user_id=user_id,
+            timestamp=datetime1,
+            metadata={"priority": priority, "complexity_weighting": 1.5},
+        ))
+
+    decoded = ring.drain()
+
+    assert [task.metadata["priority"] for task in decoded] == [Priority.NORMAL, Priority.NORMAL, Priority.HIGH]
+    assert [task.metadata["complexity_weighting"] for task in decoded] == [1.5, 1.5, 1.5]
+
+
+def test_non_numeric_complexity_is_rejected_on_every_path(ring):
+    task = TaskSubmission(provider=BANK_STATEMENTS_PROVIDER.name, user_id=1, timestamp=datetime1, metadata={"complexity_weighting": "2"})
+
+    with pytest.raises(ValueError):
+        ring.try_put(task)
+    with pytest.raises(ValueError):
+        Queue().enqueue(task)
+
+
+def test_retry_fields_survive_the_ring_and_the_spill_file(ring):
+    retried = TaskSubmission(provider=BANK_STATEMENTS_PROVIDER.name, user_id=1, timestamp=datetime1, not_before=datetime1 + timedelta(seconds=30), attempt=3)
+    fresh = TaskSubmission(provider=BANK_STATEMENTS_PROVIDER.name, user_id=2, timestamp=datetime1)
+    spill_file = SpillFile(TaskCodec([BANK_STATEMENTS_PROVIDER.name]))
+
+    assert ring.try_put(retried) and ring.try_put(fresh)
+    via_spill_file = [spill_file.read(spill_file.write(task)) for task in ring.drain()]
+    spill_file.close()
+
+    assert [(task.not_before, task.attempt) for task in via_spill_file] == [(datetime1 + timedelta(seconds=30), 3), (None, 0)]
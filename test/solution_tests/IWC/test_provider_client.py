@@ -0,0 +1,64 @@
+import threading
+
+import pytest
+
+from solutions.IWC.provider_client import ProviderClient, ProviderClientError
+from solutions.IWC.provider_stub_server import ProviderStubServer, StubBehaviour
+from solutions.IWC.queue_solution_legacy import Queue, BANK_STATEMENTS_PROVIDER, COMPANIES_HOUSE_PROVIDER, CREDIT_CHECK_PROVIDER, ID_VERIFICATION_PROVIDER
+from solutions.IWC.task_types import TaskDispatch
+
+
+@pytest.fixture
+def stub():
+    behaviours = {
+        BANK_STATEMENTS_PROVIDER.name: StubBehaviour(),
+        COMPANIES_HOUSE_PROVIDER.name: StubBehaviour(latency=0.05),
+        CREDIT_CHECK_PROVIDER.name: StubBehaviour(error_rate=1.0),
+        ID_VERIFICATION_PROVIDER.name: StubBehaviour(latency=0.5),
+    }
+    with ProviderStubServer(behaviours, seed=1) as server:
+        yield server
+
+
+def test_connections_are_reused_across_calls(stub):
+    with ProviderClient(base_urls=stub.base_urls) as client:
+        responses = [client.fetch(TaskDispatch(provider=BANK_STATEMENTS_PROVIDER.name, user_id=user_id)) for user_id in range(10)]
+
+        assert all(response.ok for response in responses)
+        assert client.connections_opened(BANK_STATEMENTS_PROVIDER.name) == 1
+    assert stub.connections_accepted == 1
+
+
+def test_in_flight_requests_are_bounded_per_provider(stub):
+    with ProviderClient(base_urls=stub.base_urls, max_in_flight=2) as client:
+        threads = [
+            threading.Thread(target=client.fetch, args=(TaskDispatch(provider=COMPANIES_HOUSE_PROVIDER.name, user_id=user_id),))
+            for user_id in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert client.connections_opened(COMPANIES_HOUSE_PROVIDER.name) == 2
+
+
+def test_completions_feed_queue_instrumentation(stub):
+    queue = Queue()
+    with ProviderClient(base_urls=stub.base_urls, on_complete=queue.record_completion) as client:
+        assert client.fetch(TaskDispatch(provider=CREDIT_CHECK_PROVIDER.name, user_id=1)).status == 503
+        client.fetch(TaskDispatch(provider=COMPANIES_HOUSE_PROVIDER.name, user_id=1))
+
+    providers = queue.stats()["providers"]
+    assert providers[CREDIT_CHECK_PROVIDER.name]["failed"] == 1
+    assert providers[COMPANIES_HOUSE_PROVIDER.name]["completed"] == 1
+    assert providers[COMPANIES_HOUSE_PROVIDER.name]["mean_latency"] >= 0.05
+
+
+def test_request_timeout_is_reported_as_failure(stub):
+    queue = Queue()
+    with ProviderClient(base_urls=stub.base_urls, timeout=0.1, on_complete=queue.record_completion) as client:
+        with pytest.raises(ProviderClientError):
+            client.fetch(TaskDispatch(provider=ID_VERIFICATION_PROVIDER.name, user_id=1))
+
+    assert queue.stats()["providers"][ID_VERIFICATION_PROVIDER.name]["failed"] == 1
@@ -0,0 +1,104 @@
+import threading
+import time
+
+from datetime import datetime, timedelta
+from solutions.IWC.admission import OverflowPolicy, QueueLimits
+from solutions.IWC.queue_solution_legacy import Queue, BANK_STATEMENTS_PROVIDER, COMPANIES_HOUSE_PROVIDER, CREDIT_CHECK_PROVIDER, ID_VERIFICATION_PROVIDER
+from solutions.IWC.task_types import TaskDispatch, TaskSubmission
+
+
+datetime1 = datetime(2026, 1, 17, 19, 30)
+
+
+def _task(provider, user_id, minutes=0):
+    return TaskSubmission(provider=provider.name, user_id=user_id, timestamp=datetime1 + timedelta(minutes=minutes))
+
+
+def test_unbounded_queue_accepts_everything():
+    queue = Queue()
+
+    outcome = queue.try_enqueue(_task(CREDIT_CHECK_PROVIDER, 123))
+
+    assert outcome.accepted
+    assert outcome.size == 2
+
+
+def test_rejects_when_max_tasks_reached():
+    queue = Queue(limits=QueueLimits(max_tasks=2))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+
+    outcome = queue.try_enqueue(_task(CREDIT_CHECK_PROVIDER, 2))
+
+    assert outcome.accepted == False
+    assert outcome.reason == "max_tasks"
+    assert queue.size == 1
+    assert queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 3)) == 2
+    assert queue.stats()["admission"]["rejected"] == 1
+
+
+def test_duplicates_do_not_count_against_limits():
+    queue = Queue(limits=QueueLimits(max_tasks=1))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+
+    assert queue.try_enqueue(_task(ID_VERIFICATION_PROVIDER, 1, minutes=1)).accepted
+
+
+def test_per_user_and_per_provider_limits():
+    queue = Queue(limits=QueueLimits(max_tasks_per_user=2, max_tasks_per_provider=1))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+
+    assert queue.try_enqueue(_task(CREDIT_CHECK_PROVIDER, 1)).reason == "max_tasks_per_user"
+    assert queue.try_enqueue(_task(ID_VERIFICATION_PROVIDER, 2)).reason == "max_tasks_per_provider"
+    assert queue.try_enqueue(_task(BANK_STATEMENTS_PROVIDER, 1)).accepted
+
+
+def test_byte_budget_is_released_on_dequeue():
+    queue = Queue(limits=QueueLimits(max_bytes=1))
+
+    assert queue.try_enqueue(_task(ID_VERIFICATION_PROVIDER, 1)).reason == "max_bytes"
+    assert queue.stats()["admission"]["bytes_used"] == 0
+
+    queue = Queue(limits=QueueLimits(max_bytes=10_000))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+    assert queue.stats()["admission"]["bytes_used"] > 0
+    queue.dequeue()
+    assert queue.stats()["admission"]["bytes_used"] == 0
+
+
+def test_sheds_newest_deprioritised_tasks_first():
+    queue = Queue(limits=QueueLimits(max_tasks=3, policy=OverflowPolicy.SHED_DEPRIORITISED))
+    queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, 1))
+    queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, 2, minutes=1))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 3))
+
+    outcome = queue.try_enqueue(_task(CREDIT_CHECK_PROVIDER, 4))
+
+    assert outcome.accepted
+    assert outcome.shed == [TaskDispatch(provider=BANK_STATEMENTS_PROVIDER.name, user_id=2), TaskDispatch(provider=BANK_STATEMENTS_PROVIDER.name, user_id=1)]
+    assert queue.size == 3
+    assert queue.dequeue().provider == ID_VERIFICATION_PROVIDER.name
+
+
+def test_shedding_never_admits_a_deprioritised_task():
+    queue = Queue(limits=QueueLimits(max_tasks=1, policy=OverflowPolicy.SHED_DEPRIORITISED))
+    queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, 1))
+
+    outcome = queue.try_enqueue(_task(BANK_STATEMENTS_PROVIDER, 2))
+
+    assert outcome.accepted == False
+    assert outcome.shed == []
+
+
+def test_blocking_enqueue_waits_for_dequeue():
+    queue = Queue(limits=QueueLimits(max_tasks=1, policy=OverflowPolicy.BLOCK, block_timeout=5))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+
+    consumer = threading.Timer(0.05, queue.dequeue)
+    consumer.start()
+    started = time.monotonic()
+    outcome = queue.try_enqueue(_task(COMPANIES_HOUSE_PROVIDER, 2))
+    consumer.join()
+
+    assert outcome.accepted
+    assert time.monotonic() - started < 5
+    assert queue.try_enqueue(_task(ID_VERIFICATION_PROVIDER, 3), timeout=0.01).reason == "max_tasks"
@@ -0,0 +1,202 @@
+from datetime import datetime, timedelta
+from solutions.IWC.admission import OverflowPolicy, QueueLimits
+from solutions.IWC.circuit_breaker import BreakerPolicy, BreakerState, CircuitBreaker, ProviderCircuitBreakers
+from solutions.IWC.provider_client import ProviderClient
+from solutions.IWC.provider_stub_server import ProviderStubServer, StubBehaviour
+from solutions.IWC.queue_solution_legacy import Queue, SchedulingMode, BANK_STATEMENTS_PROVIDER, COMPANIES_HOUSE_PROVIDER, CREDIT_CHECK_PROVIDER, ID_VERIFICATION_PROVIDER
+from solutions.IWC.task_types import TaskDispatch, TaskSubmission
+from utils import FakeClock
+
+
+datetime1 = datetime(2026, 1, 17, 19, 30)
+
+
+def _task(provider, user_id, minutes=0):
+    return TaskSubmission(provider=provider.name, user_id=user_id, timestamp=datetime1 + timedelta(minutes=minutes))
+
+
+def _fail(queue, provider, times, user_id=0):
+    for _ in range(times):
+        queue.record_completion(TaskDispatch(provider=provider.name, user_id=user_id), latency=5.0, success=False)
+
+
+def _breakers(clock, threshold=3):
+    return ProviderCircuitBreakers(default_policy=BreakerPolicy(failure_threshold=threshold, reset_timeout=30.0), clock=clock)
+
+
+def test_breaker_opens_half_opens_and_closes():
+    clock = FakeClock()
+    breaker = CircuitBreaker(BreakerPolicy(failure_threshold=2, reset_timeout=10.0), clock)
+
+    breaker.record(False)
+    assert breaker.state is BreakerState.CLOSED
+    breaker.record(False)
+    assert breaker.state is BreakerState.OPEN
+
+    clock.now = 10.0
+    assert breaker.state is BreakerState.HALF_OPEN
+    assert breaker.try_acquire_probe()
+    assert not breaker.try_acquire_probe()
+
+    assert breaker.record(False) is BreakerState.OPEN
+    clock.now = 20.0
+    assert breaker.try_acquire_probe()
+    assert breaker.record(True) is BreakerState.CLOSED
+
+
+def test_open_breaker_parks_provider_tasks_and_healthy_ones_keep_flowing():
+    clock = FakeClock()
+    queue = Queue(circuit_breakers=_breakers(clock))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+    queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, 2))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 3, minutes=1))
+
+    _fail(queue, ID_VERIFICATION_PROVIDER, 3)
+
+    assert (queue.size, queue.ready_size, queue.parked_size) == (1, 1, 2)
+    assert queue.dequeue().provider == BANK_STATEMENTS_PROVIDER.name
+    assert queue.dequeue() is None
+    assert queue.age == 60
+
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 4, minutes=2))
+    assert queue.parked_size == 3
+
+
+def test_dependents_are_parked_with_their_prerequisite():
+    clock = FakeClock()
+    queue = Queue(circuit_breakers=_breakers(clock))
+    queue.enqueue(_task(CREDIT_CHECK_PROVIDER, 1))
+
+    _fail(queue, COMPANIES_HOUSE_PROVIDER, 3)
+    queue.enqueue(_task(CREDIT_CHECK_PROVIDER, 2))
+
+    assert queue.parked_size == 4
+    assert queue.dequeue() is None
+
+
+def test_half_open_releases_one_probe_and_success_releases_the_rest():
+    clock = FakeClock()
+    queue = Queue(circuit_breakers=_breakers(clock))
+    for user_id in range(3):
+        queue.enqueue(_task(CREDIT_CHECK_PROVIDER, user_id, minutes=user_id))
+    _fail(queue, COMPANIES_HOUSE_PROVIDER, 3)
+
+    clock.now = 30.0
+    probe = queue.dequeue()
+    assert probe == TaskDispatch(provider=COMPANIES_HOUSE_PROVIDER.name, user_id=0)
+    assert queue.dequeue() is None
+
+    queue.record_completion(probe, latency=0.1, success=True)
+
+    assert queue.parked_size == 0
+    dispatched = [queue.dequeue() for _ in range(queue.size)]
+    assert dispatched[0] == TaskDispatch(provider=CREDIT_CHECK_PROVIDER.name, user_id=0)
+    assert len(dispatched) == 5
+
+
+def test_failed_probe_reopens_the_breaker():
+    clock = FakeClock()
+    queue = Queue(circuit_breakers=_breakers(clock))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 2))
+    _fail(queue, ID_VERIFICATION_PROVIDER, 3)
+
+    clock.now = 30.0
+    probe = queue.dequeue()
+    queue.record_completion(probe, latency=5.0, success=False)
+
+    clock.now = 45.0
+    assert queue.dequeue() is None
+    assert queue.stats()["circuit_breakers"][ID_VERIFICATION_PROVIDER.name]["times_opened"] == 2
+
+
+def test_purging_the_probe_frees_its_slot():
+    clock = FakeClock()
+    queue = Queue(circuit_breakers=_breakers(clock))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+    _fail(queue, ID_VERIFICATION_PROVIDER, 3)
+
+    clock.now = 30.0
+    assert queue.dequeue().user_id == 1
+    queue.purge()
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 2))
+
+    assert queue.dequeue() == TaskDispatch(provider=ID_VERIFICATION_PROVIDER.name, user_id=2)
+    assert queue.parked_size == 0
+
+
+def test_shedding_the_probe_frees_its_slot():
+    clock = FakeClock()
+    queue = Queue(
+        circuit_breakers=_breakers(clock),
+        limits=QueueLimits(max_tasks=2, policy=OverflowPolicy.SHED_DEPRIORITISED),
+    )
+    queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, 1))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 2))
+    _fail(queue, BANK_STATEMENTS_PROVIDER, 3)
+
+    # The bank_statements probe is let through but waits behind user 2.
+    clock.now = 30.0
+    assert queue.dequeue().user_id == 2
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 3))
+    outcome = queue.try_enqueue(_task(ID_VERIFICATION_PROVIDER, 4))
+    assert outcome.shed == [TaskDispatch(provider=BANK_STATEMENTS_PROVIDER.name, user_id=1)]
+    assert [queue.dequeue().user_id for _ in range(2)] == [3, 4]
+
+    queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, 5))
+    assert queue.dequeue() == TaskDispatch(provider=BANK_STATEMENTS_PROVIDER.name, user_id=5)
+
+
+def test_lost_probe_gives_up_its_slot_after_probe_timeout():
+    clock = FakeClock()
+    queue = Queue(circuit_breakers=ProviderCircuitBreakers(
+        default_policy=BreakerPolicy(failure_threshold=3, reset_timeout=30.0, probe_timeout=60.0),
+        clock=clock,
+    ))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 2, minutes=1))
+    _fail(queue, ID_VERIFICATION_PROVIDER, 3)
+
+    clock.now = 30.0
+    assert queue.dequeue().user_id == 1
+    clock.now = 89.0
+    assert queue.dequeue() is None
+    clock.now = 90.0
+    assert queue.dequeue().user_id == 2
+
+
+def test_parking_works_with_fair_share_scheduling():
+    clock = FakeClock()
+    queue = Queue(scheduling=SchedulingMode.FAIR_SHARE, circuit_breakers=_breakers(clock))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+    queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, 1))
+    _fail(queue, ID_VERIFICATION_PROVIDER, 3)
+
+    assert queue.dequeue().provider == BANK_STATEMENTS_PROVIDER.name
+    clock.now = 30.0
+    probe = queue.dequeue()
+    assert probe.provider == ID_VERIFICATION_PROVIDER.name
+    assert queue.size == 0
+
+
+def test_breaker_fed_by_failing_stub_provider():
+    clock = FakeClock()
+    queue = Queue(circuit_breakers=_breakers(clock))
+    for user_id in range(10):
+        queue.enqueue(_task(ID_VERIFICATION_PROVIDER, user_id, minutes=user_id))
+        queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, user_id, minutes=user_id))
+
+    behaviours = {
+        BANK_STATEMENTS_PROVIDER.name: StubBehaviour(),
+        ID_VERIFICATION_PROVIDER.name: StubBehaviour(error_rate=1.0),
+    }
+    with ProviderStubServer(behaviours, seed=1) as stub:
+        with ProviderClient(base_urls=stub.base_urls, on_complete=queue.record_completion) as client:
+            dispatched = []
+            while (task := queue.dequeue()) is not None:
+                dispatched.append(task.provider)
+                client.fetch(task)
+
+    assert dispatched.count(BANK_STATEMENTS_PROVIDER.name) == 10
+    assert dispatched.count(ID_VERIFICATION_PROVIDER.name) == 3
+    assert queue.parked_size == 7
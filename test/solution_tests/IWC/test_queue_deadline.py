@@ -0,0 +1,78 @@
+import pytest
+from datetime import datetime, timedelta
+from solutions.IWC.queue_solution_legacy import Queue, SchedulingMode, BANK_STATEMENTS_PROVIDER, COMPANIES_HOUSE_PROVIDER, CREDIT_CHECK_PROVIDER, ID_VERIFICATION_PROVIDER, Priority
+from solutions.IWC.task_types import TaskSubmission
+from utils import FakeClock
+
+
+datetime1 = datetime(2026, 1, 17, 19, 30)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock(datetime1)
+
+
+@pytest.fixture
+def queue(clock):
+    return Queue(scheduling=SchedulingMode.DEADLINE, clock=clock, deadline_at_risk_window=timedelta(minutes=5))
+
+
+def test_earliest_deadline_first_within_a_tier(queue):
+    queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=123, timestamp=datetime1, metadata={ "deadline": datetime1 + timedelta(hours=2) }))
+    queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=234, timestamp=datetime1, metadata={ "deadline": datetime1 + timedelta(hours=1) }))
+    queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=345, timestamp=datetime1 - timedelta(minutes=1)))
+
+    assert [queue.dequeue().user_id for _ in range(3)] == [234, 123, 345]
+
+
+def test_priority_tiers_win_until_deadline_is_at_risk(queue, clock):
+    queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=123, timestamp=datetime1, metadata={ "deadline": datetime1 + timedelta(minutes=30) }))
+    queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=234, timestamp=datetime1, metadata={ "priority": Priority.HIGH }))
+    queue.enqueue(TaskSubmission(provider=BANK_STATEMENTS_PROVIDER.name, user_id=234, timestamp=datetime1, metadata={ "priority": Priority.HIGH }))
+
+    assert queue.dequeue().user_id == 234
+
+    clock.now = datetime1 + timedelta(minutes=26)
+    assert queue.stats()["deadlines_at_risk"] == 1
+    assert queue.dequeue().user_id == 123
+    assert queue.stats()["deadlines_promoted"] == 1
+
+
+def test_missed_deadlines_are_counted(queue, clock):
+    queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=123, timestamp=datetime1, metadata={ "deadline": "2026-01-17 19:40:00" }))
+    clock.now = datetime1 + timedelta(minutes=15)
+
+    assert queue.dequeue().user_id == 123
+    assert queue.stats()["deadlines_missed"] == 1
+
+
+def test_dependencies_inherit_the_deadline(queue):
+    queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=123, timestamp=datetime1 - timedelta(minutes=1)))
+    queue.enqueue(TaskSubmission(provider=CREDIT_CHECK_PROVIDER.name, user_id=234, timestamp=datetime1, metadata={ "deadline": datetime1 + timedelta(hours=1) }))
+
+    assert queue.dequeue().provider == COMPANIES_HOUSE_PROVIDER.name
+    assert queue.dequeue().provider == CREDIT_CHECK_PROVIDER.name
+
+
+def test_duplicate_keeps_the_earliest_deadline(queue, clock):
+    queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=123, timestamp=datetime1, metadata={ "deadline": datetime1 + timedelta(minutes=3) }))
+    queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=123, timestamp=datetime1, metadata={ "deadline": datetime1 + timedelta(hours=3) }))
+
+    assert queue.size == 1
+    assert queue.stats()["deadlines_at_risk"] == 1
+    assert queue.dequeue().user_id == 123
+    assert queue.dequeue() is None
+
+
+def test_age_follows_dispatch_out_of_submission_order(queue):
+    for user_id, (minutes_old, deadline_hours) in enumerate([(30, 3), (0, 1), (20, 2), (10, 4)]):
+        queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=user_id, timestamp=datetime1 - timedelta(minutes=minutes_old), metadata={ "deadline": datetime1 + timedelta(hours=deadline_hours) }))
+
+    ages = []
+    while queue.size:
+        queue.dequeue()
+        ages.append(queue.age)
+
+    # Dispatched newest, then middle, then oldest, leaving the one 10 minutes old.
+    assert ages == [20 * 60, 20 * 60, 0, 0]
@@ -0,0 +1,181 @@
+import random
+
+import pytest
+
+from datetime import datetime, timedelta
+from solutions.IWC.admission import OverflowPolicy, QueueLimits
+from solutions.IWC.queue_solution_legacy import Queue, BANK_STATEMENTS_PROVIDER, CREDIT_CHECK_PROVIDER, ID_VERIFICATION_PROVIDER
+from solutions.IWC.retry_policy import RetryPolicy
+from solutions.IWC.task_types import TaskDispatch, TaskSubmission
+from utils import FakeClock
+
+
+datetime1 = datetime(2026, 1, 17, 19, 30)
+
+
+def _task(provider, user_id, seconds=0, not_before=None):
+    return TaskSubmission(
+        provider=provider.name,
+        user_id=user_id,
+        timestamp=datetime1 + timedelta(seconds=seconds),
+        not_before=None if not_before is None else datetime1 + timedelta(seconds=not_before),
+    )
+
+
+def test_delayed_task_is_hidden_until_due():
+    queue = Queue()
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+    outcome = queue.try_enqueue(_task(ID_VERIFICATION_PROVIDER, 2, not_before=30))
+
+    assert outcome.reason == "delayed"
+    assert (queue.size, queue.ready_size, queue.delayed_size) == (1, 1, 1)
+    assert queue.dequeue().user_id == 1
+    assert queue.dequeue() is None
+
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 3, seconds=40))
+    assert queue.dequeue().user_id == 2
+    assert queue.delayed_size == 0
+
+
+def test_due_tasks_stay_due_when_shedding_moves_the_queue_time_back():
+    queue = Queue(limits=QueueLimits(max_tasks=2, policy=OverflowPolicy.SHED_DEPRIORITISED))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 2, not_before=150))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 3, not_before=160))
+    queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, 4, seconds=200))
+
+    # Promoting user 2 sheds user 4's bank_statements task, the newest one.
+    assert queue.dequeue().user_id == 1
+    assert queue.delayed_size == 1
+    assert queue.stats()["admission"]["shed"] == 1
+
+
+def test_delayed_tasks_become_ready_in_not_before_order():
+    clock = FakeClock(datetime1)
+    queue = Queue(clock=clock)
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1, not_before=20))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 2, not_before=10))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 3, not_before=30))
+
+    clock.advance(15)
+    assert queue.dequeue().user_id == 2
+    assert queue.dequeue() is None
+
+    clock.advance(30)
+    assert [queue.dequeue().user_id for _ in range(2)] == [1, 3]
+
+
+def test_size_only_counts_tasks_a_worker_can_dequeue():
+    clock = FakeClock(datetime1)
+    queue = Queue(clock=clock)
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1, not_before=10))
+    assert queue.size == 0
+
+    clock.advance(10)
+    assert queue.size == 1
+    assert queue.dequeue().user_id == 1
+
+
+def test_delayed_task_brings_its_dependencies_when_due():
+    clock = FakeClock(datetime1)
+    queue = Queue(clock=clock)
+    queue.enqueue(_task(CREDIT_CHECK_PROVIDER, 1, not_before=5))
+    assert queue.delayed_size == 1
+
+    clock.advance(5)
+    assert queue.dequeue().provider == "companies_house"
+    assert queue.size == 1
+
+
+def test_age_only_covers_ready_tasks():
+    queue = Queue()
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 2, seconds=-600, not_before=60))
+
+    assert queue.age == 0
+    assert queue.stats()["delayed"] == 1
+
+
+def test_retry_backs_off_exponentially_per_provider():
+    clock = FakeClock(datetime1)
+    queue = Queue(
+        clock=clock,
+        retry_policies={"bank_statements": RetryPolicy(base_delay=timedelta(seconds=10), jitter=0)},
+    )
+    failed = TaskDispatch(provider=BANK_STATEMENTS_PROVIDER.name, user_id=1)
+
+    assert queue.retry(failed).reason == "delayed"
+    clock.advance(9)
+    assert queue.dequeue() is None
+    clock.advance(1)
+    assert queue.dequeue() == failed
+
+    queue.retry(failed)
+    clock.advance(19)
+    assert queue.dequeue() is None
+    clock.advance(1)
+    assert queue.dequeue() == failed
+
+
+def test_success_resets_attempts():
+    clock = FakeClock(datetime1)
+    queue = Queue(clock=clock, retry_policies={"id_verification": RetryPolicy(base_delay=timedelta(seconds=10), jitter=0)})
+    failed = TaskDispatch(provider=ID_VERIFICATION_PROVIDER.name, user_id=1)
+    queue.retry(failed)
+    clock.advance(10)
+    assert queue.dequeue() == failed
+
+    queue.record_completion(failed, latency=0.1, success=True)
+    queue.retry(failed)
+
+    # Back to the first attempt's 10 s delay, not the second's 20 s.
+    clock.advance(9)
+    assert queue.dequeue() is None
+    clock.advance(1)
+    assert queue.dequeue() == failed
+
+
+def test_retry_on_a_drained_queue_keeps_the_queue_time():
+    queue = Queue(retry_policies={"id_verification": RetryPolicy(base_delay=timedelta(seconds=10), jitter=0)})
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+    failed = queue.dequeue()
+
+    queue.retry(failed)
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 2, seconds=10))
+
+    # Due at the queue's own time, 10 s after the failure, not the wall clock's.
+    assert (queue.size, queue.age) == (2, 10)
+    assert queue.dequeue() == failed
+
+
+def test_retry_needs_a_timestamp_before_the_queue_has_a_time():
+    queue = Queue()
+    failed = TaskDispatch(provider=ID_VERIFICATION_PROVIDER.name, user_id=1)
+
+    with pytest.raises(ValueError):
+        queue.retry(failed)
+    assert queue.retry(failed, timestamp=datetime1).reason == "delayed"
+
+
+def test_retries_stop_after_max_attempts():
+    queue = Queue(retry_policies={"id_verification": RetryPolicy(max_attempts=2)})
+    failed = TaskDispatch(provider=ID_VERIFICATION_PROVIDER.name, user_id=1)
+
+    assert queue.retry(failed, timestamp=datetime1).accepted
+    assert queue.retry(failed, timestamp=datetime1).accepted
+    outcome = queue.retry(failed, timestamp=datetime1)
+
+    assert outcome.accepted == False
+    assert outcome.reason == "max_attempts"
+    assert queue.stats()["retries"]["exhausted"] == 1
+
+
+def test_jitter_stays_within_policy_bounds():
+    policy = RetryPolicy(base_delay=timedelta(seconds=4), max_delay=timedelta(seconds=30), jitter=0.5)
+    rng = random.Random(1)
+
+    delays = [policy.delay(attempt, rng) for attempt in range(1, 8)]
+
+    assert timedelta(seconds=2) <= delays[0] <= timedelta(seconds=4)
+    assert all(timedelta(seconds=15) <= delay <= timedelta(seconds=30) for delay in delays[3:])
+    assert len(set(delays)) == len(delays)
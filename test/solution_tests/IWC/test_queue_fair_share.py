@@ -0,0 +1,79 @@
+import random
+
+import pytest
+from datetime import datetime, timedelta
+from solutions.IWC.queue_solution_legacy import Queue, SchedulingMode, BANK_STATEMENTS_PROVIDER, COMPANIES_HOUSE_PROVIDER, CREDIT_CHECK_PROVIDER, ID_VERIFICATION_PROVIDER, Priority
+from solutions.IWC.task_types import TaskSubmission
+
+
+datetime1 = datetime(2026, 1, 17, 19, 30)
+
+
+@pytest.fixture
+def queue():
+    return Queue(scheduling=SchedulingMode.FAIR_SHARE)
+
+
+def _dequeue_users(queue):
+    users = []
+    while queue.size:
+        users.append(queue.dequeue().user_id)
+    return users
+
+
+def test_heavy_user_does_not_monopolise_dispatch(queue):
+    for provider in [CREDIT_CHECK_PROVIDER, BANK_STATEMENTS_PROVIDER, ID_VERIFICATION_PROVIDER]:
+        queue.enqueue(TaskSubmission(provider=provider.name, user_id=123, timestamp=datetime1))
+    queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=234, timestamp=datetime1 + timedelta(minutes=1)))
+
+    assert _dequeue_users(queue) == [123, 234, 123, 123, 123]
+
+
+def test_dependencies_stay_ahead_of_dependents(queue):
+    queue.enqueue(TaskSubmission(provider=CREDIT_CHECK_PROVIDER.name, user_id=123, timestamp=datetime1))
+
+    assert queue.dequeue().provider == COMPANIES_HOUSE_PROVIDER.name
+    assert queue.dequeue().provider == CREDIT_CHECK_PROVIDER.name
+
+
+def test_high_priority_users_get_weighted_share(queue):
+    for provider in [BANK_STATEMENTS_PROVIDER, ID_VERIFICATION_PROVIDER, COMPANIES_HOUSE_PROVIDER]:
+        queue.enqueue(TaskSubmission(provider=provider.name, user_id=123, timestamp=datetime1, metadata={ "priority": Priority.HIGH }))
+        queue.enqueue(TaskSubmission(provider=provider.name, user_id=234, timestamp=datetime1))
+
+    assert _dequeue_users(queue) == [123, 123, 234, 123, 234, 234]
+
+
+def test_duplicates_keep_their_place(queue):
+    queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=123, timestamp=datetime1))
+    queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=234, timestamp=datetime1))
+
+    assert queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=123, timestamp=datetime1)) == 2
+    assert _dequeue_users(queue) == [123, 234]
+
+
+def test_purge_resets_fair_share_state(queue):
+    queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=123, timestamp=datetime1))
+    queue.purge()
+    queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=234, timestamp=datetime1))
+
+    assert _dequeue_users(queue) == [234]
+
+
+def test_age_follows_the_remaining_tasks(queue):
+    rng = random.Random(4)
+    timestamps = {}
+
+    def expected_age():
+        return int((max(timestamps.values()) - min(timestamps.values())).total_seconds()) if timestamps else 0
+
+    for user_id in range(600):
+        timestamps[user_id] = datetime1 + timedelta(seconds=rng.randrange(3_600))
+        queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=user_id, timestamp=timestamps[user_id]))
+        if rng.random() < 0.4:
+            del timestamps[queue.dequeue().user_id]
+        assert queue.age == expected_age()
+
+    while queue.size:
+        del timestamps[queue.dequeue().user_id]
+        assert queue.age == expected_age()
@@ -0,0 +1,85 @@
+import glob
+import os
+import time
+
+from datetime import datetime, timedelta
+from solutions.IWC.queue_profiler import ProfilingPolicy, QueueProfiler
+from solutions.IWC.queue_solution_entrypoint import QueueSolutionEntrypoint
+from solutions.IWC.queue_solution_legacy import Queue, BANK_STATEMENTS_PROVIDER, CREDIT_CHECK_PROVIDER, ID_VERIFICATION_PROVIDER
+from solutions.IWC.task_types import TaskSubmission
+
+
+datetime1 = datetime(2026, 1, 17, 19, 30)
+
+
+def _task(provider, user_id, seconds=0):
+    return TaskSubmission(provider=provider.name, user_id=user_id, timestamp=datetime1 + timedelta(seconds=seconds))
+
+
+def _fill(queue, users):
+    for user_id in range(users):
+        queue.enqueue(_task(CREDIT_CHECK_PROVIDER, user_id, seconds=user_id))
+        queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, user_id, seconds=user_id))
+
+
+def test_profiling_is_switched_on_and_off_through_the_entrypoint(tmp_path):
+    entrypoint = QueueSolutionEntrypoint()
+    assert "profiling" not in entrypoint.stats()
+
+    output_dir = entrypoint.enable_profiling(ProfilingPolicy(output_dir=str(tmp_path), trace_allocations=True))
+    entrypoint.enqueue(_task(CREDIT_CHECK_PROVIDER, 1))
+    entrypoint.enqueue(_task(ID_VERIFICATION_PROVIDER, 2))
+    while entrypoint.dequeue() is not None:
+        pass
+    assert entrypoint.stats()["profiling"]["phases"]["dequeue"]["calls"] == 4
+
+    stats = entrypoint.disable_profiling()
+
+    assert output_dir == str(tmp_path)
+    phases = stats["phases"]
+    assert phases["enqueue"]["calls"] == 2
+    assert phases["collect_dependencies"]["calls"] == 2
+    assert phases["final_sort"]["calls"] == 3
+    assert phases["final_sort"]["peak_bytes"] > 0
+    assert "profiling" not in entrypoint.stats()
+    assert entrypoint.disable_profiling() is None
+
+    report = (tmp_path / "report-000001.txt").read_text()
+    assert "user_regrouping" in report
+    assert "allocation sites" in report
+    assert os.path.exists(tmp_path / "stacks-000001.folded")
+
+
+def test_sampled_stacks_are_prefixed_with_their_phase(tmp_path):
+    profiler = QueueProfiler(ProfilingPolicy(output_dir=str(tmp_path), sample_interval=0.001))
+    queue = Queue(profiler=profiler)
+    _fill(queue, 500)
+
+    profiler.start()
+    deadline = time.monotonic() + 0.5
+    while time.monotonic() < deadline and queue.size:
+        queue.dequeue()
+    profiler.stop()
+
+    lines = (tmp_path / "stacks-000001.folded").read_text().splitlines()
+    stacks = [line.rsplit(" ", 1)[0] for line in lines]
+    assert lines
+    assert all(stack.startswith(("dequeue;", "enqueue;")) for stack in stacks)
+    assert any(stack.startswith("dequeue;final_sort;") or stack.startswith("dequeue;metadata_rewrite;") for stack in stacks)
+    assert any("_select_legacy (queue_solution_legacy.py)" in stack for stack in stacks)
+    assert profiler.stats()["sampler_overhead"] < 0.1
+
+
+def test_output_files_roll(tmp_path):
+    profiler = QueueProfiler(ProfilingPolicy(output_dir=str(tmp_path), max_files=2))
+    profiler.start()
+    for _ in range(4):
+        profiler.flush()
+    profiler.stop()
+
+    assert sorted(os.path.basename(path) for path in glob.glob(str(tmp_path / "*"))) == [
+        "report-000004.txt",
+        "report-000005.txt",
+        "stacks-000004.folded",
+        "stacks-000005.folded",
+    ]
@@ -0,0 +1,151 @@
+import random
+
+import pytest
+from datetime import datetime, timedelta
+from solutions.IWC.admission import OverflowPolicy, QueueLimits
+from solutions.IWC.circuit_breaker import ProviderCircuitBreakers
+from solutions.IWC.queue_solution_legacy import Queue, SchedulingMode, BANK_STATEMENTS_PROVIDER, COMPANIES_HOUSE_PROVIDER, CREDIT_CHECK_PROVIDER, ID_VERIFICATION_PROVIDER, Priority
+from solutions.IWC.task_spill import TieringPolicy
+from solutions.IWC.task_types import TaskSubmission
+
+
+datetime1 = datetime(2026, 1, 17, 19, 30)
+
+
+def _task(provider, user_id, seconds=0, metadata=None):
+    return TaskSubmission(provider=provider.name, user_id=user_id, timestamp=datetime1 + timedelta(seconds=seconds), metadata=dict(metadata or {}))
+
+
+def _drain(queue):
+    order = []
+    while queue.size:
+        task = queue.dequeue()
+        order.append((task.user_id, task.provider))
+    return order
+
+
+@pytest.fixture
+def tiered_queue():
+    """Builds queues like ``Queue(**kwargs)`` and closes their spill files afterwards."""
+    queues = []
+
+    def make(**kwargs):
+        queues.append(Queue(**kwargs))
+        return queues[-1]
+
+    yield make
+    for queue in queues:
+        queue.close()
+
+
+def test_deprioritised_tasks_spill_once_resident_limit_is_reached(tiered_queue):
+    queue = tiered_queue(tiering=TieringPolicy(resident_limit=2))
+    for user_id in range(5):
+        queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, user_id, seconds=user_id))
+
+    tiering = queue.stats()["tiering"]
+    assert queue.size == 5
+    assert tiering["resident"] == 2
+    assert tiering["spilled"] == 3
+    assert queue.age == 4
+
+
+def test_other_providers_and_grouped_users_stay_resident(tiered_queue):
+    queue = tiered_queue(tiering=TieringPolicy(resident_limit=1))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 2))
+    queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, 2))
+
+    assert queue.stats()["tiering"]["spilled"] == 0
+
+
+def test_spilled_task_is_faulted_in_by_a_later_submission_for_the_same_user(tiered_queue):
+    queue = tiered_queue(tiering=TieringPolicy(resident_limit=1))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+    queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, 2, seconds=5))
+    assert queue.stats()["tiering"]["spilled"] == 1
+
+    assert queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, 2, seconds=10)) == 2
+    assert queue.stats()["tiering"]["spilled"] == 0
+    assert queue.age == 5
+
+
+def _random_submissions():
+    rng = random.Random(7)
+    providers = [BANK_STATEMENTS_PROVIDER] * 6 + [ID_VERIFICATION_PROVIDER, COMPANIES_HOUSE_PROVIDER, CREDIT_CHECK_PROVIDER]
+    return [
+        (rng.choice(providers), rng.randrange(40), second * 7, None)
+        for second in range(120)
+    ]
+
+
+def _explicit_high_bank_statements_submissions():
+    return [
+        *((ID_VERIFICATION_PROVIDER, user_id, user_id, None) for user_id in range(1, 5)),
+        (BANK_STATEMENTS_PROVIDER, 9, 10, { "priority": Priority.HIGH }),
+    ]
+
+
+@pytest.mark.parametrize("submissions, resident_limit, spills", [
+    (_random_submissions(), 8, True),
+    # A HIGH bank_statements task is next in line, so it stays resident.
+    (_explicit_high_bank_statements_submissions(), 2, False),
+])
+def test_dequeue_order_matches_untiered_queue(tiered_queue, submissions, resident_limit, spills):
+    plain = Queue()
+    tiered = tiered_queue(tiering=TieringPolicy(resident_limit=resident_limit, fault_in_batch=4))
+    for provider, user_id, seconds, metadata in submissions:
+        plain.enqueue(_task(provider, user_id, seconds, metadata))
+        tiered.enqueue(_task(provider, user_id, seconds, metadata))
+
+    assert (tiered.stats()["tiering"]["spilled_total"] > 0) == spills
+    assert _drain(tiered) == _drain(plain)
+    assert tiered.stats()["tiering"]["spilled"] == 0
+
+
+def test_spilled_tasks_are_faulted_in_before_reprioritisation(tiered_queue):
+    queue = tiered_queue(tiering=TieringPolicy(resident_limit=1, fault_in_margin=timedelta(seconds=60)))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+    queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, 2))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 3, seconds=250))
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 4, seconds=400))
+
+    assert queue.stats()["tiering"]["spilled"] == 1
+    assert queue.dequeue().provider == BANK_STATEMENTS_PROVIDER.name
+    assert queue.stats()["tiering"]["faulted_in"] == 1
+
+
+def test_shedding_evicts_spilled_tasks_without_faulting_them_in(tiered_queue):
+    queue = tiered_queue(
+        limits=QueueLimits(max_tasks=3, policy=OverflowPolicy.SHED_DEPRIORITISED),
+        tiering=TieringPolicy(resident_limit=1),
+    )
+    queue.enqueue(_task(ID_VERIFICATION_PROVIDER, 1))
+    queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, 2))
+    queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, 3, seconds=1))
+
+    outcome = queue.try_enqueue(_task(ID_VERIFICATION_PROVIDER, 4))
+
+    assert outcome.accepted
+    assert [(t.user_id, t.provider) for t in outcome.shed] == [(3, BANK_STATEMENTS_PROVIDER.name)]
+    assert queue.stats()["tiering"] == {"resident": 2, "spilled": 1, "spilled_total": 2, "faulted_in": 0}
+
+
+def test_purge_clears_spilled_tasks():
+    with Queue(tiering=TieringPolicy(resident_limit=0)) as queue:
+        queue.enqueue(_task(BANK_STATEMENTS_PROVIDER, 1))
+
+        queue.purge()
+
+        assert queue.size == 0
+        assert queue.dequeue() is None
+
+
+def test_tiering_requires_legacy_scheduling():
+    with pytest.raises(ValueError):
+        Queue(scheduling=SchedulingMode.FAIR_SHARE, tiering=TieringPolicy())
+
+
+def test_tiering_cannot_be_combined_with_circuit_breakers():
+    with pytest.raises(ValueError):
+        Queue(tiering=TieringPolicy(), circuit_breakers=ProviderCircuitBreakers())
@@ -0,0 +1,66 @@
+import pytest
+from datetime import datetime
+from solutions.IWC.queue_solution_legacy import Queue, COMPANIES_HOUSE_PROVIDER, CREDIT_CHECK_PROVIDER, ID_VERIFICATION_PROVIDER
+from solutions.IWC.result_cache import ProviderResultCache
+from solutions.IWC.task_types import TaskDispatch, TaskSubmission
+from utils import FakeClock
+
+
+datetime1 = datetime(2026, 1, 17, 19, 30)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return ProviderResultCache(ttl_by_provider={ CREDIT_CHECK_PROVIDER.name: 30 }, default_ttl=10, max_entries=2, clock=clock)
+
+
+@pytest.fixture
+def queue(cache):
+    return Queue(result_cache=cache)
+
+
+def test_entries_expire_after_provider_ttl(cache, clock):
+    cache.put(123, CREDIT_CHECK_PROVIDER.name, "credit")
+    cache.put(123, ID_VERIFICATION_PROVIDER.name, "idv")
+    clock.now = 15
+
+    assert cache.get(123, CREDIT_CHECK_PROVIDER.name) == "credit"
+    assert cache.get(123, ID_VERIFICATION_PROVIDER.name) is None
+    assert cache.stats() == { "size": 1, "hits": 1, "misses": 1, "evictions": 0, "expirations": 1 }
+
+
+def test_least_recently_used_entry_is_evicted(cache):
+    cache.put(1, CREDIT_CHECK_PROVIDER.name, "one")
+    cache.put(2, CREDIT_CHECK_PROVIDER.name, "two")
+    cache.get(1, CREDIT_CHECK_PROVIDER.name)
+    cache.put(3, CREDIT_CHECK_PROVIDER.name, "three")
+
+    assert cache.get(2, CREDIT_CHECK_PROVIDER.name) is None
+    assert cache.get(1, CREDIT_CHECK_PROVIDER.name) == "one"
+    assert cache.evictions == 1
+
+
+def test_enqueue_short_circuits_on_fresh_result(queue):
+    queue.record_result(TaskDispatch(provider=CREDIT_CHECK_PROVIDER.name, user_id=123), "credit")
+
+    assert queue.enqueue(TaskSubmission(provider=CREDIT_CHECK_PROVIDER.name, user_id=123, timestamp=datetime1)) == 0
+    assert queue.stats()["result_cache"]["hits"] == 1
+
+
+def test_enqueue_skips_dependency_with_fresh_result(queue):
+    queue.record_result(TaskDispatch(provider=COMPANIES_HOUSE_PROVIDER.name, user_id=123), "company")
+
+    assert queue.enqueue(TaskSubmission(provider=CREDIT_CHECK_PROVIDER.name, user_id=123, timestamp=datetime1)) == 1
+    assert queue.dequeue().provider == CREDIT_CHECK_PROVIDER.name
+
+
+def test_enqueue_resumes_after_result_expires(queue, clock):
+    queue.record_result(TaskDispatch(provider=ID_VERIFICATION_PROVIDER.name, user_id=123), "idv")
+    clock.now = 10
+
+    assert queue.enqueue(TaskSubmission(provider=ID_VERIFICATION_PROVIDER.name, user_id=123, timestamp=datetime1)) == 1
@@ -10,6 +10,19 @@ from solutions.IWC.task_types import TaskDispatch, TaskSubmission
 DEFAULT_SCENARIO_BASE = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
 
 
+class FakeClock:
+    """Hand-driven clock; ``now`` is seconds or a datetime, as the code under test expects."""
+
+    def __init__(self, now: float | datetime = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float | datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds) if isinstance(self.now, datetime) else seconds
+
+
 def iso_ts(*, base: datetime = DEFAULT_SCENARIO_BASE, delta_minutes: int = 0) -> str:
     return str(base + timedelta(minutes=delta_minutes))
 
@@ -71,4 +84,4 @@ def run_queue(actions: Iterable[dict[str, Any]]) -> None:
             )
 
 
-__all__ = ["iso_ts", "call_enqueue", "call_size", "call_dequeue", "run_queue"]
+__all__ = ["FakeClock", "iso_ts", "call_enqueue", "call_size", "call_dequeue", "run_queue"]